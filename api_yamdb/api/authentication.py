@@ -0,0 +1,110 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import router, transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+User = get_user_model()
+
+CACHE_PREFIX: str = "auth_user"
+
+# Поля пользователя, которые читают права доступа и сериализаторы,
+# в порядке полей модели (его ожидает Model.from_db); остальные поля
+# загружаются из БД при первом обращении.
+USER_FIELDS: tuple[str, ...] = (
+    "id",
+    "is_superuser",
+    "is_staff",
+    "is_active",
+    "email",
+    "username",
+    "role",
+)
+
+# Локальный кеш процесса: id пользователя -> (срок действия, значения полей)
+_local: dict = {}
+LOCAL_MAXSIZE: int = 1024
+
+
+def user_key(user_id) -> str:
+    return f"{CACHE_PREFIX}:{user_id}"
+
+
+def get_cached_fields(user_id) -> tuple | None:
+    """Значения USER_FIELDS из локального кеша или кеша Redis."""
+    now = time.monotonic()
+    entry = _local.get(user_id)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    values = cache.get(user_key(user_id))
+    if values is not None:
+        remember_local(user_id, values, now)
+    return values
+
+
+def remember_local(user_id, values, now=None) -> None:
+    timeout = settings.AUTH_USER_LOCAL_TIMEOUT
+    if timeout <= 0:
+        return
+    if len(_local) >= LOCAL_MAXSIZE:
+        _local.clear()
+    now = time.monotonic() if now is None else now
+    _local[user_id] = (now + timeout, values)
+
+
+def cache_user(user) -> None:
+    values = tuple(getattr(user, field) for field in USER_FIELDS)
+    cache.set(
+        user_key(user.pk), values, timeout=settings.AUTH_USER_CACHE_TIMEOUT
+    )
+    remember_local(user.pk, values)
+
+
+def invalidate_user(user_id) -> None:
+    """
+    Удаление пользователя из кеша аутентификации. Кеш Redis очищается
+    после фиксации транзакции, чтобы параллельный запрос не сохранил
+    в него старые значения; локальные кеши других процессов устаревают
+    не позже чем через AUTH_USER_LOCAL_TIMEOUT секунд.
+    """
+    _local.pop(user_id, None)
+    transaction.on_commit(lambda: cache.delete(user_key(user_id)))
+
+
+def clear_local_cache() -> None:
+    _local.clear()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    Аутентификация по JWT без запроса к таблице пользователей на каждый
+    запрос: поля пользователя берутся из локального кеша процесса
+    с коротким временем жизни, затем из кеша Redis и только при промахе
+    из БД. Кеш сбрасывается при сохранении и удалении пользователя
+    (смена роли через /users/ и /users/me/).
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # Проверка отзыва токена сравнивает хеш пароля из БД
+            return super().get_user(validated_token)
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            return super().get_user(validated_token)
+        values = get_cached_fields(user_id)
+        if values is None:
+            user = super().get_user(validated_token)
+            cache_user(user)
+            return user
+        user = User.from_db(router.db_for_read(User), USER_FIELDS, values)
+        if not user.is_active:
+            raise AuthenticationFailed(
+                _("User is inactive"), code="user_inactive"
+            )
+        return user
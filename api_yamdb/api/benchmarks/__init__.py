@@ -0,0 +1,12 @@
+"""
+Замеры производительности API внутри процесса.
+Запуск: `python manage.py benchmark <набор>`.
+"""
+
+# Наборы замеров: имя -> модуль с функцией run(**options)
+SUITES = {
+    "endpoints": "api.benchmarks.endpoints",
+    "renderers": "api.benchmarks.renderers",
+    "serializers": "api.benchmarks.serializers",
+    "email": "api.benchmarks.mail",
+}
@@ -0,0 +1,148 @@
+import math
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from api.tasks import send_confirm_code
+from api.utils import (
+    delete_confirm_code_from_cache,
+    generation_confirm_code,
+    save_confirm_code_in_cache,
+)
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Exists, OuterRef
+from django.test import Client, override_settings
+from reviews.models import Category, Comment, Genre, Review, Title
+
+from .runner import Scenario, measure
+
+User = get_user_model()
+
+API = "/api/v1"
+
+
+@contextmanager
+def local_delivery():
+    """Задачи Celery выполняются сразу, письма остаются в памяти."""
+    conf = send_confirm_code.app.conf
+    eager = conf.task_always_eager
+    conf.task_always_eager = True
+    try:
+        with override_settings(
+            EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend"
+        ):
+            yield
+    finally:
+        conf.task_always_eager = eager
+
+
+@contextmanager
+def without_throttling():
+    """Замеры повторяют запросы с одного адреса: ограничения отключены."""
+    rest_framework = {**settings.REST_FRAMEWORK, "DEFAULT_THROTTLE_RATES": {}}
+    with override_settings(REST_FRAMEWORK=rest_framework):
+        yield
+
+
+def relative(url: str) -> str:
+    """Путь со строкой запроса из абсолютной ссылки пагинации."""
+    parts = urlsplit(url)
+    return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+def get_scenarios(client) -> list[Scenario]:
+    """
+    Сценарии строятся по текущим данным: берутся самое популярное
+    произведение, отзыв с комментариями и существующие слаги.
+    """
+    title = Title.objects.order_by("-reviews_count", "id").first()
+    user = User.objects.exclude(email="").order_by("id").first()
+    if title is None or user is None:
+        raise ValueError(
+            "Нет данных для замеров, выполните команду generate_data."
+        )
+    review = (
+        Review.objects.filter(title=title)
+        .filter(Exists(Comment.objects.filter(review=OuterRef("pk"))))
+        .order_by("-pub_date", "-id")
+        .first()
+    ) or Review.objects.filter(title=title).order_by("-pub_date").first()
+    category = Category.objects.order_by("id").first()
+    genre = Genre.objects.order_by("id").first()
+    page_size = settings.REST_FRAMEWORK["PAGE_SIZE"]
+    last_page = max(math.ceil(Title.objects.count() / page_size), 1)
+    word = title.name.split()[0]
+
+    titles = f"{API}/titles/"
+    first_cursor_page = client.get(f"{titles}?pagination=cursor").json()
+    scenarios = [
+        Scenario("titles_list", titles),
+        Scenario("titles_deep_page", f"{titles}?page={last_page}"),
+        Scenario(
+            "titles_cursor",
+            relative(first_cursor_page["next"] or titles),
+        ),
+        Scenario("titles_filter_year", f"{titles}?year={title.year}"),
+        Scenario(
+            "titles_filter_category", f"{titles}?category={category.slug}"
+        ),
+        Scenario("titles_filter_genre", f"{titles}?genre={genre.slug}"),
+        Scenario("titles_search", f"{titles}?search={word}"),
+        Scenario("titles_trending", f"{titles}?ordering=trending"),
+        Scenario("title_detail", f"{titles}{title.id}/"),
+        Scenario("title_stats", f"{titles}{title.id}/stats/"),
+        Scenario(
+            "titles_list_authenticated",
+            titles,
+            headers={"Authorization": f"Bearer {user.get_token()['token']}"},
+        ),
+        Scenario("categories_list", f"{API}/categories/"),
+        Scenario("genres_list", f"{API}/genres/"),
+    ]
+    if review is not None:
+        reviews = f"{titles}{title.id}/reviews/"
+        comments = f"{reviews}{review.id}/comments/"
+        scenarios += [
+            Scenario("reviews_list", reviews),
+            Scenario("reviews_cursor", f"{reviews}?pagination=cursor"),
+            Scenario("review_detail", f"{reviews}{review.id}/"),
+            Scenario("comments_list", comments),
+        ]
+
+    def new_code():
+        save_confirm_code_in_cache(user.email, confirm_code)
+
+    def forget_code():
+        # Письмо не отправляется повторно, пока действует прежний код
+        delete_confirm_code_from_cache(user.email)
+
+    confirm_code = generation_confirm_code()
+    scenarios += [
+        Scenario(
+            "auth_send_code",
+            f"{API}/auth/send_confirm_code/",
+            method="post",
+            data={"email": user.email},
+            setup=forget_code,
+        ),
+        Scenario(
+            "auth_token",
+            f"{API}/auth/token/",
+            method="post",
+            data={"email": user.email, "confirmation_code": confirm_code},
+            setup=new_code,
+        ),
+    ]
+    return scenarios
+
+
+def run(iterations: int = 50, warmup: int = 1, only=None, **options):
+    """Замер основных эндпоинтов API через тестовый клиент."""
+    client = Client(SERVER_NAME="127.0.0.1")
+    results = []
+    with local_delivery(), without_throttling():
+        for scenario in get_scenarios(client):
+            if only and scenario.name not in only:
+                continue
+            results.append(measure(client, scenario, iterations, warmup))
+    return results
@@ -0,0 +1,126 @@
+import socketserver
+import threading
+import time
+from contextlib import contextmanager
+
+from api.mail import confirm_code_message, send_batch
+from django.test import override_settings
+
+from .runner import summary, timed
+
+# Писем в одном замере
+MESSAGES = 50
+# Задержка приветствия сервера: имитация TLS-рукопожатия
+HANDSHAKE_DELAY = 0.01
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """Минимальный диалог SMTP: письма принимаются и отбрасываются."""
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server
+        time.sleep(server.handshake_delay)
+        with server.lock:
+            server.connections += 1
+        self.reply("220 localhost")
+        while line := self.rfile.readline():
+            command = line[:4].upper()
+            if command == b"DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                with server.lock:
+                    server.messages += 1
+                self.reply("250 OK")
+            elif command == b"RCPT" and any(
+                address.encode() in line for address in server.reject
+            ):
+                self.reply("550 Mailbox unavailable")
+            elif command == b"QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+class LocalSMTPServer(socketserver.ThreadingTCPServer):
+    """
+    Локальная замена почтового сервера: считает соединения и принятые
+    письма, отклоняет получателей из `reject`.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, handshake_delay: float = 0, reject=()):
+        super().__init__(("127.0.0.1", 0), SMTPHandler)
+        self.handshake_delay = handshake_delay
+        self.reject = set(reject)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.messages = 0
+
+
+@contextmanager
+def local_smtp(handshake_delay: float = 0, reject=()):
+    """Запуск LocalSMTPServer и отправка писем Django через него."""
+    server = LocalSMTPServer(handshake_delay, reject)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with override_settings(
+            EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+            EMAIL_HOST="127.0.0.1",
+            EMAIL_PORT=server.server_address[1],
+            EMAIL_HOST_USER="",
+            EMAIL_HOST_PASSWORD="",
+            EMAIL_USE_SSL=False,
+            EMAIL_USE_TLS=False,
+        ):
+            yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def get_codes() -> list[tuple[str, str]]:
+    return [(f"user{i}@yamdb.fake", f"{i:06}") for i in range(MESSAGES)]
+
+
+def send_each(codes) -> None:
+    """Прежняя отправка: отдельное соединение на каждое письмо."""
+    for email, confirm_code in codes:
+        confirm_code_message(email, confirm_code).send()
+
+
+def run(iterations: int = 50, warmup: int = 1, only=None, **options):
+    """
+    Отправка MESSAGES писем с кодами через локальный SMTP-сервер:
+    по соединению на письмо и пачкой через одно соединение.
+    """
+    codes = get_codes()
+    scenarios = {"send_each": send_each, "send_batch": send_batch}
+    results = []
+    with local_smtp(HANDSHAKE_DELAY) as server:
+        for name, deliver in scenarios.items():
+            if only and name not in only:
+                continue
+            server.connections = server.messages = 0
+            result = summary(
+                timed(lambda: deliver(codes), iterations, warmup)
+            )
+            results.append(
+                {
+                    "name": name,
+                    "messages_per_s": round(
+                        len(codes) / result["p50_ms"] * 1000, 1
+                    ),
+                    "connections": server.connections,
+                    "messages": server.messages,
+                    **result,
+                }
+            )
+    return results
@@ -0,0 +1,92 @@
+import io
+
+from api.renderers import ORJSONParser, ORJSONRenderer
+from api.serializers.review_serializers import (
+    ReviewSerializer,
+    TitleReadSerializer,
+)
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from reviews.models import Review, Title
+
+from .runner import summary, timed
+
+RENDERERS = {"json": JSONRenderer(), "orjson": ORJSONRenderer()}
+PARSERS = {"json": JSONParser(), "orjson": ORJSONParser()}
+
+
+def page(results) -> dict:
+    """Данные в формате ответа с пагинацией."""
+    return {
+        "count": len(results),
+        "next": "http://127.0.0.1/api/v1/titles/?page=2",
+        "previous": None,
+        "results": results,
+    }
+
+
+def get_payloads() -> dict:
+    """Ответы списков произведений и отзывов на реальных данных."""
+    payloads = {}
+    title = Title.objects.order_by("-reviews_count", "id").first()
+    if title is None:
+        raise ValueError(
+            "Нет данных для замеров, выполните команду generate_data."
+        )
+    for size in (settings.REST_FRAMEWORK["PAGE_SIZE"], 100):
+        titles = (
+            Title.objects.select_related("category")
+            .prefetch_related("genre")
+            .order_by("name", "id")[:size]
+        )
+        reviews = (
+            Review.objects.filter(title=title)
+            .select_related("author")
+            .order_by("-pub_date", "-id")[:size]
+        )
+        payloads[f"titles_{size}"] = page(
+            TitleReadSerializer(titles, many=True).data
+        )
+        payloads[f"reviews_{size}"] = page(
+            ReviewSerializer(reviews, many=True).data
+        )
+    return payloads
+
+
+def run(iterations: int = 50, warmup: int = 1, only=None, **options):
+    """Сравнение рендереров и парсеров JSON на ответах API."""
+    results = []
+    for name, data in get_payloads().items():
+        if only and name not in only:
+            continue
+        expected = RENDERERS["json"].render(data)
+        for key, renderer in RENDERERS.items():
+            rendered = renderer.render(data)
+            results.append(
+                {
+                    "name": f"{name}_render_{key}",
+                    "bytes": len(rendered),
+                    "identical": rendered == expected,
+                    **summary(
+                        timed(
+                            lambda: renderer.render(data), iterations, warmup
+                        )
+                    ),
+                }
+            )
+        for key, parser in PARSERS.items():
+            results.append(
+                {
+                    "name": f"{name}_parse_{key}",
+                    "bytes": len(expected),
+                    **summary(
+                        timed(
+                            lambda: parser.parse(io.BytesIO(expected)),
+                            iterations,
+                            warmup,
+                        )
+                    ),
+                }
+            )
+    return results
@@ -0,0 +1,113 @@
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+@dataclass
+class Scenario:
+    """Запрос, выполняемый в замере."""
+
+    name: str
+    path: str
+    method: str = "get"
+    data: Optional[dict] = None
+    headers: dict = field(default_factory=dict)
+    # Подготовка перед каждым запросом, не входит в замер времени
+    setup: Optional[Callable[[], None]] = None
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Перцентиль методом ближайшего ранга."""
+    ordered = sorted(values)
+    rank = max(round(percent / 100 * len(ordered) + 0.5) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def timed(func: Callable, iterations: int, warmup: int = 1) -> list[float]:
+    """Время выполнения func в миллисекундах для каждой итерации."""
+    for _ in range(warmup):
+        func()
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def summary(timings: list[float]) -> dict:
+    return {
+        "p50_ms": round(percentile(timings, 50), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "iterations": len(timings),
+    }
+
+
+def measure(
+    client,
+    scenario: Scenario,
+    iterations: int,
+    warmup: int = 1,
+    using: str = DEFAULT_DB_ALIAS,
+) -> dict:
+    """
+    Замер запроса: время (без учёта SQL-журнала), количество запросов
+    к БД и пиковое выделение памяти на один запрос.
+    Каждый показатель снимается отдельным проходом, чтобы
+    инструменты не искажали друг друга.
+    """
+    send = getattr(client, scenario.method)
+    extra = {"headers": scenario.headers}
+    if scenario.method != "get":
+        extra["content_type"] = "application/json"
+
+    def request():
+        return send(scenario.path, data=scenario.data, **extra)
+
+    def prepared_request():
+        if scenario.setup:
+            scenario.setup()
+        return request()
+
+    def timed_request() -> float:
+        # Подготовка не входит в замер времени запроса
+        if scenario.setup:
+            scenario.setup()
+        started = time.perf_counter()
+        request()
+        return (time.perf_counter() - started) * 1000
+
+    for _ in range(warmup):
+        prepared_request()
+    timings = [timed_request() for _ in range(iterations)]
+
+    with CaptureQueriesContext(connections[using]) as context:
+        response = prepared_request()
+    # Журнал запросов очищается в начале следующего запроса
+    queries = len(context.captured_queries)
+
+    if scenario.setup:
+        scenario.setup()
+    tracemalloc.start()
+    try:
+        request()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "name": scenario.name,
+        "method": scenario.method.upper(),
+        "path": scenario.path,
+        "status": response.status_code,
+        "cache": response.get("X-Cache"),
+        "queries": queries,
+        "peak_memory_kb": round(peak / 1024, 1),
+        **summary(timings),
+    }
@@ -0,0 +1,99 @@
+from api.serializers.read_serializers import (
+    CommentValuesSerializer,
+    ReviewValuesSerializer,
+    TitleValuesSerializer,
+)
+from api.serializers.review_serializers import (
+    CommentSerializer,
+    ReviewSerializer,
+    TitleReadSerializer,
+)
+from django.db.models import Count, Prefetch
+from rest_framework.renderers import JSONRenderer
+from reviews.models import Comment, Genre, Review, Title
+
+from .runner import summary, timed
+
+SIZES = (5, 100)
+
+
+def get_querysets() -> dict:
+    """
+    Запросы списков на реальных данных: ModelSerializer с моделями
+    и сериализатор строк .values() с его полями.
+    """
+    title = Title.objects.order_by("-reviews_count", "id").first()
+    review = (
+        Review.objects.annotate(comments_count=Count("comments"))
+        .order_by("-comments_count", "id")
+        .first()
+    )
+    if title is None or review is None:
+        raise ValueError(
+            "Нет данных для замеров, выполните команду generate_data."
+        )
+    titles = Title.objects.order_by("name", "id")
+    reviews = Review.objects.filter(title=title).order_by("-pub_date", "-id")
+    comments = Comment.objects.filter(review=review).order_by(
+        "-pub_date", "-id"
+    )
+    return {
+        "titles": (
+            titles.select_related("category").prefetch_related(
+                Prefetch("genre", queryset=Genre.objects.only("name", "slug"))
+            ),
+            TitleReadSerializer,
+            titles,
+            TitleValuesSerializer,
+        ),
+        "reviews": (
+            reviews.select_related("author"),
+            ReviewSerializer,
+            reviews,
+            ReviewValuesSerializer,
+        ),
+        "comments": (
+            comments.select_related("author"),
+            CommentSerializer,
+            comments,
+            CommentValuesSerializer,
+        ),
+    }
+
+
+def run(iterations: int = 50, warmup: int = 1, only=None, **options):
+    """
+    Сравнение ModelSerializer и сериализаторов строк .values():
+    выборка страницы и сериализация, без рендеринга.
+    """
+    renderer = JSONRenderer()
+    results = []
+    for name, (
+        queryset,
+        serializer_class,
+        rows,
+        values_class,
+    ) in get_querysets().items():
+        for size in SIZES:
+            key = f"{name}_{size}"
+            if only and key not in only:
+                continue
+
+            def drf():
+                return serializer_class(queryset[:size], many=True).data
+
+            def values():
+                return values_class(
+                    list(rows[:size].values(*values_class.get_values()))
+                ).data
+
+            expected = renderer.render(drf())
+            for label, func in (("drf", drf), ("values", values)):
+                results.append(
+                    {
+                        "name": f"{key}_{label}",
+                        "identical": renderer.render(func()) == expected,
+                        **summary(timed(func, iterations, warmup)),
+                    }
+                )
+    return results
@@ -0,0 +1,25 @@
+from rest_framework.exceptions import ValidationError
+
+# Параметр со списком полей ответа: `?fields=id,name,rating`
+FIELDS_PARAM: str = "fields"
+# Параметр со списком встраиваемых данных: `?expand=reviews`
+EXPAND_PARAM: str = "expand"
+# Количество последних записей, встраиваемых в каждый объект
+EXPAND_LIMIT: int = 3
+
+
+def get_requested(request, param: str, allowed) -> list[str] | None:
+    """
+    Имена из параметра запроса `param` (через запятую) в порядке
+    `allowed`. None, если параметр не передан или пуст.
+    """
+    value = request.query_params.get(param, "") if request else ""
+    names = {name.strip() for name in value.split(",")} - {""}
+    if not names:
+        return None
+    unknown = names.difference(allowed)
+    if unknown:
+        raise ValidationError(
+            {param: [f"Неизвестные поля: {', '.join(sorted(unknown))}."]}
+        )
+    return [name for name in allowed if name in names]
@@ -1,18 +1,148 @@
+from django.db.models import Exists, OuterRef
 from django_filters.rest_framework import FilterSet, filters
-from reviews.models import Title
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from reviews.models import Category, Genre, GenreTitle, Title
+from reviews.search import search_titles
 
 
 class TitleFilter(FilterSet):
-    """ Класс для фильтрации произведений. """
+    """
+    Класс для фильтрации произведений.
+    Категория и жанр фильтруются по точному совпадению слага,
+    несколько значений перечисляются через запятую (`genre=drama,comedy`).
+    Параметр `match=contains` включает поиск по подстроке слага.
+    """
+
+    MATCH_EXACT = "exact"
+    MATCH_CONTAINS = "contains"
+
     name = filters.CharFilter(field_name="name", lookup_expr="icontains")
     year = filters.NumberFilter(field_name="year")
-    category = filters.CharFilter(
-        field_name="category__slug", lookup_expr="icontains"
-    )
-    genre = filters.CharFilter(
-        field_name="genre__slug", lookup_expr="icontains"
+    category = filters.CharFilter(method="filter_category")
+    genre = filters.CharFilter(method="filter_genre")
+    match = filters.ChoiceFilter(
+        choices=((MATCH_EXACT, "Точное"), (MATCH_CONTAINS, "Подстрока")),
+        method="filter_match",
     )
 
     class Meta:
         model = Title
         fields = ("name", "year", "category", "genre",)
+
+    @property
+    def is_substring_match(self):
+        return self.form.cleaned_data.get("match") == self.MATCH_CONTAINS
+
+    @staticmethod
+    def split_slugs(value):
+        return [slug for slug in (s.strip() for s in value.split(",")) if slug]
+
+    def slug_condition(self, value):
+        """Условие на слаг: точное значение, список или подстрока."""
+        if self.is_substring_match:
+            return {"slug__icontains": value}
+        slugs = self.split_slugs(value)
+        if len(slugs) == 1:
+            return {"slug": slugs[0]}
+        return {"slug__in": slugs}
+
+    def filter_category(self, queryset, name, value):
+        # Подзапрос по уникальному индексу слага вместо JOIN.
+        categories = Category.objects.filter(**self.slug_condition(value))
+        return queryset.filter(category__in=categories.values("id"))
+
+    def filter_genre(self, queryset, name, value):
+        # EXISTS не размножает произведения и не требует DISTINCT.
+        genres = Genre.objects.filter(**self.slug_condition(value))
+        genre_titles = GenreTitle.objects.filter(
+            title=OuterRef("pk"), genre__in=genres.values("id")
+        )
+        return queryset.filter(Exists(genre_titles))
+
+    def filter_match(self, queryset, name, value):
+        return queryset
+
+
+class TitleSearchFilter(BaseFilterBackend):
+    """
+    Полнотекстовый поиск произведений по названию и описанию
+    с сортировкой по релевантности.
+    """
+
+    search_param = "search"
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, "").strip()
+        if not query:
+            return queryset
+        return search_titles(queryset, query)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": "Поиск по названию и описанию.",
+                "schema": {"type": "string"},
+            },
+        ]
+
+
+class TitleOrderingFilter(BaseFilterBackend):
+    """
+    Сортировка произведений параметром `ordering`: по названию
+    или по популярности (`trending`), которую пересчитывает фоновая
+    задача. Оба порядка совпадают с индексами, последним полем идёт id,
+    поэтому порядок подходит и для вывода по курсору.
+    """
+
+    ordering_param = "ordering"
+    NAME = "name"
+    TRENDING = "trending"
+    orderings = {
+        NAME: ("name", "id"),
+        TRENDING: ("-trending_score", "id"),
+    }
+
+    @classmethod
+    def get_ordering_name(cls, request) -> str | None:
+        value = request.query_params.get(cls.ordering_param)
+        if value is None:
+            return None
+        if value not in cls.orderings:
+            raise ValidationError(
+                {
+                    cls.ordering_param: [
+                        "Допустимые значения: "
+                        + ", ".join(cls.orderings) + "."
+                    ]
+                }
+            )
+        return value
+
+    @classmethod
+    def get_ordering(cls, request) -> tuple[str, ...] | None:
+        name = cls.get_ordering_name(request)
+        return cls.orderings[name] if name else None
+
+    def filter_queryset(self, request, queryset, view):
+        ordering = self.get_ordering(request)
+        if ordering is None:
+            return queryset
+        return queryset.order_by(*ordering)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.ordering_param,
+                "required": False,
+                "in": "query",
+                "description": (
+                    "Сортировка: `name` — по названию, `trending` — "
+                    "по популярности за последние дни."
+                ),
+                "schema": {"type": "string", "enum": list(self.orderings)},
+            },
+        ]
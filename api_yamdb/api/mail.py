@@ -0,0 +1,87 @@
+import json
+from smtplib import SMTPException
+
+from api.utils import get_redis_client
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import EmailMessage, get_connection
+
+# Очередь кодов подтверждения, ожидающих пакетной отправки
+OUTBOX_KEY: str = "confirm_code_outbox"
+
+# Ошибки отправки одного письма, после которых письмо отправляется
+# повторно отдельной задачей
+DELIVERY_ERRORS = (SMTPException, OSError)
+
+
+def confirm_code_message(email: str, confirm_code: str) -> EmailMessage:
+    """Письмо с кодом подтверждения."""
+    return EmailMessage(
+        subject="Ваш код подтверждения",
+        body=f"Ваш код подтверждения: {confirm_code}\n",
+        from_email=settings.EMAIL_HOST_USER,
+        to=[email],
+    )
+
+
+def push_outbox(email: str, confirm_code: str) -> int:
+    """Добавление кода в очередь отправки; возвращает длину очереди."""
+    item = json.dumps([email, confirm_code])
+    client, key = get_redis_client(OUTBOX_KEY)
+    if client is not None:
+        return client.rpush(key, item)
+    # Для других бэкендов кеша очередь хранится списком (неатомарно)
+    outbox = cache.get(OUTBOX_KEY, []) + [item]
+    cache.set(OUTBOX_KEY, outbox, timeout=None)
+    return len(outbox)
+
+
+def pop_outbox(size: int) -> list[tuple[str, str]]:
+    """Извлечение из очереди не более `size` кодов."""
+    client, key = get_redis_client(OUTBOX_KEY)
+    if client is not None:
+        with client.pipeline(transaction=True) as pipe:
+            pipe.lrange(key, 0, size - 1)
+            pipe.ltrim(key, size, -1)
+            items, _ = pipe.execute()
+    else:
+        outbox = cache.get(OUTBOX_KEY, [])
+        items, rest = outbox[:size], outbox[size:]
+        cache.set(OUTBOX_KEY, rest, timeout=None)
+    return [tuple(json.loads(item)) for item in items]
+
+
+def outbox_size() -> int:
+    client, key = get_redis_client(OUTBOX_KEY)
+    if client is not None:
+        return client.llen(key)
+    return len(cache.get(OUTBOX_KEY, []))
+
+
+def send_batch(codes: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """
+    Отправка писем с кодами через одно соединение с почтовым сервером.
+    После ошибки отправки соединение открывается заново для следующих
+    писем. Возвращает коды, письма с которыми не отправлены.
+    """
+    failed = []
+    connection = get_connection()
+    try:
+        for email, confirm_code in codes:
+            message = confirm_code_message(email, confirm_code)
+            try:
+                connection.open()
+                connection.send_messages([message])
+            except DELIVERY_ERRORS:
+                failed.append((email, confirm_code))
+                close_quietly(connection)
+    finally:
+        close_quietly(connection)
+    return failed
+
+
+def close_quietly(connection) -> None:
+    try:
+        connection.close()
+    except DELIVERY_ERRORS:
+        pass
@@ -0,0 +1,133 @@
+import json
+import platform
+from datetime import datetime, timezone
+from importlib import import_module
+
+import django
+from api.benchmarks import SUITES
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+from reviews.models import Comment, Review, Title
+
+LOCMEM_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+OPTIONAL_COLUMNS = (
+    ("status", "код", 6),
+    ("queries", "SQL", 6),
+    ("peak_memory_kb", "память КБ", 12),
+    ("bytes", "байт", 10),
+    ("identical", "совпадает", 11),
+    ("messages_per_s", "писем/с", 10),
+    ("connections", "соединений", 12),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Замер производительности API: задержка p50/p95, количество "
+        "запросов к БД и память на запрос. Результат выводится в JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "suite",
+            nargs="?",
+            default="endpoints",
+            choices=list(SUITES),
+            help="Набор замеров.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=50,
+            help="Количество замеров каждого сценария.",
+        )
+        parser.add_argument("--warmup", type=int, default=1)
+        parser.add_argument(
+            "--only",
+            action="append",
+            help="Выполнить только указанные сценарии (можно повторять).",
+        )
+        parser.add_argument(
+            "--output", help="Файл для сохранения результата в JSON."
+        )
+        parser.add_argument(
+            "--no-response-cache",
+            action="store_true",
+            help="Отключить кеш ответов API.",
+        )
+        parser.add_argument(
+            "--locmem-cache",
+            action="store_true",
+            help="Использовать кеш в памяти процесса вместо Redis.",
+        )
+
+    def get_dataset(self) -> dict:
+        return {
+            "titles": Title.objects.count(),
+            "reviews": Review.objects.count(),
+            "comments": Comment.objects.count(),
+        }
+
+    def print_results(self, results) -> None:
+        # Дополнительные столбцы выводятся, если они есть в результатах
+        columns = [
+            (key, title, width)
+            for key, title, width in OPTIONAL_COLUMNS
+            if any(key in result for result in results)
+        ]
+        self.stdout.write(
+            f"{'сценарий':<28}{'p50 мс':>10}{'p95 мс':>10}"
+            + "".join(f"{title:>{width}}" for _, title, width in columns)
+        )
+        for result in results:
+            self.stdout.write(
+                f"{result['name']:<28}{result['p50_ms']:>10.2f}"
+                f"{result['p95_ms']:>10.2f}"
+                + "".join(
+                    f"{str(result.get(key, '')):>{width}}"
+                    for key, _, width in columns
+                )
+            )
+
+    def handle(self, *args, **options):
+        overrides = {}
+        if options["no_response_cache"]:
+            overrides["RESPONSE_CACHE_ENABLED"] = False
+        if options["locmem_cache"]:
+            overrides["CACHES"] = LOCMEM_CACHES
+        suite = import_module(SUITES[options["suite"]])
+        with override_settings(**overrides):
+            results = suite.run(
+                iterations=options["iterations"],
+                warmup=options["warmup"],
+                only=options["only"],
+            )
+        report = {
+            "suite": options["suite"],
+            "created": datetime.now(timezone.utc).isoformat(),
+            "environment": {
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+                "response_cache": not options["no_response_cache"],
+            },
+            "dataset": self.get_dataset(),
+            "iterations": options["iterations"],
+            "results": results,
+        }
+        self.print_results(results)
+        data = json.dumps(report, ensure_ascii=False, indent=2)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as file:
+                file.write(data)
+            self.stdout.write(
+                self.style.SUCCESS(f"Результат сохранён в {options['output']}")
+            )
+        else:
+            self.stdout.write(data)
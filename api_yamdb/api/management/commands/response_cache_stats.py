@@ -0,0 +1,24 @@
+from api import response_cache
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Статистика попаданий и промахов кеша ответов."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset", action="store_true", help="Сбросить счётчики."
+        )
+
+    def handle(self, *args, **options):
+        stats = response_cache.get_stats()
+        total = stats["hits"] + stats["misses"]
+        ratio = stats["hits"] / total * 100 if total else 0
+        self.stdout.write(
+            f"Попадания: {stats['hits']}\n"
+            f"Промахи: {stats['misses']}\n"
+            f"Доля попаданий: {ratio:.1f}%"
+        )
+        if options["reset"]:
+            response_cache.reset_stats()
+            self.stdout.write(self.style.SUCCESS("Счётчики сброшены."))
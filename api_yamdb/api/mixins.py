@@ -1,8 +1,16 @@
+from api import response_cache
+from api.fieldsets import EXPAND_PARAM, FIELDS_PARAM, get_requested
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import status
 from rest_framework.mixins import (
     CreateModelMixin,
     DestroyModelMixin,
     ListModelMixin,
 )
+from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
 
@@ -15,3 +23,142 @@ class CreateListDestroyViewSet(
     """Миксин для создания, удаления и получение списка обьектов."""
 
     pass
+
+
+class ValuesListMixin:
+    """
+    Быстрый вывод списка: строки выбираются через .values()
+    и сериализуются классом `values_serializer_class` без полей DRF.
+    Параметр `fields` ограничивает поля ответа и выборки,
+    `expand` встраивает связанные данные.
+    Требует пагинацию PageNumberOrCursorPagination.
+    """
+
+    values_serializer_class = None
+
+    def get_fields(self):
+        return get_requested(
+            self.request, FIELDS_PARAM, self.values_serializer_class.fields
+        )
+
+    def get_expand(self):
+        return get_requested(
+            self.request,
+            EXPAND_PARAM,
+            self.values_serializer_class.expandable,
+        )
+
+    def get_projection(self) -> list[str]:
+        """Поля модели, необходимые для запрошенных полей ответа."""
+        return self.values_serializer_class.get_values(
+            self.get_fields(), self.get_expand()
+        )
+
+    def only_requested(self, queryset):
+        """
+        Выборка отзывов и комментариев для ModelSerializer: только поля
+        запрошенного ответа. Автор загружается всегда, он нужен
+        для проверки прав на объект.
+        """
+        projection = self.get_projection()
+        if "author__username" not in projection:
+            return queryset.only(*projection, "author")
+        return queryset.select_related("author").only(*projection)
+
+    def list(self, request, *args, **kwargs):
+        serializer_class = self.values_serializer_class
+        fields, expand = self.get_fields(), self.get_expand()
+        # Поля сортировки нужны для курсора следующей страницы.
+        values = list(
+            dict.fromkeys(
+                serializer_class.get_values(fields, expand)
+                + [
+                    name.lstrip("-")
+                    for name in getattr(self, "cursor_ordering", ())
+                ]
+            )
+        )
+        queryset = self.filter_queryset(self.get_queryset())
+        queryset = queryset.prefetch_related(None)
+        page = None
+        if self.paginator is not None:
+            page = self.paginator.paginate_queryset(
+                queryset, request, view=self, values=values
+            )
+        if page is None:
+            rows = queryset.values(*values)
+            return Response(serializer_class(rows, fields, expand).data)
+        return self.get_paginated_response(
+            serializer_class(page, fields, expand).data
+        )
+
+
+class ConditionalResponseMixin:
+    """
+    Условные запросы (ETag, Last-Modified) для чтения.
+    Валидаторы вычисляются по версиям общего пространства CATALOG
+    и пространств `cache_namespaces`, которые увеличиваются сигналами
+    при изменении данных, поэтому неизменённый ресурс возвращает 304
+    до выполнения запросов к БД.
+    """
+
+    cache_namespaces = ()
+
+    def get_cache_namespaces(self):
+        return self.cache_namespaces
+
+    def get_response_namespaces(self):
+        """Все пространства версий ответа, начиная с общего."""
+        return (response_cache.CATALOG, *self.get_cache_namespaces())
+
+    def conditional_response(self, handler, request, *args, **kwargs):
+        versions, last_modified = response_cache.get_state(
+            self.get_response_namespaces()
+        )
+        etag = response_cache.make_etag(request, versions)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = self.get_fresh_response(
+                handler, request, versions, *args, **kwargs
+            )
+            if response.status_code != status.HTTP_200_OK:
+                return response
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def get_fresh_response(self, handler, request, versions, *args, **kwargs):
+        return handler(request, *args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().list, request, *args, **kwargs
+        )
+
+
+class CachedResponseMixin(ConditionalResponseMixin):
+    """
+    Кеширование ответов на чтение для анонимных пользователей.
+    Ключ ответа содержит версии пространств `cache_namespaces`.
+    """
+
+    def get_fresh_response(self, handler, request, versions, *args, **kwargs):
+        if request.user.is_authenticated or not response_cache.is_enabled():
+            return handler(request, *args, **kwargs)
+        key = response_cache.make_key(request, versions)
+        data = cache.get(key)
+        if data is not None:
+            response_cache.count(response_cache.HITS_KEY)
+            response = Response(data)
+            response["X-Cache"] = "HIT"
+            return response
+        response_cache.count(response_cache.MISSES_KEY)
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(
+                key, response.data, timeout=settings.RESPONSE_CACHE_TIMEOUT
+            )
+        response["X-Cache"] = "MISS"
+        return response
@@ -0,0 +1,324 @@
+from base64 import b64decode, b64encode
+from functools import partial
+from urllib import parse
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.paginator import Paginator
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Постраничный вывод по ключу (keyset).
+    Курсор хранит значения полей сортировки последней записи страницы,
+    поэтому глубокие страницы выбираются по индексу без OFFSET и COUNT.
+    Порядок задаётся атрибутом представления `cursor_ordering`,
+    последним полем должен быть уникальный ключ (tie-breaker).
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Неверный курсор."
+
+    def __init__(self, page_size):
+        self.page_size = page_size
+
+    def get_ordering(self, view):
+        return tuple(view.cursor_ordering)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.model = queryset.model
+        self.ordering = self.get_ordering(view)
+        self.fields = [
+            queryset.model._meta.get_field(name.lstrip("-"))
+            for name in self.ordering
+        ]
+        position, self.reverse = self.decode_cursor(request)
+
+        ordering = self.ordering
+        if self.reverse:
+            ordering = tuple(self.invert(name) for name in ordering)
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.seek_filter(ordering, position))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if self.reverse:
+            self.page.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+        return self.page
+
+    @staticmethod
+    def invert(name):
+        return name[1:] if name.startswith("-") else f"-{name}"
+
+    @staticmethod
+    def seek_filter(ordering, position):
+        """
+        Условие `(a, b) > (x, y)` с учётом направления сортировки:
+        `a > x OR (a = x AND b > y)`.
+        """
+        condition = Q()
+        equal = Q()
+        for name, value in zip(ordering, position):
+            field = name.lstrip("-")
+            lookup = "lt" if name.startswith("-") else "gt"
+            condition |= equal & Q(**{f"{field}__{lookup}": value})
+            equal &= Q(**{field: value})
+        return condition
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, False
+        try:
+            querystring = b64decode(encoded.encode("ascii")).decode("ascii")
+            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            values = tokens["p"]
+            reverse = bool(int(tokens.get("r", ["0"])[0]))
+            if len(values) != len(self.fields):
+                raise ValueError
+            position = [
+                field.to_python(value)
+                for field, value in zip(self.fields, values)
+            ]
+        except (
+            TypeError,
+            ValueError,
+            KeyError,
+            UnicodeError,
+            DjangoValidationError,
+        ):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def encode_cursor(self, instance, reverse):
+        if isinstance(instance, dict):
+            # Строка .values(): значения полей сортировки переносим
+            # в экземпляр модели для сериализации как у обычных записей.
+            values = {
+                field.attname: instance[field.attname] for field in self.fields
+            }
+            instance = self.model(**values)
+        tokens = {
+            "p": [field.value_to_string(instance) for field in self.fields]
+        }
+        if reverse:
+            tokens["r"] = "1"
+        querystring = parse.urlencode(tokens, doseq=True)
+        encoded = b64encode(querystring.encode("ascii")).decode("ascii")
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, encoded
+        )
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                },
+                "results": schema,
+            },
+        }
+
+
+class ChangeFeedPagination(BasePagination):
+    """
+    Вывод ленты изменений после курсора — номера последней полученной
+    записи (`?after=`). Ответ содержит курсор для следующего запроса,
+    в том числе когда новых записей нет, поэтому потребитель хранит
+    только его и продолжает с того же места.
+    """
+
+    after_query_param = "after"
+    limit_query_param = "limit"
+    default_limit = 500
+    max_limit = 5000
+
+    def get_int(self, request, name, default, maximum=None):
+        value = request.query_params.get(name)
+        if value is None:
+            return default
+        try:
+            value = int(value)
+        except ValueError:
+            raise ValidationError({name: ["Ожидается целое число."]})
+        if value < 0:
+            raise ValidationError({name: ["Ожидается неотрицательное число."]})
+        return min(value, maximum) if maximum else value
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.after = self.get_int(request, self.after_query_param, 0)
+        limit = self.get_int(
+            request,
+            self.limit_query_param,
+            self.default_limit,
+            self.max_limit,
+        ) or self.default_limit
+        rows = list(
+            queryset.filter(pk__gt=self.after).order_by("pk")[: limit + 1]
+        )
+        self.has_more = len(rows) > limit
+        self.page = rows[:limit]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "cursor": self.page[-1].pk if self.page else self.after,
+                "has_more": self.has_more,
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["cursor", "has_more", "results"],
+            "properties": {
+                "cursor": {"type": "integer"},
+                "has_more": {"type": "boolean"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.after_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Курсор: номер последней полученной записи.",
+                "schema": {"type": "integer"},
+            },
+            {
+                "name": self.limit_query_param,
+                "required": False,
+                "in": "query",
+                "description": (
+                    f"Количество записей (до {self.max_limit})."
+                ),
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class ValuesPaginator(Paginator):
+    """
+    Постраничный вывод строк .values(): количество считается по запросу
+    модели, а поля выбираются только для среза страницы, иначе поля
+    связанных моделей добавляют JOIN в запрос COUNT.
+    """
+
+    def __init__(self, object_list, per_page, values=(), **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.values = values
+
+    def _get_page(self, object_list, *args, **kwargs):
+        return super()._get_page(
+            object_list.values(*self.values), *args, **kwargs
+        )
+
+
+class PageNumberOrCursorPagination(PageNumberPagination):
+    """
+    Постраничный вывод по номеру страницы (по умолчанию) или по курсору.
+    Режим курсора включается параметром `?pagination=cursor`;
+    ссылки next/previous сохраняют параметр.
+    """
+
+    mode_query_param = "pagination"
+    cursor_mode = "cursor"
+    cursor_pagination_class = KeysetPagination
+
+    def is_cursor_mode(self, request):
+        return (
+            request.query_params.get(self.mode_query_param)
+            == self.cursor_mode
+            or self.cursor_pagination_class.cursor_query_param
+            in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None, values=None):
+        """
+        При переданных полях `values` страница состоит
+        из словарей .values() вместо экземпляров модели.
+        """
+        self.cursor_paginator = None
+        if self.is_cursor_mode(request):
+            page_size = self.get_page_size(request)
+            if not page_size:
+                return None
+            if values:
+                queryset = queryset.values(*values)
+            self.cursor_paginator = self.cursor_pagination_class(page_size)
+            return self.cursor_paginator.paginate_queryset(
+                queryset, request, view
+            )
+        if values:
+            self.django_paginator_class = partial(
+                ValuesPaginator, values=values
+            )
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
+            {
+                "name": self.mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Режим постраничного вывода: `cursor`.",
+                "schema": {"type": "string", "enum": [self.cursor_mode]},
+            },
+            {
+                "name": self.cursor_pagination_class.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Курсор страницы.",
+                "schema": {"type": "string"},
+            },
+        ]
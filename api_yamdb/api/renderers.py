@@ -0,0 +1,132 @@
+import csv
+import io
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+# Даты, Decimal, UUID и ленивые строки передаются кодировщику DRF,
+# чтобы результат совпадал с JSONRenderer.
+ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_NON_STR_KEYS
+)
+LINE_SEPARATORS = (
+    (b"\xe2\x80\xa8", b"\\u2028"),
+    (b"\xe2\x80\xa9", b"\\u2029"),
+)
+UTF8 = {"utf-8", "utf8"}
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON-рендерер на orjson. Результат совпадает с JSONRenderer
+    побайтно; форматирование с отступами (браузерный API, `indent=`)
+    и нестандартные настройки UNICODE_JSON/COMPACT_JSON
+    обрабатываются стандартным рендерером.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=ORJSON_OPTIONS,
+            )
+        except orjson.JSONEncodeError:
+            # Например, целые числа больше 64 бит.
+            return super().render(data, accepted_media_type, renderer_context)
+        for char, escaped in LINE_SEPARATORS:
+            if char in ret:
+                ret = ret.replace(char, escaped)
+        return ret
+
+
+class ORJSONParser(JSONParser):
+    """JSON-парсер на orjson для тел запросов в UTF-8."""
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if encoding.lower() not in UTF8:
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
+
+
+class ExportRenderer(BaseRenderer):
+    """
+    Рендерер выгрузки. Метод `stream` превращает пачки строк (словарей
+    с полями `fields`) в поток байтов для StreamingHttpResponse;
+    `render` используется для ответов об ошибках.
+    """
+
+    def stream(self, chunks, fields):
+        raise NotImplementedError
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        rows = data if isinstance(data, list) else [data]
+        fields = list(dict.fromkeys(key for row in rows for key in row))
+        return b"".join(self.stream([rows], fields))
+
+
+class NDJSONRenderer(ExportRenderer):
+    """Выгрузка в формате NDJSON: по объекту JSON в строке."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def stream(self, chunks, fields):
+        default = JSONRenderer.encoder_class().default
+        for rows in chunks:
+            yield b"".join(
+                orjson.dumps(
+                    {field: row.get(field) for field in fields},
+                    default=default,
+                )
+                + b"\n"
+                for row in rows
+            )
+
+
+class CSVRenderer(ExportRenderer):
+    """
+    Выгрузка в формате CSV с заголовком. Списки записываются
+    через запятую, None — пустой строкой.
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+
+    def stream(self, chunks, fields):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fields)
+        for rows in chunks:
+            writer.writerows(
+                [
+                    ",".join(value) if isinstance(value, list) else value
+                    for value in map(row.get, fields)
+                ]
+                for row in rows
+            )
+            yield buffer.getvalue().encode(self.charset)
+            buffer.seek(0)
+            buffer.truncate()
+        # Заголовок пустой выгрузки.
+        if buffer.tell():
+            yield buffer.getvalue().encode(self.charset)
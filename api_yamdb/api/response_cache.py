@@ -0,0 +1,168 @@
+import hashlib
+import time
+from itertools import chain
+from urllib import parse
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.http import quote_etag
+
+CACHE_PREFIX: str = "response_cache"
+
+# Пространства версий кеша ответов
+# Общее пространство входит в ключи всех ответов: массовая загрузка
+# и пересчёт рейтингов увеличивают только его, а не версии каждого
+# произведения
+CATALOG: str = "catalog"
+TITLES: str = "titles"
+CATEGORIES: str = "categories"
+GENRES: str = "genres"
+# Категории и жанры выводятся внутри произведений
+TAXONOMY: str = "taxonomy"
+# Имена авторов выводятся в отзывах и комментариях
+AUTHORS: str = "authors"
+# Последние комментарии встраиваются в списки отзывов (`expand=comments`)
+COMMENTS: str = "comments"
+# Рейтинги лучших произведений пересчитываются фоновой задачей
+LEADERBOARDS: str = "leaderboards"
+# Популярность произведений (`ordering=trending`) пересчитывается
+# фоновой задачей
+TRENDING: str = "trending"
+
+HITS_KEY: str = f"{CACHE_PREFIX}:hits"
+MISSES_KEY: str = f"{CACHE_PREFIX}:misses"
+
+
+def title_namespace(title_id) -> str:
+    """Пространство версий отдельного произведения."""
+    return f"{TITLES}:{title_id}"
+
+
+def reviews_namespace(title_id) -> str:
+    """Пространство версий списка отзывов произведения."""
+    return f"reviews:{title_id}"
+
+
+def review_namespace(review_id) -> str:
+    """Пространство версий отдельного отзыва."""
+    return f"review:{review_id}"
+
+
+def comments_namespace(review_id) -> str:
+    """Пространство версий списка комментариев к отзыву."""
+    return f"comments:{review_id}"
+
+
+def comment_namespace(comment_id) -> str:
+    """Пространство версий отдельного комментария."""
+    return f"comment:{comment_id}"
+
+
+def version_key(namespace: str) -> str:
+    return f"{CACHE_PREFIX}:version:{namespace}"
+
+
+def modified_key(namespace: str) -> str:
+    return f"{CACHE_PREFIX}:modified:{namespace}"
+
+
+def get_state(namespaces) -> tuple[list[int], int]:
+    """
+    Получение текущих версий пространств и времени последнего изменения
+    (unix-время) за одно обращение к кешу.
+    Отсутствующая версия инициализируется временем в миллисекундах,
+    чтобы после вытеснения ключа не вернуться к старым записям;
+    отсутствующее время изменения считается текущим.
+    """
+    keys = [version_key(namespace) for namespace in namespaces]
+    modified_keys = [modified_key(namespace) for namespace in namespaces]
+    values = cache.get_many(keys + modified_keys)
+    now = time.time()
+    for key, initial in chain(
+        ((key, int(now * 1000)) for key in keys),
+        ((key, int(now)) for key in modified_keys),
+    ):
+        if key not in values:
+            cache.add(key, initial, timeout=None)
+            values[key] = cache.get(key, initial)
+    return (
+        [values[key] for key in keys],
+        max((values[key] for key in modified_keys), default=int(now)),
+    )
+
+
+def bump_versions(*namespaces: str) -> None:
+    """Инвалидация всех ответов, зависящих от пространств."""
+    now = int(time.time())
+    for namespace in namespaces:
+        key = version_key(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, int(time.time() * 1000), timeout=None)
+    cache.set_many(
+        {modified_key(namespace): now for namespace in namespaces},
+        timeout=None,
+    )
+
+
+def make_key(request, versions) -> str:
+    """
+    Ключ ответа: адрес запроса с отсортированными параметрами фильтрации
+    и постраничного вывода, а также версии пространств.
+    """
+    return make_url_key(
+        request.build_absolute_uri(request.path),
+        request.query_params,
+        versions,
+    )
+
+
+def make_url_key(url: str, query_params, versions) -> str:
+    """Ключ ответа по адресу ресурса, параметрам запроса и версиям."""
+    query = parse.urlencode(sorted(query_params.lists()), doseq=True)
+    url = f"{url}?{query}"
+    digest = hashlib.md5(url.encode("utf-8")).hexdigest()
+    version = ".".join(str(value) for value in versions)
+    return f"{CACHE_PREFIX}:{version}:{digest}"
+
+
+def make_etag(request, versions) -> str:
+    """
+    Валидатор ответа: адрес запроса, формат ответа и версии пространств.
+    Вычисляется без обращения к БД и без сериализации.
+    """
+    renderer = getattr(request, "accepted_renderer", None)
+    media_type = renderer.media_type if renderer else ""
+    return quote_etag(
+        hashlib.md5(
+            f"{media_type}:{make_key(request, versions)}".encode("utf-8")
+        ).hexdigest()
+    )
+
+
+def is_enabled() -> bool:
+    return settings.RESPONSE_CACHE_ENABLED
+
+
+def count(key: str, delta: int = 1) -> None:
+    if not delta:
+        return
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        if not cache.add(key, delta, timeout=None):
+            cache.incr(key, delta)
+
+
+def get_stats() -> dict[str, int]:
+    """Счётчики попаданий и промахов кеша ответов."""
+    stats = cache.get_many([HITS_KEY, MISSES_KEY])
+    return {
+        "hits": stats.get(HITS_KEY, 0),
+        "misses": stats.get(MISSES_KEY, 0),
+    }
+
+
+def reset_stats() -> None:
+    cache.delete_many([HITS_KEY, MISSES_KEY])
@@ -1,11 +1,80 @@
+from functools import cache
+
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
 from drf_spectacular.extensions import OpenApiViewExtension
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    extend_schema,
+    extend_schema_view,
+    inline_serializer,
+)
+from rest_framework import serializers
+
+
+def sparse_parameters(expand, description):
+    """Параметры `fields` и `expand` для чтения."""
+    from api.fieldsets import EXPAND_PARAM, FIELDS_PARAM
+
+    return [
+        OpenApiParameter(
+            FIELDS_PARAM,
+            str,
+            description="Поля ответа через запятую.",
+        ),
+        OpenApiParameter(
+            EXPAND_PARAM,
+            str,
+            enum=[expand],
+            description=description,
+        ),
+    ]
+
+
+@cache
+def title_batch_response():
+    """Ответ на запрос нескольких произведений."""
+    from api.serializers.review_serializers import TitleReadSerializer
+
+    return inline_serializer(
+        "TitleBatch",
+        {
+            "results": TitleReadSerializer(many=True),
+            "missing": serializers.ListField(child=serializers.IntegerField()),
+        },
+    )
+
+
+@cache
+def title_bulk_response():
+    """
+    Ответ на массовую запись произведений. Схема создаётся один раз:
+    расширение вызывается для каждого метода, а одноимённые
+    компоненты должны совпадать.
+    """
+    from api.serializers.review_serializers import TitleBulkSerializer
+
+    return inline_serializer(
+        "TitleBulkResult",
+        {
+            "results": inline_serializer(
+                "TitleBulkItemResult",
+                {
+                    "status": serializers.IntegerField(),
+                    "data": TitleBulkSerializer(required=False),
+                    "errors": serializers.DictField(required=False),
+                },
+                many=True,
+            ),
+        },
+    )
 
 
 class TitleViewExtension(OpenApiViewExtension):
     target_class = "api.views.review_views.TitleViewSet"
 
     def view_replacement(self):
+        from api.serializers.review_serializers import TitleBulkSerializer
         from reviews.models import Title
 
         @extend_schema(tags=["TITLES"])
@@ -13,10 +82,55 @@ class TitleViewExtension(OpenApiViewExtension):
             list=extend_schema(
                 summary="Получение списка произведений",
                 description="Возвращает список всех произведений с информацией о рейтинге.",
+                parameters=sparse_parameters(
+                    "reviews", "Встроить последние отзывы."
+                ),
             ),
             retrieve=extend_schema(
                 summary="Получение информации о конкретном произведении",
                 description="Возвращает полную информацию о выбранном произведении.",
+                parameters=sparse_parameters(
+                    "reviews", "Встроить последние отзывы."
+                ),
+            ),
+            batch=extend_schema(
+                summary="Получение нескольких произведений",
+                description=(
+                    "Возвращает произведения по списку id (не более 200); "
+                    "ненайденные id перечисляются в поле missing."
+                ),
+                parameters=[
+                    OpenApiParameter(
+                        "ids",
+                        str,
+                        required=True,
+                        description="Id произведений через запятую.",
+                    ),
+                    *sparse_parameters(
+                        "reviews", "Встроить последние отзывы."
+                    ),
+                ],
+                responses=title_batch_response(),
+            ),
+            bulk=extend_schema(
+                summary="Массовое создание и обновление произведений",
+                description=(
+                    "POST создаёт произведения из списка, PUT обновляет "
+                    "элементы с id и создаёт остальные (не более 1000). "
+                    "Ошибочные элементы не прерывают запись остальных; "
+                    "результат каждого элемента возвращается в порядке "
+                    "запроса, при ошибках статус ответа 207."
+                ),
+                request=TitleBulkSerializer(many=True),
+                responses=title_bulk_response(),
+            ),
+            stats=extend_schema(
+                summary="Статистика оценок произведения",
+                description=(
+                    "Возвращает количество отзывов с каждой оценкой "
+                    "от 1 до 10, их общее количество, среднюю оценку "
+                    "и медиану."
+                ),
             ),
             create=extend_schema(
                 summary="Создание произведения",
@@ -106,10 +220,16 @@ class ReviewViewExtension(OpenApiViewExtension):
             list=extend_schema(
                 summary="Получение списка всех отзывов",
                 description="Получить список всех отзывов.",
+                parameters=sparse_parameters(
+                    "comments", "Встроить последние комментарии."
+                ),
             ),
             retrieve=extend_schema(
                 summary="Получение отзыва по id",
                 description="Получить отзыв по id для указанного произведения.",
+                parameters=sparse_parameters(
+                    "comments", "Встроить последние комментарии."
+                ),
             ),
             create=extend_schema(
                 summary="Добавление нового отзыва",
@@ -145,10 +265,16 @@ class CommentViewExtension(OpenApiViewExtension):
             list=extend_schema(
                 summary="Получение списка всех комментариев к отзыву",
                 description="Получить список всех комментариев к отзыву по id.",
+                parameters=sparse_parameters(
+                    "review", "Встроить отзыв комментария."
+                ),
             ),
             retrieve=extend_schema(
                 summary="Получение комментария к отзыву",
                 description="Получить комментарий для отзыва по id.",
+                parameters=sparse_parameters(
+                    "review", "Встроить отзыв комментария."
+                ),
             ),
             create=extend_schema(
                 summary="Добавление комментария к отзыву",
@@ -228,7 +354,10 @@ class SendConfirmCodeViewExtension(OpenApiViewExtension):
             description=(
                 "Получить код подтверждения на переданный `email`.\n\n"
                 "Права доступа: **Доступно без токена**.\n\n"
-                "Поле `email` должно быть уникальным."
+                "Поле `email` должно быть уникальным. Пока действует "
+                "отправленный код, повторное письмо не отправляется.\n\n"
+                "Частота запросов ограничена для IP-адреса и `email`: "
+                "при превышении ответ 429 с заголовком `Retry-After`."
             ),
         )
         class Fixed(self.target_class):
@@ -246,10 +375,107 @@ class GetTokenViewExtension(OpenApiViewExtension):
             summary="Получение JWT-токена",
             description=(
                 "Получение JWT-токена в обмен на `email` и `confirmation_code`.\n\n"
-                "Права доступа: **Доступно без токена**."
+                "Права доступа: **Доступно без токена**.\n\n"
+                "Частота запросов ограничена для IP-адреса и `email`: "
+                "при превышении ответ 429 с заголовком `Retry-After`."
             ),
         )
         class Fixed(self.target_class):
             pass
 
         return Fixed
+
+
+class ExportViewExtension(OpenApiViewExtension):
+    target_class = "api.views.export_views.ExportViewSet"
+    match_subclasses = True
+
+    def view_replacement(self):
+        target = self.target
+
+        @extend_schema(tags=["EXPORT"])
+        @extend_schema_view(
+            list=extend_schema(
+                summary=target.__doc__.strip().rstrip("."),
+                description=(
+                    "Потоковая выгрузка для администраторов "
+                    "в NDJSON или CSV (`format=csv`)."
+                ),
+                parameters=[
+                    OpenApiParameter(
+                        "since",
+                        OpenApiTypes.DATETIME,
+                        description="Записи не раньше указанного времени.",
+                    )
+                ]
+                if target.since_field
+                else [],
+                responses={
+                    (200, renderer.media_type): OpenApiTypes.STR
+                    for renderer in target.renderer_classes
+                },
+            ),
+        )
+        class Fixed(target):
+            queryset = target.queryset.none()
+
+        return Fixed
+
+
+class ChangeViewExtension(OpenApiViewExtension):
+    target_class = "api.views.export_views.ChangeViewSet"
+
+    def view_replacement(self):
+        @extend_schema(tags=["EXPORT"])
+        @extend_schema_view(
+            list=extend_schema(
+                summary="Лента изменений каталога",
+                parameters=[
+                    OpenApiParameter(
+                        "resource",
+                        str,
+                        description="Ресурсы через запятую.",
+                    )
+                ],
+            ),
+        )
+        class Fixed(self.target_class):
+            pass
+
+        return Fixed
+
+
+class LeaderboardViewExtension(OpenApiViewExtension):
+    target_class = "api.views.leaderboard_views.LeaderboardViewSet"
+    match_subclasses = True
+
+    def view_replacement(self):
+        target = self.target
+
+        @extend_schema(tags=["LEADERBOARDS"])
+        @extend_schema_view(
+            list=extend_schema(
+                summary=target.__doc__.strip().rstrip("."),
+                description=(
+                    "Места пересчитываются фоновой задачей раз в минуту.\n\n"
+                    "Права доступа: **Доступно без токена**."
+                ),
+                parameters=[
+                    OpenApiParameter(
+                        "category", str, description="Слаг категории."
+                    ),
+                    OpenApiParameter("genre", str, description="Слаг жанра."),
+                    OpenApiParameter(
+                        "year", int, description="Год выпуска."
+                    ),
+                ],
+            ),
+        )
+        class Fixed(target):
+            pass
+
+        return Fixed
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    target_class = "api.authentication.CachedJWTAuthentication"
@@ -0,0 +1,209 @@
+from operator import itemgetter
+
+from api.fieldsets import EXPAND_LIMIT
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from rest_framework import serializers
+from reviews.models import Comment, Genre, Review
+
+# Поле DRF используется только для форматирования дат, чтобы учитывать
+# DATETIME_FORMAT и часовой пояс так же, как ModelSerializer.
+DATETIME_FIELD = serializers.DateTimeField()
+
+
+class ValuesSerializer:
+    """
+    Сериализатор списков только для чтения. Строки .values() собираются
+    в словари без полей DRF; результат совпадает с выводом
+    соответствующего ModelSerializer.
+
+    `fields` — поля ответа и поля .values(), нужные каждому из них;
+    `expandable` — встраиваемые данные и нужные им поля .values().
+    Значение поля берётся методом `get_<поле>` или из строки по имени,
+    встраиваемые данные — методом `expand_<имя>`.
+    """
+
+    fields = {}
+    expandable = {}
+
+    def __init__(self, rows, fields=None, expand=None):
+        self.rows = rows
+        self.names = fields or list(self.fields)
+        self.expand = expand or []
+        self.getters = [
+            (name, getattr(self, f"get_{name}", itemgetter(name)))
+            for name in self.names
+        ] + [(name, getattr(self, f"expand_{name}")) for name in self.expand]
+
+    @classmethod
+    def get_values(cls, fields=None, expand=None) -> list[str]:
+        """Поля .values()/.only() для запрошенных полей ответа."""
+        values = dict.fromkeys(["id"])
+        for name in fields or cls.fields:
+            values.update(dict.fromkeys(cls.fields[name]))
+        for name in expand or ():
+            values.update(dict.fromkeys(cls.expandable[name]))
+        return list(values)
+
+    def prepare(self, rows) -> None:
+        """Загрузка связанных данных для всех строк страницы."""
+
+    def to_representation(self, row):
+        return {name: getter(row) for name, getter in self.getters}
+
+    @property
+    def data(self):
+        rows = list(self.rows)
+        self.prepare(rows)
+        return [self.to_representation(row) for row in rows]
+
+
+class PostValuesSerializer(ValuesSerializer):
+    """Общие поля отзывов и комментариев."""
+
+    def get_author(self, row):
+        return row["author__username"]
+
+    def get_pub_date(self, row):
+        return DATETIME_FIELD.to_representation(row["pub_date"])
+
+
+class CommentValuesSerializer(PostValuesSerializer):
+    """Список комментариев в формате CommentSerializer."""
+
+    fields = {
+        "id": ("id",),
+        "text": ("text",),
+        "author": ("author__username",),
+        "pub_date": ("pub_date",),
+    }
+    expandable = {"review": ("review_id",)}
+
+    def prepare(self, rows):
+        if "review" in self.expand:
+            self.reviews = get_reviews({row["review_id"] for row in rows})
+
+    def expand_review(self, row):
+        return self.reviews.get(row["review_id"])
+
+
+class ReviewValuesSerializer(PostValuesSerializer):
+    """Список отзывов в формате ReviewSerializer."""
+
+    fields = {
+        "id": ("id",),
+        "text": ("text",),
+        "author": ("author__username",),
+        "score": ("score",),
+        "pub_date": ("pub_date",),
+    }
+    expandable = {"comments": ()}
+
+    def prepare(self, rows):
+        if "comments" in self.expand:
+            self.comments = get_latest_comments([row["id"] for row in rows])
+
+    def expand_comments(self, row):
+        return self.comments.get(row["id"], [])
+
+
+class TitleValuesSerializer(ValuesSerializer):
+    """Список произведений в формате TitleReadSerializer."""
+
+    fields = {
+        "id": ("id",),
+        "name": ("name",),
+        "year": ("year",),
+        "description": ("description",),
+        "category": ("category__name", "category__slug"),
+        "genre": (),
+        "rating": ("rating",),
+    }
+    expandable = {"reviews": ()}
+
+    def prepare(self, rows):
+        ids = [row["id"] for row in rows]
+        if "genre" in self.names:
+            self.genres = get_genres(ids)
+        if "reviews" in self.expand:
+            self.reviews = get_latest_reviews(ids)
+
+    def get_category(self, row):
+        if row["category__slug"] is None:
+            return None
+        return {"name": row["category__name"], "slug": row["category__slug"]}
+
+    def get_genre(self, row):
+        return self.genres.get(row["id"], [])
+
+    def expand_reviews(self, row):
+        return self.reviews.get(row["id"], [])
+
+
+def get_genres(title_ids) -> dict[int, list[dict]]:
+    """Жанры произведений одним запросом."""
+    genres = {}
+    if not title_ids:
+        return genres
+    rows = Genre.objects.filter(title__in=title_ids).values_list(
+        "title", "name", "slug"
+    )
+    for title_id, name, slug in rows:
+        genres.setdefault(title_id, []).append({"name": name, "slug": slug})
+    return genres
+
+
+def get_latest(queryset, parent: str, serializer_class, ids, limit):
+    """
+    Последние `limit` записей каждого из родителей `ids` одним запросом:
+    номер записи внутри родителя вычисляет оконная функция.
+    """
+    latest = {}
+    if not ids:
+        return latest
+    rows = (
+        queryset.filter(**{f"{parent}__in": ids})
+        .annotate(
+            position=Window(
+                RowNumber(),
+                partition_by=F(parent),
+                order_by=(F("pub_date").desc(), F("id").desc()),
+            )
+        )
+        .filter(position__lte=limit)
+        .order_by(parent, "-pub_date", "-id")
+        .values(parent, *serializer_class.get_values())
+    )
+    serializer = serializer_class(rows)
+    for row in rows:
+        latest.setdefault(row[parent], []).append(
+            serializer.to_representation(row)
+        )
+    return latest
+
+
+def get_latest_reviews(title_ids, limit=EXPAND_LIMIT):
+    return get_latest(
+        Review.objects, "title_id", ReviewValuesSerializer, title_ids, limit
+    )
+
+
+def get_latest_comments(review_ids, limit=EXPAND_LIMIT):
+    return get_latest(
+        Comment.objects,
+        "review_id",
+        CommentValuesSerializer,
+        review_ids,
+        limit,
+    )
+
+
+def get_reviews(review_ids) -> dict[int, dict]:
+    """Отзывы по id одним запросом."""
+    if not review_ids:
+        return {}
+    serializer = ReviewValuesSerializer(())
+    rows = Review.objects.filter(id__in=review_ids).values(
+        *ReviewValuesSerializer.get_values()
+    )
+    return {row["id"]: serializer.to_representation(row) for row in rows}
@@ -1,7 +1,47 @@
+from api.fieldsets import EXPAND_PARAM, FIELDS_PARAM, get_requested
+from api.serializers.read_serializers import (
+    get_latest_comments,
+    get_latest_reviews,
+    get_reviews,
+)
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 from rest_framework.generics import get_object_or_404
-from reviews.models import Category, Comment, Genre, Review, Title
+from rest_framework.permissions import SAFE_METHODS
+from reviews.models import (
+    Category,
+    Change,
+    Comment,
+    Genre,
+    LeaderboardEntry,
+    Review,
+    Title,
+)
+
+
+class SparseFieldsMixin:
+    """
+    На чтение поля ответа ограничиваются параметром `fields`,
+    параметр `expand` добавляет связанные данные из `expandable`,
+    которые возвращает метод `expand_<имя>`.
+    """
+
+    expandable = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        if request is None or request.method not in SAFE_METHODS:
+            return
+        fields = get_requested(request, FIELDS_PARAM, list(self.fields))
+        if fields is not None:
+            for name in set(self.fields).difference(fields):
+                self.fields.pop(name)
+        expand = get_requested(request, EXPAND_PARAM, self.expandable)
+        for name in expand or ():
+            self.fields[name] = serializers.SerializerMethodField(
+                method_name=f"expand_{name}"
+            )
 
 
 class CategorySerializer(serializers.ModelSerializer):
@@ -52,24 +92,81 @@ class TitleCreateSerializer(TitleBaseSerializer):
     pass
 
 
-class TitleReadSerializer(TitleBaseSerializer):
+def slug_does_not_exist(value):
+    return serializers.SlugRelatedField.default_error_messages[
+        "does_not_exist"
+    ].format(slug_name="slug", value=value)
+
+
+class TitleBulkSerializer(TitleBaseSerializer):
+    """
+    Элемент массового создания и обновления произведений.
+    Слаги проверяются по словарям `categories` и `genres` (слаг -> id)
+    из контекста, загруженным заранее для всего пакета; при обновлении
+    `id` проверяется по множеству `titles` и не должен повторяться
+    в пакете (множество `seen`), при создании он игнорируется.
+    """
+
+    id = serializers.IntegerField(required=False)
+    category = serializers.SlugField()
+    genre = serializers.ListField(child=serializers.SlugField())
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.context.get("titles") is None:
+            self.fields["id"].read_only = True
+
+    def validate_id(self, value):
+        if value not in self.context["titles"]:
+            raise ValidationError(
+                serializers.PrimaryKeyRelatedField.default_error_messages[
+                    "does_not_exist"
+                ].format(pk_value=value)
+            )
+        if value in self.context["seen"]:
+            raise ValidationError("Произведение повторяется в пакете.")
+        self.context["seen"].add(value)
+        return value
+
+    def validate_category(self, value):
+        if value not in self.context["categories"]:
+            raise ValidationError(slug_does_not_exist(value))
+        return value
+
+    def validate_genre(self, values):
+        errors = [
+            slug_does_not_exist(value)
+            for value in values
+            if value not in self.context["genres"]
+        ]
+        if errors:
+            raise ValidationError(errors)
+        return list(dict.fromkeys(values))
+
+
+class TitleReadSerializer(SparseFieldsMixin, TitleBaseSerializer):
     """Сериализатор для получения произведений."""
 
     category = CategorySerializer()
     genre = GenreSerializer(many=True)
-    rating = serializers.IntegerField(source="rating_avg", read_only=True)
+    rating = serializers.IntegerField(read_only=True)
+    expandable = ("reviews",)
 
     class Meta(TitleBaseSerializer.Meta):
         model = Title
         fields = TitleBaseSerializer.Meta.fields + ("rating",)
 
+    def expand_reviews(self, obj):
+        return get_latest_reviews([obj.pk]).get(obj.pk, [])
 
-class ReviewSerializer(serializers.ModelSerializer):
+
+class ReviewSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Сериализатор для создания и редактирования отзывов."""
 
     author = serializers.SlugRelatedField(
         slug_field="username", read_only=True
     )
+    expandable = ("comments",)
 
     class Meta:
         model = Review
@@ -103,15 +200,71 @@ class ReviewSerializer(serializers.ModelSerializer):
 
         return data
 
+    def expand_comments(self, obj):
+        return get_latest_comments([obj.pk]).get(obj.pk, [])
+
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Сериализатор для создания и редактирования комментариев на отзыв."""
 
     author = serializers.SlugRelatedField(
         slug_field="username", read_only=True
     )
+    expandable = ("review",)
 
     class Meta:
         model = Comment
         fields = ("id", "text", "author", "pub_date")
         read_only_fields = ("id", "pub_date")
+
+    def expand_review(self, obj):
+        return get_reviews([obj.review_id]).get(obj.review_id)
+
+
+class ChangeSerializer(serializers.ModelSerializer):
+    """Запись ленты изменений."""
+
+    class Meta:
+        model = Change
+        fields = (
+            "id",
+            "resource",
+            "object_id",
+            "parent_id",
+            "action",
+            "changed_at",
+        )
+
+
+class LeaderboardTitleSerializer(serializers.ModelSerializer):
+    """Произведение в рейтинге лучших."""
+
+    class Meta:
+        model = Title
+        fields = ("id", "name", "year", "rating", "reviews_count")
+
+
+class LeaderboardEntrySerializer(serializers.ModelSerializer):
+    """Место в рейтинге лучших произведений."""
+
+    title = LeaderboardTitleSerializer(read_only=True)
+
+    class Meta:
+        model = LeaderboardEntry
+        fields = ("position", "value", "title")
+
+
+class ScoreCountSerializer(serializers.Serializer):
+    """Количество отзывов с оценкой."""
+
+    score = serializers.IntegerField()
+    count = serializers.IntegerField()
+
+
+class TitleStatsSerializer(serializers.Serializer):
+    """Распределение оценок и статистика отзывов произведения."""
+
+    count = serializers.IntegerField()
+    mean = serializers.FloatField(allow_null=True)
+    median = serializers.FloatField(allow_null=True)
+    histogram = ScoreCountSerializer(many=True)
@@ -1,5 +1,9 @@
-from api.tasks import send_confirm_code
-from api.utils import verify_confirm_code
+from api.tasks import queue_confirm_code
+from api.utils import (
+    add_confirm_code_to_cache,
+    generation_confirm_code,
+    verify_confirm_code,
+)
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
@@ -13,9 +17,15 @@ class SendConfirmCodeSerializer(serializers.Serializer):
     email = serializers.EmailField(required=True)
 
     def save(self):
-        """Генерация код верификации и отправка пользователю на email."""
+        """
+        Генерация кода верификации и отправка пользователю на email.
+        Пока действует отправленный ранее код, новое письмо
+        не ставится в очередь.
+        """
         email = self.validated_data["email"]
-        send_confirm_code.delay(email)
+        confirm_code = generation_confirm_code()
+        if add_confirm_code_to_cache(email, confirm_code):
+            queue_confirm_code(email, confirm_code)
 
 
 class CustomGetTokenSerializer(serializers.Serializer):
@@ -40,9 +50,15 @@ class CustomGetTokenSerializer(serializers.Serializer):
         return attrs
 
     def save(self):
-        """Получаем или сохраняем пользователя и возвращаем его."""
+        """
+        Получаем пользователя или сохраняем нового и возвращаем его.
+        Для токена достаточно id: существующий пользователь читается
+        без остальных полей и без транзакции get_or_create.
+        """
         email = self.validated_data["email"]
-        user, _ = User.objects.get_or_create(email=email)
+        user = User.objects.filter(email=email).only("id").first()
+        if user is None:
+            user, _ = User.objects.get_or_create(email=email)
         return user
 
 
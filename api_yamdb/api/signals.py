@@ -0,0 +1,135 @@
+from api import response_cache
+from api.authentication import invalidate_user
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from reviews.models import (
+    Category,
+    Comment,
+    Genre,
+    GenreTitle,
+    Review,
+    Title,
+)
+from reviews.signals import (
+    data_imported,
+    leaderboards_refreshed,
+    ratings_rebuilt,
+    titles_saved,
+    trending_updated,
+)
+from users.models import User
+
+
+def invalidate(*namespaces: str) -> None:
+    """Инвалидация кеша ответов после фиксации транзакции."""
+    transaction.on_commit(
+        lambda: response_cache.bump_versions(*namespaces)
+    )
+
+
+@receiver(post_save, sender=Title)
+@receiver(post_delete, sender=Title)
+def title_changed(sender, instance, **kwargs):
+    invalidate(
+        response_cache.TITLES, response_cache.title_namespace(instance.pk)
+    )
+
+
+@receiver(post_save, sender=GenreTitle)
+@receiver(post_delete, sender=GenreTitle)
+def genre_title_changed(sender, instance, **kwargs):
+    if instance.title_id is not None:
+        invalidate(
+            response_cache.TITLES,
+            response_cache.title_namespace(instance.title_id),
+        )
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def review_changed(sender, instance, **kwargs):
+    invalidate(
+        response_cache.TITLES,
+        response_cache.title_namespace(instance.title_id),
+        response_cache.reviews_namespace(instance.title_id),
+        response_cache.review_namespace(instance.pk),
+    )
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def comment_changed(sender, instance, **kwargs):
+    invalidate(
+        response_cache.COMMENTS,
+        response_cache.comments_namespace(instance.review_id),
+        response_cache.comment_namespace(instance.pk),
+    )
+
+
+@receiver(post_save, sender=User)
+def author_changed(sender, instance, created, **kwargs):
+    if not created:
+        invalidate(response_cache.AUTHORS)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def title_genres_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        invalidate(
+            response_cache.TITLES, response_cache.title_namespace(instance.pk)
+        )
+    else:
+        invalidate(response_cache.TITLES, response_cache.TAXONOMY)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def category_changed(sender, instance, **kwargs):
+    invalidate(
+        response_cache.CATEGORIES,
+        response_cache.TITLES,
+        response_cache.TAXONOMY,
+    )
+
+
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+def genre_changed(sender, instance, **kwargs):
+    invalidate(
+        response_cache.GENRES, response_cache.TITLES, response_cache.TAXONOMY
+    )
+
+
+@receiver(titles_saved)
+def titles_bulk_saved(sender, titles, **kwargs):
+    invalidate(
+        response_cache.TITLES,
+        *(response_cache.title_namespace(title.pk) for title in titles),
+    )
+
+
+@receiver(ratings_rebuilt)
+@receiver(data_imported)
+def catalog_reloaded(sender, **kwargs):
+    # Общее пространство входит в ключи всех ответов: одно увеличение
+    # версии вместо версии каждого произведения.
+    invalidate(response_cache.CATALOG)
+
+
+@receiver(leaderboards_refreshed)
+def leaderboards_changed(sender, **kwargs):
+    invalidate(response_cache.LEADERBOARDS)
+
+
+@receiver(trending_updated)
+def trending_changed(sender, **kwargs):
+    invalidate(response_cache.TRENDING)
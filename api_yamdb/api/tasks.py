@@ -1,17 +1,68 @@
+from api.mail import (
+    DELIVERY_ERRORS,
+    confirm_code_message,
+    outbox_size,
+    pop_outbox,
+    push_outbox,
+    send_batch,
+)
 from api.utils import generation_confirm_code, save_confirm_code_in_cache
 from celery import shared_task
-from django.core.mail import send_mail
+from django.conf import settings
 
-from api_yamdb.settings import EMAIL_HOST_USER
 
-SENDER_EMAIL: str = EMAIL_HOST_USER
+@shared_task(
+    autoretry_for=DELIVERY_ERRORS,
+    retry_backoff=True,
+    retry_backoff_max=600,
+    max_retries=settings.EMAIL_MAX_RETRIES,
+)
+def send_confirm_code(
+    recipient_email: str, confirm_code: str | None = None
+) -> None:
+    """
+    Задача отправляет код подтверждения на email; при ошибке отправка
+    повторяется с экспоненциальной задержкой. Без переданного кода
+    генерирует новый и сохраняет его в кеше.
+    """
+    if confirm_code is None:
+        confirm_code = generation_confirm_code()
+        save_confirm_code_in_cache(recipient_email, confirm_code)
+    confirm_code_message(recipient_email, confirm_code).send()
 
 
 @shared_task
-def send_confirm_code(recipient_email: str) -> None:
-    """Задача генерирует код подтверждения и отправляет его на email."""
-    confirm_code = generation_confirm_code()
-    save_confirm_code_in_cache(recipient_email, confirm_code)
-    subject = "Ваш код подтверждения"
-    message = f"Ваш код подтверждения: {confirm_code}\n"
-    send_mail(subject, message, SENDER_EMAIL, [recipient_email])
+def flush_confirm_codes() -> int:
+    """
+    Задача отправляет накопленные коды пачкой через одно соединение.
+    Неотправленные письма повторяются задачей send_confirm_code,
+    при оставшихся в очереди кодах ставится следующая отправка.
+    Запускается и периодически (CELERY_BEAT_SCHEDULE), поэтому пустая
+    очередь не открывает соединение.
+    """
+    codes = pop_outbox(settings.EMAIL_BATCH_SIZE)
+    if not codes:
+        return 0
+    try:
+        failed = send_batch(codes)
+    except DELIVERY_ERRORS:
+        # Не удалось открыть соединение
+        failed = codes
+    finally:
+        if outbox_size():
+            flush_confirm_codes.delay()
+    for email, confirm_code in failed:
+        send_confirm_code.delay(email, confirm_code)
+    return len(codes) - len(failed)
+
+
+def queue_confirm_code(email: str, confirm_code: str) -> None:
+    """
+    Постановка кода в очередь пакетной отправки. Отправка планируется
+    первым кодом в пустой очереди и собирает коды, пришедшие за
+    EMAIL_BATCH_WINDOW секунд.
+    """
+    if push_outbox(email, confirm_code) == 1:
+        flush_confirm_codes.apply_async(
+            countdown=settings.EMAIL_BATCH_WINDOW
+        )
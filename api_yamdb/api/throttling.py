@@ -0,0 +1,126 @@
+import hashlib
+import math
+import time
+from collections.abc import Mapping
+
+from api.utils import get_redis_client, run_script
+from django.core.cache import cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+CACHE_PREFIX: str = "throttle"
+
+DURATIONS: dict[str, int] = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# Корзина хранится в хеше {tokens, ts}. Время берётся из Redis,
+# чтобы часы серверов приложения не влияли на пополнение.
+# Возвращается время ожидания в секундах строкой: целые числа Lua
+# при возврате из скрипта отбрасывают дробную часть.
+TOKEN_BUCKET_SCRIPT: str = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    """Разбор частоты DRF `<число>/<период>`, например `5/min`."""
+    num, period = rate.split("/")
+    return int(num), DURATIONS[period[0]]
+
+
+def take_token(key: str, rate: str) -> float:
+    """
+    Списание токена из корзины `key` ёмкостью `num` токенов, которая
+    пополняется на `num` токенов за период частоты `rate`.
+    Возвращает 0, если токен списан, иначе время ожидания в секундах.
+    В Redis корзина обновляется атомарно скриптом Lua.
+    """
+    num, duration = parse_rate(rate)
+    refill = num / duration
+    key = f"{CACHE_PREFIX}:{key}"
+    client, redis_key = get_redis_client(key)
+    if client is not None:
+        return float(
+            run_script(TOKEN_BUCKET_SCRIPT, client, redis_key, refill, num)
+        )
+    return local_take_token(key, refill, num)
+
+
+def local_take_token(key: str, refill: float, capacity: int) -> float:
+    """Корзина для остальных бэкендов кеша (неатомарно, для разработки)."""
+    now = time.time()
+    tokens, ts = cache.get(key, (capacity, now))
+    tokens = min(capacity, tokens + max(0, now - ts) * refill)
+    wait = 0
+    if tokens >= 1:
+        tokens -= 1
+    else:
+        wait = (1 - tokens) / refill
+    cache.set(key, (tokens, now), timeout=math.ceil(capacity / refill) + 1)
+    return wait
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Ограничение частоты запросов корзиной токенов в кеше.
+    Частота берётся из DEFAULT_THROTTLE_RATES по ключу
+    `<throttle_scope представления>_<scope>`; без частоты запросы
+    не ограничиваются. В отличие от SimpleRateThrottle, в кеше хранятся
+    два числа вместо истории запросов, а запросы после паузы
+    не накапливаются сверх ёмкости корзины.
+    """
+
+    scope: str = ""
+
+    def get_ident_key(self, request) -> str | None:
+        raise NotImplementedError(".get_ident_key() must be overridden")
+
+    def allow_request(self, request, view):
+        self.wait_time = 0
+        scope = f"{getattr(view, 'throttle_scope', '')}_{self.scope}"
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(scope)
+        ident = self.get_ident_key(request)
+        if rate is None or ident is None:
+            return True
+        self.wait_time = take_token(f"{scope}:{ident}", rate)
+        return self.wait_time == 0
+
+    def wait(self):
+        return math.ceil(self.wait_time)
+
+
+class IPThrottle(TokenBucketThrottle):
+    """Ограничение по IP-адресу клиента."""
+
+    scope = "ip"
+
+    def get_ident_key(self, request):
+        return self.get_ident(request)
+
+
+class EmailThrottle(TokenBucketThrottle):
+    """Ограничение по адресу `email` из тела запроса."""
+
+    scope = "email"
+
+    def get_ident_key(self, request):
+        data = request.data
+        email = data.get("email") if isinstance(data, Mapping) else None
+        if not isinstance(email, str) or not email.strip():
+            return None
+        return hashlib.md5(email.strip().lower().encode()).hexdigest()
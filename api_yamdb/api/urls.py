@@ -1,3 +1,13 @@
+from api.views.export_views import (
+    ChangeViewSet,
+    CommentExportViewSet,
+    ReviewExportViewSet,
+    TitleExportViewSet,
+)
+from api.views.leaderboard_views import (
+    MostReviewedViewSet,
+    TopRatedViewSet,
+)
 from api.views.review_views import (
     CategoryViewSet,
     CommentViewSet,
@@ -33,6 +43,28 @@ router_v1.register(
     basename="comments",
 )
 
+# export
+router_v1.register(
+    "export/titles", TitleExportViewSet, basename="export-titles"
+)
+router_v1.register(
+    "export/reviews", ReviewExportViewSet, basename="export-reviews"
+)
+router_v1.register(
+    "export/comments", CommentExportViewSet, basename="export-comments"
+)
+router_v1.register("changes", ChangeViewSet, basename="changes")
+
+# leaderboards
+router_v1.register(
+    "leaderboards/rating", TopRatedViewSet, basename="leaderboards-rating"
+)
+router_v1.register(
+    "leaderboards/reviews",
+    MostReviewedViewSet,
+    basename="leaderboards-reviews",
+)
+
 # authentication
 auth_urls = [
     path(
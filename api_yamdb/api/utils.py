@@ -1,32 +1,154 @@
 import random
 
 from django.conf import settings
-from django.core.cache import cache
+from django.core.cache import cache, caches
+from django.core.cache.backends.redis import RedisCache
 
 CACHE_KEY: str = settings.CACHE_KEY_CONFIRM_CODE
 CACHE_TIMEOUT: int = settings.CACHE_TIMEOUT
 
 
+def get_redis_client(key: str):
+    """
+    Клиент Redis кеша по умолчанию и полный ключ кеша для прямых команд
+    Redis. Для других бэкендов кеша возвращает (None, None).
+    """
+    # `cache` — прокси, проверяется сам бэкенд кеша
+    backend = caches["default"]
+    if not isinstance(backend, RedisCache):
+        return None, None
+    key = backend.make_and_validate_key(key)
+    return backend._cache.get_client(key, write=True), key
+
+
 def generation_confirm_code() -> str:
     """Генерация 6 значного кода верификации."""
     return str(random.randint(111111, 999999))
 
 
+def confirm_code_key(email: str) -> str:
+    return f"{CACHE_KEY}_{email}"
+
+
+def confirm_code_fails_key(email: str) -> str:
+    """Счётчик неверных попыток для бэкендов кеша кроме Redis."""
+    return f"{confirm_code_key(email)}:fails"
+
+
+# В Redis код хранится хешем {code, fails}: проверка, удаление
+# использованного кода и подсчёт неудачных попыток выполняются
+# одним скриптом за одно обращение.
+ADD_CODE_SCRIPT: str = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'code', ARGV[1], 'fails', 0)
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+VERIFY_CODE_SCRIPT: str = """
+local code = redis.call('HGET', KEYS[1], 'code')
+if not code then
+    return 0
+end
+if code == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return 1
+end
+if redis.call('HINCRBY', KEYS[1], 'fails', 1) >= tonumber(ARGV[2]) then
+    redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+_scripts: dict = {}
+
+
+def run_script(script: str, client, key: str, *args):
+    if script not in _scripts:
+        _scripts[script] = client.register_script(script)
+    return _scripts[script](keys=[key], args=args, client=client)
+
+
 def save_confirm_code_in_cache(email: str, confirm_code: str) -> None:
     """Сохранение кода подтверждения в кеше."""
-    cache.set(f"{CACHE_KEY}_{email}", confirm_code, timeout=CACHE_TIMEOUT)
+    client, key = get_redis_client(confirm_code_key(email))
+    if client is None:
+        cache.set(confirm_code_key(email), confirm_code, timeout=CACHE_TIMEOUT)
+        cache.delete(confirm_code_fails_key(email))
+        return
+    with client.pipeline(transaction=True) as pipe:
+        pipe.delete(key)
+        pipe.hset(key, mapping={"code": confirm_code, "fails": 0})
+        pipe.expire(key, CACHE_TIMEOUT)
+        pipe.execute()
 
 
-def get_confirm_code_from_cache(email: str) -> str:
+def add_confirm_code_to_cache(email: str, confirm_code: str) -> bool:
+    """
+    Сохранение кода подтверждения, если в кеше нет действующего кода.
+    Возвращает False, если код уже был отправлен и ещё не истёк.
+    """
+    client, key = get_redis_client(confirm_code_key(email))
+    if client is None:
+        added = cache.add(
+            confirm_code_key(email), confirm_code, timeout=CACHE_TIMEOUT
+        )
+        if added:
+            cache.delete(confirm_code_fails_key(email))
+        return added
+    return bool(
+        run_script(ADD_CODE_SCRIPT, client, key, confirm_code, CACHE_TIMEOUT)
+    )
+
+
+def get_confirm_code_from_cache(email: str) -> str | None:
     """Получение кода подтверждения из кеша."""
-    confirm_code = cache.get(f"{CACHE_KEY}_{email}")
-    return confirm_code
+    client, key = get_redis_client(confirm_code_key(email))
+    if client is None:
+        return cache.get(confirm_code_key(email))
+    confirm_code = client.hget(key, "code")
+    return confirm_code.decode() if confirm_code is not None else None
+
+
+def delete_confirm_code_from_cache(email: str) -> None:
+    """Удаление кода подтверждения из кеша."""
+    cache.delete_many(
+        [confirm_code_key(email), confirm_code_fails_key(email)]
+    )
 
 
 def verify_confirm_code(email: str, confirm_code: str) -> bool:
     """
     Верификация кода подтверждения из кеша с кодом предоставленным
-    пользователем.
+    пользователем. Верный код удаляется и не может быть использован
+    повторно; после CONFIRM_CODE_MAX_ATTEMPTS неверных попыток
+    удаляется и код, нужно запросить новый.
     """
-    cache_confirm_code = get_confirm_code_from_cache(email)
-    return cache_confirm_code == confirm_code
+    max_attempts = settings.CONFIRM_CODE_MAX_ATTEMPTS
+    client, key = get_redis_client(confirm_code_key(email))
+    if client is not None:
+        return bool(
+            run_script(
+                VERIFY_CODE_SCRIPT, client, key, confirm_code, max_attempts
+            )
+        )
+    # Для других бэкендов кеша код тратит только запрос, который его
+    # удалил: delete() возвращает False, если код уже удалён другим
+    # запросом. Код не перезаписывается при неверной попытке, поэтому
+    # использованный код не может появиться в кеше снова.
+    key = confirm_code_key(email)
+    stored = cache.get(key)
+    if stored is None:
+        return False
+    if stored == confirm_code:
+        return cache.delete(key)
+    fails_key = confirm_code_fails_key(email)
+    cache.add(fails_key, 0, timeout=CACHE_TIMEOUT)
+    try:
+        fails = cache.incr(fails_key)
+    except ValueError:
+        # Счётчик истёк вместе с кодом
+        return False
+    if fails >= max_attempts:
+        cache.delete(key)
+    return False
@@ -0,0 +1,189 @@
+from itertools import islice
+
+from api.filters import TitleFilter
+from api.pagination import ChangeFeedPagination
+from api.permissions import IsAdminOrSuperuser
+from api.renderers import CSVRenderer, NDJSONRenderer
+from api.serializers.read_serializers import DATETIME_FIELD, get_genres
+from api.serializers.review_serializers import ChangeSerializer
+from django.http import StreamingHttpResponse
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import mixins, serializers, viewsets
+from rest_framework.exceptions import ValidationError
+from reviews.models import Change, Comment, Review, Title
+from reviews.services import settled_id
+
+
+def batched(iterable, size):
+    """Разбиение итератора на списки по `size` элементов."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class ExportViewSet(viewsets.GenericViewSet):
+    """
+    Потоковая выгрузка таблицы для администраторов в NDJSON (по умолчанию)
+    или CSV (`?format=csv`). Строки читаются курсором на сервере пачками
+    по `chunk_size` и сразу отправляются клиенту, поэтому расход памяти
+    не зависит от размера таблицы.
+
+    `export_fields` — поля выгрузки и поля .values() для них
+    (None для полей, которые заполняет `prepare`).
+    Параметр `since` оставляет записи, изменённые не раньше
+    переданного времени.
+    """
+
+    permission_classes = [IsAdminOrSuperuser]
+    renderer_classes = (NDJSONRenderer, CSVRenderer)
+    pagination_class = None
+    export_fields = {}
+    datetime_fields = ("updated_at",)
+    since_field = "updated_at"
+    since_param = "since"
+    chunk_size = 2000
+
+    def get_since(self):
+        value = self.request.query_params.get(self.since_param)
+        if not value:
+            return None
+        if self.since_field is None:
+            raise ValidationError(
+                {self.since_param: ["Не поддерживается для этой выгрузки."]}
+            )
+        try:
+            return serializers.DateTimeField().to_internal_value(value)
+        except ValidationError as error:
+            raise ValidationError({self.since_param: error.detail})
+
+    def get_rows(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        since = self.get_since()
+        if since is not None:
+            queryset = queryset.filter(**{f"{self.since_field}__gte": since})
+        return (
+            queryset.order_by("pk")
+            .values(*filter(None, self.export_fields.values()))
+            .iterator(chunk_size=self.chunk_size)
+        )
+
+    def prepare(self, rows) -> list[dict]:
+        """Строки выгрузки из пачки строк .values()."""
+        return [
+            {
+                field: (
+                    DATETIME_FIELD.to_representation(row[key])
+                    if field in self.datetime_fields
+                    else row.get(key)
+                )
+                for field, key in self.export_fields.items()
+            }
+            for row in rows
+        ]
+
+    def list(self, request, *args, **kwargs):
+        renderer = request.accepted_renderer
+        chunks = map(self.prepare, batched(self.get_rows(), self.chunk_size))
+        response = StreamingHttpResponse(
+            renderer.stream(chunks, list(self.export_fields)),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.basename}.{renderer.format}"'
+        )
+        return response
+
+
+class TitleExportViewSet(ExportViewSet):
+    """Выгрузка произведений с рейтингом и жанрами."""
+
+    queryset = Title.objects.all()
+    filter_backends = (DjangoFilterBackend,)
+    filterset_class = TitleFilter
+    export_fields = {
+        "id": "id",
+        "name": "name",
+        "year": "year",
+        "description": "description",
+        "category": "category__slug",
+        "genre": None,
+        "rating": "rating",
+        "updated_at": "updated_at",
+    }
+
+    def prepare(self, rows):
+        rows = super().prepare(rows)
+        genres = get_genres([row["id"] for row in rows])
+        for row in rows:
+            row["genre"] = [
+                genre["slug"] for genre in genres.get(row["id"], [])
+            ]
+        return rows
+
+
+class ReviewExportViewSet(ExportViewSet):
+    """Выгрузка отзывов."""
+
+    queryset = Review.objects.all()
+    export_fields = {
+        "id": "id",
+        "title": "title_id",
+        "text": "text",
+        "author": "author__username",
+        "score": "score",
+        "pub_date": "pub_date",
+        "updated_at": "updated_at",
+    }
+    datetime_fields = ("pub_date", "updated_at")
+
+
+class CommentExportViewSet(ExportViewSet):
+    """Выгрузка комментариев."""
+
+    queryset = Comment.objects.all()
+    export_fields = {
+        "id": "id",
+        "review": "review_id",
+        "text": "text",
+        "author": "author__username",
+        "pub_date": "pub_date",
+        "updated_at": "updated_at",
+    }
+    datetime_fields = ("pub_date", "updated_at")
+
+
+class ChangeViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    """
+    Лента изменений каталога для администраторов: записи журнала после
+    курсора `after` по возрастанию номера. Удалённые объекты приходят
+    с действием `delete`, после массовой загрузки — запись `reset`
+    без объекта. Параметр `resource` ограничивает ресурсы
+    (`resource=titles,reviews`). Записи выводятся с задержкой
+    COMMIT_LAG секунд, чтобы курсор не прошёл запись ещё
+    не зафиксированной транзакции.
+    """
+
+    queryset = Change.objects.all()
+    serializer_class = ChangeSerializer
+    pagination_class = ChangeFeedPagination
+    permission_classes = [IsAdminOrSuperuser]
+    resource_param = "resource"
+
+    def get_queryset(self):
+        queryset = self.queryset.filter(
+            pk__lte=settled_id(Change.objects.all(), "changed_at")
+        )
+        value = self.request.query_params.get(self.resource_param, "")
+        resources = {name.strip() for name in value.split(",")} - {""}
+        if not resources:
+            return queryset
+        unknown = resources.difference(Change.Resource.values)
+        if unknown:
+            raise ValidationError(
+                {
+                    self.resource_param: [
+                        f"Неизвестные ресурсы: {', '.join(sorted(unknown))}."
+                    ]
+                }
+            )
+        return queryset.filter(resource__in=resources)
@@ -0,0 +1,91 @@
+from api import response_cache
+from api.mixins import CachedResponseMixin
+from api.serializers.review_serializers import LeaderboardEntrySerializer
+from django.db.models import Subquery
+from rest_framework import mixins, viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+from reviews.models import Category, Genre, LeaderboardEntry
+
+Scope = LeaderboardEntry.Scope
+
+
+class LeaderboardViewSet(
+    CachedResponseMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
+    """
+    Рейтинг лучших произведений из таблицы мест, которую пересчитывает
+    фоновая задача: страница читается по индексу без агрегации.
+    Параметр `category` или `genre` (слаг) либо `year` выбирает раздел,
+    без параметров выводятся все произведения.
+    """
+
+    serializer_class = LeaderboardEntrySerializer
+    permission_classes = [AllowAny]
+    filter_backends = ()
+    cache_namespaces = (response_cache.LEADERBOARDS,)
+    kind = None
+    # Параметр запроса раздела и модель, id которой ищется по слагу
+    scope_params = {
+        Scope.CATEGORY: Category,
+        Scope.GENRE: Genre,
+        Scope.YEAR: None,
+    }
+
+    def get_scope(self):
+        """Раздел рейтинга и его ключ (значение или подзапрос)."""
+        params = self.request.query_params
+        requested = [scope for scope in self.scope_params if scope in params]
+        if not requested:
+            return Scope.ALL, 0
+        if len(requested) > 1:
+            raise ValidationError(
+                {
+                    requested[-1]: [
+                        "Раздел задаётся только одним параметром: "
+                        f"{', '.join(self.scope_params)}."
+                    ]
+                }
+            )
+        scope = requested[0]
+        value = params[scope]
+        model = self.scope_params[scope]
+        if model is not None:
+            return scope, Subquery(
+                model.objects.filter(slug=value).values("id")[:1]
+            )
+        try:
+            return scope, int(value)
+        except ValueError:
+            raise ValidationError({scope: ["Введите целое число."]})
+
+    def get_queryset(self):
+        scope, key = self.get_scope()
+        return (
+            LeaderboardEntry.objects.filter(
+                kind=self.kind, scope=scope, scope_key=key
+            )
+            .select_related("title")
+            .only(
+                "position",
+                "value",
+                "title__id",
+                "title__name",
+                "title__year",
+                "title__rating",
+                "title__reviews_count",
+            )
+            .order_by("position")
+        )
+
+
+class TopRatedViewSet(LeaderboardViewSet):
+    """Произведения с лучшим рейтингом."""
+
+    kind = LeaderboardEntry.Kind.RATING
+
+
+class MostReviewedViewSet(LeaderboardViewSet):
+    """Произведения с наибольшим количеством отзывов."""
+
+    kind = LeaderboardEntry.Kind.REVIEWS
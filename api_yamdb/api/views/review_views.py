@@ -1,42 +1,374 @@
-from api.filters import TitleFilter
-from api.mixins import CreateListDestroyViewSet
+from itertools import chain
+
+from api import response_cache
+from api.filters import TitleFilter, TitleOrderingFilter, TitleSearchFilter
+from api.mixins import (
+    CachedResponseMixin,
+    ConditionalResponseMixin,
+    CreateListDestroyViewSet,
+    ValuesListMixin,
+)
+from api.pagination import PageNumberOrCursorPagination
 from api.permissions import ISAdminAuthorOrSuperuser, ISAdminOnlyEdit
+from api.serializers.read_serializers import (
+    CommentValuesSerializer,
+    ReviewValuesSerializer,
+    TitleValuesSerializer,
+)
 from api.serializers.review_serializers import (
     CategorySerializer,
     CommentSerializer,
     GenreSerializer,
     ReviewSerializer,
+    TitleBulkSerializer,
     TitleCreateSerializer,
     TitleReadSerializer,
+    TitleStatsSerializer,
 )
-from django.db.models import Avg
-from django.shortcuts import get_object_or_404
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+from django.http import Http404
+from django.urls import reverse
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import filters, viewsets
-from reviews.models import Category, Genre, Review, Title
+from rest_framework import filters, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+from reviews.models import Category, Comment, Genre, Review, Title
+from reviews.services import save_titles, score_stats
+from reviews.signals import titles_saved
 
 
-class TitleViewSet(viewsets.ModelViewSet):
+class TitleViewSet(
+    CachedResponseMixin, ValuesListMixin, viewsets.ModelViewSet
+):
     """Класс представления произведений."""
 
-    queryset = (
-        Title.objects.select_related("category")
-        .prefetch_related("genre", "reviews")
-        .annotate(rating_avg=Avg("reviews__score"))
-    )
+    queryset = Title.objects.all()
     serializer_class = TitleCreateSerializer
-    filter_backends = (DjangoFilterBackend,)
+    values_serializer_class = TitleValuesSerializer
+    filter_backends = (
+        DjangoFilterBackend,
+        TitleSearchFilter,
+        TitleOrderingFilter,
+    )
     filterset_class = TitleFilter
     permission_classes = [ISAdminOnlyEdit]
+    pagination_class = PageNumberOrCursorPagination
+    cache_namespaces = (response_cache.TITLES,)
+    batch_param = "ids"
+    batch_limit = 200
+    bulk_limit = 1000
+
+    def get_queryset(self):
+        if self.action not in ("list", "retrieve", "batch"):
+            return self.queryset.prefetch_related("genre")
+        # Загружаем только поля, которые выводит TitleReadSerializer
+        # с учётом параметра `fields`.
+        fields = self.get_fields()
+        queryset = self.queryset.only(*self.get_projection())
+        if fields is None or "category" in fields:
+            queryset = queryset.select_related("category")
+        if fields is None or "genre" in fields:
+            queryset = queryset.prefetch_related(
+                Prefetch("genre", queryset=Genre.objects.only("name", "slug"))
+            )
+        return queryset
+
+    @property
+    def cursor_ordering(self):
+        """Порядок вывода по курсору следует параметру `ordering`."""
+        request = getattr(self, "request", None)
+        ordering = request and TitleOrderingFilter.get_ordering(request)
+        return ordering or TitleOrderingFilter.orderings["name"]
 
     def get_serializer_class(self):
-        if self.action in ("list", "retrieve"):
+        if self.action in ("list", "retrieve", "batch"):
             return TitleReadSerializer
+        if self.action == "bulk":
+            return TitleBulkSerializer
+        if self.action == "stats":
+            return TitleStatsSerializer
 
         return self.serializer_class
 
+    def get_cache_namespaces(self):
+        if self.action == "retrieve":
+            return self.get_title_namespaces(self.kwargs["pk"])
+        if self.action == "stats":
+            return (response_cache.title_namespace(self.kwargs["pk"]),)
+        namespaces = super().get_cache_namespaces()
+        if self.get_expand():
+            # Встроенные отзывы содержат имена авторов.
+            namespaces += (response_cache.AUTHORS,)
+        if (
+            TitleOrderingFilter.get_ordering_name(self.request)
+            == TitleOrderingFilter.TRENDING
+        ):
+            namespaces += (response_cache.TRENDING,)
+        return namespaces
+
+    def get_title_namespaces(self, pk):
+        """Пространства версий ответа на запрос одного произведения."""
+        namespaces = (
+            response_cache.title_namespace(pk),
+            response_cache.TAXONOMY,
+        )
+        if self.get_expand():
+            namespaces += (response_cache.AUTHORS,)
+        return namespaces
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+    def get_batch_ids(self) -> list[int]:
+        """Id произведений из параметра `ids` без повторов."""
+        value = self.request.query_params.get(self.batch_param, "")
+        try:
+            ids = [int(item) for item in value.split(",") if item.strip()]
+        except ValueError:
+            raise ValidationError(
+                {self.batch_param: ["Ожидаются целые числа через запятую."]}
+            )
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            raise ValidationError({self.batch_param: ["Обязательное поле."]})
+        if len(ids) > self.batch_limit:
+            raise ValidationError(
+                {
+                    self.batch_param: [
+                        f"Не более {self.batch_limit} произведений."
+                    ]
+                }
+            )
+        return ids
+
+    def get_batch_cache_keys(self, ids) -> dict[int, str]:
+        """
+        Ключи кеша ответов на запросы отдельных произведений
+        с теми же параметрами `fields` и `expand`.
+        """
+        params = self.request.query_params.copy()
+        params.pop(self.batch_param, None)
+        namespaces = {
+            pk: (response_cache.CATALOG, *self.get_title_namespaces(pk))
+            for pk in ids
+        }
+        unique = list(dict.fromkeys(chain.from_iterable(namespaces.values())))
+        versions = dict(zip(unique, response_cache.get_state(unique)[0]))
+        return {
+            pk: response_cache.make_url_key(
+                self.request.build_absolute_uri(
+                    reverse("api:titles-detail", args=[pk])
+                ),
+                params,
+                [versions[namespace] for namespace in namespaces[pk]],
+            )
+            for pk in ids
+        }
+
+    @action(detail=False, url_path="batch")
+    def batch(self, request):
+        """
+        Произведения по списку id. Ответы берутся из кеша отдельных
+        произведений, остальные выбираются одним запросом и сохраняются
+        в тот же кеш. Ненайденные id перечисляются в `missing`.
+        """
+        ids = self.get_batch_ids()
+        fields, expand = self.get_fields(), self.get_expand()
+        use_cache = (
+            not request.user.is_authenticated and response_cache.is_enabled()
+        )
+        keys, found = {}, {}
+        if use_cache:
+            keys = self.get_batch_cache_keys(ids)
+            cached = cache.get_many(keys.values())
+            found = {
+                pk: cached[key] for pk, key in keys.items() if key in cached
+            }
+        fresh = {}
+        uncached = [pk for pk in ids if pk not in found]
+        if uncached:
+            serializer_class = self.values_serializer_class
+            rows = list(
+                self.get_queryset()
+                .prefetch_related(None)
+                .filter(pk__in=uncached)
+                .order_by()
+                .values(*serializer_class.get_values(fields, expand))
+            )
+            data = serializer_class(rows, fields, expand).data
+            fresh = {row["id"]: item for row, item in zip(rows, data)}
+        if use_cache:
+            response_cache.count(response_cache.HITS_KEY, len(found))
+            response_cache.count(response_cache.MISSES_KEY, len(uncached))
+            cache.set_many(
+                {keys[pk]: item for pk, item in fresh.items()},
+                timeout=settings.RESPONSE_CACHE_TIMEOUT,
+            )
+        found.update(fresh)
+        return Response(
+            {
+                "results": [found[pk] for pk in ids if pk in found],
+                "missing": [pk for pk in ids if pk not in found],
+            }
+        )
 
-class CategoryViewSet(CreateListDestroyViewSet):
+    @action(detail=True, url_path="stats")
+    def stats(self, request, pk=None):
+        """
+        Распределение оценок, количество, среднее и медиана оценок
+        произведения по хранимым счётчикам, без агрегации отзывов.
+        """
+        return self.conditional_response(self.get_stats, request, pk=pk)
+
+    def get_stats(self, request, pk=None):
+        histogram = get_object_or_404(
+            Title.objects.values_list(*Title.SCORE_FIELDS), pk=pk
+        )
+        serializer = self.get_serializer(
+            {
+                **score_stats(histogram),
+                "histogram": [
+                    {"score": score, "count": count}
+                    for score, count in enumerate(histogram, start=1)
+                ],
+            }
+        )
+        return Response(serializer.data)
+
+    def get_bulk_context(self, items, upsert: bool) -> dict:
+        """
+        Контекст TitleBulkSerializer: слаги категорий и жанров и id
+        существующих произведений всего пакета, по запросу на модель.
+        """
+        items = [item for item in items if isinstance(item, dict)]
+        category_slugs = {
+            item.get("category")
+            for item in items
+            if isinstance(item.get("category"), str)
+        }
+        genre_slugs = {
+            slug
+            for item in items
+            if isinstance(item.get("genre"), list)
+            for slug in item["genre"]
+            if isinstance(slug, str)
+        }
+        context = {
+            "request": self.request,
+            "categories": dict(
+                Category.objects.filter(slug__in=category_slugs)
+                .order_by()
+                .values_list("slug", "id")
+            ),
+            "genres": dict(
+                Genre.objects.filter(slug__in=genre_slugs)
+                .order_by()
+                .values_list("slug", "id")
+            ),
+            "titles": None,
+            "seen": set(),
+        }
+        if upsert:
+            ids = set()
+            for item in items:
+                try:
+                    ids.add(int(item.get("id")))
+                except (TypeError, ValueError):
+                    continue
+            context["titles"] = set(
+                Title.objects.filter(pk__in=ids).values_list("id", flat=True)
+            )
+        return context
+
+    @action(methods=["POST", "PUT"], detail=False, url_path="bulk")
+    def bulk(self, request):
+        """
+        Массовое создание (POST) и создание или обновление по `id` (PUT)
+        произведений. Ошибочные элементы не прерывают запись остальных,
+        результат каждого элемента возвращается в порядке запроса.
+        """
+        items = request.data
+        if not isinstance(items, list) or not items:
+            raise ValidationError(
+                {"non_field_errors": ["Ожидается непустой список."]}
+            )
+        if len(items) > self.bulk_limit:
+            raise ValidationError(
+                {
+                    "non_field_errors": [
+                        f"Не более {self.bulk_limit} произведений."
+                    ]
+                }
+            )
+        context = self.get_bulk_context(items, request.method == "PUT")
+        item_serializers = [
+            TitleBulkSerializer(data=item, context=context) for item in items
+        ]
+        valid = [
+            serializer for serializer in item_serializers
+            if serializer.is_valid()
+        ]
+        titles = save_titles(
+            {
+                "id": serializer.validated_data.get("id"),
+                "name": serializer.validated_data["name"],
+                "year": serializer.validated_data["year"],
+                "description": serializer.validated_data.get("description"),
+                "category_id": context["categories"][
+                    serializer.validated_data["category"]
+                ],
+                "genre_ids": [
+                    context["genres"][slug]
+                    for slug in serializer.validated_data["genre"]
+                ],
+            }
+            for serializer in valid
+        )
+        if titles:
+            titles_saved.send(sender=self.__class__, titles=titles)
+        saved = {
+            serializer: (title, "id" not in serializer.validated_data)
+            for serializer, title in zip(valid, titles)
+        }
+        results = []
+        for serializer in item_serializers:
+            if serializer not in saved:
+                results.append(
+                    {
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "errors": serializer.errors,
+                    }
+                )
+                continue
+            title, created = saved[serializer]
+            results.append(
+                {
+                    "status": (
+                        status.HTTP_201_CREATED
+                        if created
+                        else status.HTTP_200_OK
+                    ),
+                    "data": serializer.to_representation(
+                        {**serializer.validated_data, "id": title.pk}
+                    ),
+                }
+            )
+        if len(valid) < len(item_serializers):
+            response_status = status.HTTP_207_MULTI_STATUS
+        elif request.method == "POST":
+            response_status = status.HTTP_201_CREATED
+        else:
+            response_status = status.HTTP_200_OK
+        return Response({"results": results}, status=response_status)
+
+
+class CategoryViewSet(CachedResponseMixin, CreateListDestroyViewSet):
     """Класс представления категорий произведений."""
 
     queryset = Category.objects.all()
@@ -45,9 +377,10 @@ class CategoryViewSet(CreateListDestroyViewSet):
     search_fields = ("name",)
     lookup_field = "slug"
     permission_classes = [ISAdminOnlyEdit]
+    cache_namespaces = (response_cache.CATEGORIES,)
 
 
-class GenreViewSet(CreateListDestroyViewSet):
+class GenreViewSet(CachedResponseMixin, CreateListDestroyViewSet):
     """Класс представления жанров произведений."""
 
     queryset = Genre.objects.all()
@@ -56,41 +389,102 @@ class GenreViewSet(CreateListDestroyViewSet):
     search_fields = ("name",)
     lookup_field = "slug"
     permission_classes = [ISAdminOnlyEdit]
+    cache_namespaces = (response_cache.GENRES,)
 
 
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(
+    ConditionalResponseMixin, ValuesListMixin, viewsets.ModelViewSet
+):
     """Отзывы."""
 
+    pagination_class = PageNumberOrCursorPagination
+    cursor_ordering = ("-pub_date", "-id")
     serializer_class = ReviewSerializer
+    values_serializer_class = ReviewValuesSerializer
     permission_classes = [ISAdminAuthorOrSuperuser]
 
     def get_queryset(self):
         title_id = self.kwargs.get("title_id")
-        title = get_object_or_404(
-            Title.objects.prefetch_related("reviews__author"),
-            pk=title_id,
+        if not Title.objects.filter(pk=title_id).exists():
+            raise Http404
+        queryset = Review.objects.filter(title_id=title_id)
+        if self.action not in ("list", "retrieve"):
+            return queryset.select_related("author")
+        return self.only_requested(queryset)
+
+    def get_cache_namespaces(self):
+        title_id = self.kwargs.get("title_id")
+        expand = self.get_expand()
+        if self.action == "retrieve":
+            namespaces = (
+                response_cache.review_namespace(self.kwargs["pk"]),
+                response_cache.AUTHORS,
+            )
+            if expand:
+                namespaces += (
+                    response_cache.comments_namespace(self.kwargs["pk"]),
+                )
+            return namespaces
+        namespaces = (
+            response_cache.title_namespace(title_id),
+            response_cache.reviews_namespace(title_id),
+            response_cache.AUTHORS,
+        )
+        if expand:
+            namespaces += (response_cache.COMMENTS,)
+        return namespaces
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().retrieve, request, *args, **kwargs
         )
-        return title.reviews.all()
 
     def perform_create(self, serializer):
         serializer.save(author=self.request.user)
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(
+    ConditionalResponseMixin, ValuesListMixin, viewsets.ModelViewSet
+):
     """Комментарии."""
 
+    pagination_class = PageNumberOrCursorPagination
+    cursor_ordering = ("-pub_date", "-id")
     serializer_class = CommentSerializer
+    values_serializer_class = CommentValuesSerializer
     permission_classes = [ISAdminAuthorOrSuperuser]
 
     def get_queryset(self):
         review_id = self.kwargs.get("review_id")
         title_id = self.kwargs.get("title_id")
-        review = get_object_or_404(
-            Review.objects.prefetch_related("comments__author"),
-            pk=review_id,
-            title_id=title_id,
+        review = Review.objects.filter(pk=review_id, title_id=title_id)
+        if not review.exists():
+            raise Http404
+        queryset = Comment.objects.filter(review_id=review_id)
+        if self.action not in ("list", "retrieve"):
+            return queryset.select_related("author")
+        return self.only_requested(queryset)
+
+    def get_cache_namespaces(self):
+        review_id = self.kwargs.get("review_id")
+        if self.action == "retrieve":
+            namespaces = (
+                response_cache.comment_namespace(self.kwargs["pk"]),
+                response_cache.AUTHORS,
+            )
+            if self.get_expand():
+                namespaces += (response_cache.review_namespace(review_id),)
+            return namespaces
+        return (
+            response_cache.review_namespace(review_id),
+            response_cache.comments_namespace(review_id),
+            response_cache.AUTHORS,
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().retrieve, request, *args, **kwargs
         )
-        return review.comments.all()
 
     def perform_create(self, serializer):
         title_id = self.kwargs.get("title_id")
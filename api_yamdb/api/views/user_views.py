@@ -4,6 +4,7 @@ from api.serializers.user_serializers import (
     SendConfirmCodeSerializer,
     UserSerializer,
 )
+from api.throttling import EmailThrottle, IPThrottle
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.shortcuts import get_object_or_404
@@ -23,6 +24,8 @@ class SendConfirmCodeViewSet(APIView):
 
     permission_classes = [AllowAny]
     serializer_class = SendConfirmCodeSerializer
+    throttle_classes = [IPThrottle, EmailThrottle]
+    throttle_scope = "send_confirm_code"
 
     def post(self, request):
         serializer = self.serializer_class(data=request.data)
@@ -45,6 +48,8 @@ class GetTokenViewSet(APIView):
 
     permission_classes = [AllowAny]
     serializer_class = CustomGetTokenSerializer
+    throttle_classes = [IPThrottle, EmailThrottle]
+    throttle_scope = "token"
 
     def post(self, request):
         serializer = self.serializer_class(data=request.data)
@@ -126,7 +126,7 @@ MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "api.authentication.CachedJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
@@ -134,10 +134,31 @@ REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "api.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 5,
     "DATETIME_FORMAT": "%Y-%m-%dT%H:%M:%SZ",
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # Корзины токенов для эндпоинтов аутентификации (api.throttling):
+    # ёмкость корзины и её пополнение за период
+    "DEFAULT_THROTTLE_RATES": {
+        "send_confirm_code_ip": "10/min",
+        "send_confirm_code_email": "3/min",
+        "token_ip": "20/min",
+        "token_email": "5/min",
+    },
+    # Количество прокси перед приложением (nginx): IP клиента берётся
+    # из адреса, который добавил последний прокси в X-Forwarded-For,
+    # а не из значений, переданных клиентом
+    "NUM_PROXIES": int(os.getenv("NUM_PROXIES", default="1")),
 }
 
 # Аутентификация Для тестирования SQL-запросов в debug_toolbar через браузер
@@ -186,11 +207,34 @@ EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 EMAIL_USE_TLS = False
 EMAIL_USE_SSL = True
+# Коды подтверждения отправляются пачками: окно накопления в секундах,
+# наибольший размер пачки и число повторов письма при ошибке отправки
+EMAIL_BATCH_WINDOW = 2
+EMAIL_BATCH_SIZE = 100
+EMAIL_MAX_RETRIES = 5
 
 
 # Celery settings with Redis
 CELERY_BROKER_URL = os.getenv("REDIS_SERVER")
 CELERY_RESULT_BACKEND = os.getenv("REDIS_SERVER")
+# Периодические задачи (celery beat)
+CELERY_BEAT_SCHEDULE = {
+    "refresh-leaderboards": {
+        "task": "reviews.tasks.refresh_leaderboards",
+        "schedule": 60,
+    },
+    "update-trending": {
+        "task": "reviews.tasks.update_trending",
+        "schedule": 300,
+    },
+    # Отправка планируется только первым кодом в пустой очереди; если эта
+    # задача потеряна (сбой брокера или воркера), очередь разбирается
+    # периодическим запуском
+    "flush-confirm-codes": {
+        "task": "api.tasks.flush_confirm_codes",
+        "schedule": 60,
+    },
+}
 
 
 # Cache settings with Redis
@@ -205,6 +249,32 @@ CACHES = {
 CACHE_KEY_CONFIRM_CODE = "confirmation_code"
 # Время хранения кеша для кода верификации в секундах
 CACHE_TIMEOUT = 300
+# Число неверных попыток ввода, после которого код удаляется
+CONFIRM_CODE_MAX_ATTEMPTS = 5
+
+# Время хранения пользователя в кеше аутентификации по JWT в секундах
+AUTH_USER_CACHE_TIMEOUT = 300
+# Время хранения пользователя в локальном кеше процесса в секундах:
+# смена роли видна другим процессам не позже этого срока
+AUTH_USER_LOCAL_TIMEOUT = 5
+
+# Кеширование ответов на чтение каталога для анонимных пользователей
+RESPONSE_CACHE_ENABLED = (
+    os.getenv("RESPONSE_CACHE_ENABLED", default="True") == "True"
+)
+# Время хранения ответа в кеше в секундах
+RESPONSE_CACHE_TIMEOUT = 600
+
+# Наибольшая длительность транзакции записи в секундах. Лента изменений
+# читает только записи старше этого срока: номер записи назначается при
+# вставке, а транзакции фиксируются в другом порядке, и без задержки
+# курсор может пройти запись, которая станет видна позже
+COMMIT_LAG = 30
+
+# Количество мест в каждом рейтинге лучших произведений
+LEADERBOARD_SIZE = 100
+# Период полураспада вклада отзыва в популярность произведения, секунды
+TRENDING_HALF_LIFE = 24 * 60 * 60
 
 INTERNAL_IPS = ["127.0.0.1"]
 
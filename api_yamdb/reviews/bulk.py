@@ -0,0 +1,179 @@
+import io
+from contextlib import contextmanager
+
+from django.apps import apps
+from django.core.management.color import no_style
+from django.db import connections
+
+
+@contextmanager
+def keep_auto_now(model):
+    """Сохранение переданных дат вместо текущего времени (auto_now_add)."""
+    fields = [
+        field
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now_add", False)
+    ]
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+def csv_row(values) -> str:
+    """
+    Строка CSV для COPY: NULL записывается пустым полем без кавычек,
+    остальные значения — в кавычках, поэтому пустая строка остаётся
+    пустой строкой, а не NULL.
+    """
+    return (
+        ",".join(
+            ""
+            if value is None
+            else '"' + str(value).replace('"', '""') + '"'
+            for value in values
+        )
+        + "\n"
+    )
+
+
+class BulkWriter:
+    """
+    Массовая запись строк (словарей значений полей) в таблицу модели:
+    COPY FROM STDIN на PostgreSQL, bulk_create на остальных СУБД.
+    Сигналы моделей не отправляются.
+    """
+
+    def __init__(self, using: str):
+        self.using = using
+        self.connection = connections[using]
+
+    @property
+    def uses_copy(self) -> bool:
+        return self.connection.vendor == "postgresql"
+
+    def write(self, model, rows) -> None:
+        with keep_auto_now(model):
+            if self.uses_copy:
+                self.copy(model, rows)
+            else:
+                self.insert(model, rows)
+
+    def copy(self, model, rows) -> None:
+        """Запись строк командой COPY FROM STDIN (PostgreSQL)."""
+        connection = self.connection
+        fields = [
+            field
+            for field in model._meta.concrete_fields
+            if not field.generated
+        ]
+        buffer = io.StringIO()
+        for row in rows:
+            instance = model(**row)
+            buffer.write(
+                csv_row(
+                    field.get_db_prep_save(
+                        field.pre_save(instance, add=True), connection
+                    )
+                    for field in fields
+                )
+            )
+        buffer.seek(0)
+        columns = ", ".join(
+            connection.ops.quote_name(field.column) for field in fields
+        )
+        table = connection.ops.quote_name(model._meta.db_table)
+        sql = f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)"
+        with connection.cursor() as cursor:
+            if hasattr(cursor, "copy_expert"):
+                # psycopg2
+                cursor.copy_expert(sql, buffer)
+            else:
+                # psycopg 3
+                with cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+
+    def insert(self, model, rows) -> None:
+        model.objects.using(self.using).bulk_create(
+            [model(**row) for row in rows]
+        )
+
+    def get_dependents(self, models) -> list:
+        """
+        Модели вне `models`, таблицы которых ссылаются внешним ключом
+        на таблицы `models` напрямую или через другие зависимые таблицы.
+        """
+        referenced = set(models)
+        dependents = []
+        candidates = [
+            model
+            for model in apps.get_models(include_auto_created=True)
+            if model._meta.managed
+            and not model._meta.proxy
+            and model not in referenced
+        ]
+        found = True
+        while found:
+            found = False
+            for model in candidates:
+                if model in dependents:
+                    continue
+                if any(
+                    field.remote_field.model in referenced
+                    for field in model._meta.concrete_fields
+                    if field.is_relation and field.db_constraint
+                ):
+                    dependents.append(model)
+                    referenced.add(model)
+                    found = True
+        return dependents
+
+    def clear(self, models) -> None:
+        """
+        Удаление данных моделей, начиная с зависимых. Данные других
+        таблиц не удаляются: если на удаляемые строки ссылаются
+        непустые таблицы вне `models`, вызывается ValueError.
+        На PostgreSQL выполняется TRUNCATE без CASCADE; пустые зависимые
+        таблицы перечисляются в нём же, иначе PostgreSQL его отклонит.
+        На остальных СУБД — DELETE на таблицу без сигналов моделей.
+        """
+        dependents = self.get_dependents(models)
+        filled = [
+            model._meta.db_table
+            for model in dependents
+            if model._default_manager.using(self.using).exists()
+        ]
+        if filled:
+            raise ValueError(
+                "На удаляемые данные ссылаются таблицы: "
+                + ", ".join(filled)
+                + "."
+            )
+        if self.uses_copy:
+            tables = ", ".join(
+                self.connection.ops.quote_name(model._meta.db_table)
+                for model in [*models, *dependents]
+            )
+            with self.connection.cursor() as cursor:
+                # TRUNCATE отклоняется, пока в транзакции есть
+                # неотработавшие отложенные проверки внешних ключей
+                cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+                cursor.execute(f"TRUNCATE {tables}")
+                cursor.execute("SET CONSTRAINTS ALL DEFERRED")
+            return
+        # Удаление одним запросом на таблицу, без сигналов моделей
+        for model in reversed(models):
+            queryset = model.objects.using(self.using).all()
+            queryset._raw_delete(queryset.db)
+
+    def reset_sequences(self, models) -> None:
+        """Сдвиг последовательностей id после записи с явными id."""
+        statements = self.connection.ops.sequence_reset_sql(
+            no_style(), models
+        )
+        with self.connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
@@ -0,0 +1,161 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+
+from .models import Change, GenreTitle, LeaderboardEntry, Title
+from .services import settled_id
+from .signals import leaderboards_refreshed
+
+Kind = LeaderboardEntry.Kind
+Scope = LeaderboardEntry.Scope
+
+# Номер последней учтённой записи журнала изменений
+CURSOR_KEY: str = "leaderboards:cursor"
+
+# Значение места и порядок произведений рейтинга;
+# при равенстве выше произведение с лучшим вторым показателем
+ORDERING = {
+    Kind.RATING: ("rating", ("-rating", "-reviews_count", "id")),
+    Kind.REVIEWS: ("reviews_count", ("-reviews_count", "-rating", "id")),
+}
+# Условие отбора произведений раздела; жанр проверяется через EXISTS:
+# соединение с GenreTitle повторило бы произведение для каждой связи
+SCOPE_FILTERS = {
+    Scope.ALL: lambda key: Q(),
+    Scope.CATEGORY: lambda key: Q(category_id=key),
+    Scope.GENRE: lambda key: Exists(
+        GenreTitle.objects.filter(title=OuterRef("pk"), genre_id=key)
+    ),
+    Scope.YEAR: lambda key: Q(year=key),
+}
+
+
+def rebuild_board(scope: str, key: int) -> None:
+    """Пересчёт обоих рейтингов раздела: LEADERBOARD_SIZE лучших мест."""
+    titles = Title.objects.filter(
+        SCOPE_FILTERS[scope](key), reviews_count__gt=0
+    )
+    entries = []
+    for kind, (value, ordering) in ORDERING.items():
+        top = titles.order_by(*ordering).values_list("id", value)
+        entries += [
+            LeaderboardEntry(
+                kind=kind,
+                scope=scope,
+                scope_key=key,
+                position=position,
+                title_id=title_id,
+                value=value,
+            )
+            for position, (title_id, value) in enumerate(
+                top[: settings.LEADERBOARD_SIZE], start=1
+            )
+        ]
+    with transaction.atomic():
+        LeaderboardEntry.objects.filter(scope=scope, scope_key=key).delete()
+        LeaderboardEntry.objects.bulk_create(entries)
+
+
+def all_boards() -> set[tuple[str, int]]:
+    titles = Title.objects.filter(reviews_count__gt=0).order_by()
+    return (
+        {(Scope.ALL, 0)}
+        | {
+            (Scope.CATEGORY, key)
+            for key in titles.exclude(category=None)
+            .values_list("category_id", flat=True)
+            .distinct()
+        }
+        | {
+            (Scope.GENRE, key)
+            for key in GenreTitle.objects.filter(title__in=titles)
+            .exclude(genre=None)
+            .values_list("genre_id", flat=True)
+            .distinct()
+        }
+        | {
+            (Scope.YEAR, key)
+            for key in titles.values_list("year", flat=True).distinct()
+        }
+    )
+
+
+def affected_boards(title_ids) -> set[tuple[str, int]]:
+    """
+    Разделы, в которые входят или входили произведения: по текущим
+    категории, жанрам и году и по уже записанным местам (произведение
+    удалено или перенесено в другой раздел).
+    """
+    boards = {(Scope.ALL, 0)}
+    titles = Title.objects.filter(pk__in=title_ids)
+    for category_id, year in titles.values_list("category_id", "year"):
+        boards.add((Scope.YEAR, year))
+        if category_id is not None:
+            boards.add((Scope.CATEGORY, category_id))
+    boards.update(
+        (Scope.GENRE, genre_id)
+        for genre_id in GenreTitle.objects.filter(title_id__in=title_ids)
+        .exclude(genre=None)
+        .values_list("genre_id", flat=True)
+    )
+    boards.update(
+        LeaderboardEntry.objects.filter(title_id__in=title_ids)
+        .values_list("scope", "scope_key")
+        .distinct()
+    )
+    return boards
+
+
+def get_changed_titles(cursor, last) -> list[int] | None:
+    """
+    id произведений, изменённых после записи журнала `cursor`,
+    или None, если нужен полный пересчёт: курсора нет, записи журнала
+    после него уже удалены или произведения загружены массово.
+    """
+    if cursor is None:
+        return None
+    first = Change.objects.values_list("id", flat=True).first()
+    if first is not None and first > cursor + 1:
+        return None
+    changes = Change.objects.filter(
+        resource=Change.Resource.TITLES, id__gt=cursor, id__lte=last
+    )
+    if changes.filter(action=Change.Action.RESET).exists():
+        return None
+    return [
+        int(object_id)
+        for object_id in changes.values_list("object_id", flat=True)
+        .order_by()
+        .distinct()
+    ]
+
+
+def refresh_leaderboards(full: bool = False) -> int:
+    """
+    Пересчёт рейтингов по журналу изменений: пересчитываются только
+    разделы произведений, изменённых с прошлого запуска. Курсор
+    доходит только до записей старше COMMIT_LAG секунд, чтобы
+    не пропустить записи ещё не зафиксированных транзакций. Возвращает
+    количество пересчитанных разделов.
+    """
+    cursor = cache.get(CURSOR_KEY)
+    last = max(settled_id(Change.objects.all(), "changed_at"), cursor or 0)
+    title_ids = None
+    if not full:
+        title_ids = get_changed_titles(cursor, last)
+    with transaction.atomic():
+        if title_ids is None:
+            # Полный пересчёт удаляет и разделы без произведений
+            LeaderboardEntry.objects.all().delete()
+            boards = all_boards()
+        else:
+            boards = affected_boards(title_ids) if title_ids else set()
+        for scope, key in sorted(boards):
+            rebuild_board(scope, key)
+    cache.set(CURSOR_KEY, last, timeout=None)
+    if boards:
+        leaderboards_refreshed.send(
+            sender=LeaderboardEntry, boards=len(boards)
+        )
+    return len(boards)
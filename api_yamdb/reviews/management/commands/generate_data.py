@@ -0,0 +1,283 @@
+import datetime as dt
+import random
+import time
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Max
+from reviews.bulk import BulkWriter
+from reviews.models import Category, Comment, Genre, GenreTitle, Review, Title
+from reviews.search import rebuild_search_index
+from reviews.services import rebuild_ratings
+from reviews.signals import data_imported
+
+User = get_user_model()
+
+# Модели в порядке зависимостей внешних ключей
+MODELS = (User, Category, Genre, Title, GenreTitle, Review, Comment)
+
+BATCH_SIZE = 5000
+
+WORDS = (
+    "тень", "ветер", "город", "ночь", "море", "звезда", "дорога", "сердце",
+    "огонь", "зима", "лето", "река", "небо", "песня", "время", "память",
+    "остров", "свет", "мир", "война", "любовь", "дом", "сад", "снег",
+    "последний", "тихий", "красный", "белый", "далёкий", "старый", "новый",
+    "тайный", "золотой", "ночной", "северный", "забытый", "вечный", "дикий",
+    "путь", "сон", "голос", "берег", "лес", "гора", "окно", "письмо",
+)
+CATEGORIES = ("Фильм", "Книга", "Музыка", "Сериал", "Игра", "Театр")
+ROLES = (
+    (User.Role.USER, 0.989),
+    (User.Role.MODERATOR, 0.01),
+    (User.Role.ADMIN, 0.001),
+)
+PERIOD = dt.timedelta(days=5 * 365)
+
+
+class Command(BaseCommand):
+    help = (
+        "Генерация воспроизводимого синтетического набора данных "
+        "заданного размера для нагрузочного тестирования."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--titles", type=int, default=1000)
+        parser.add_argument(
+            "--reviews",
+            type=int,
+            default=20000,
+            help="Примерное количество отзывов (не больше одного "
+            "отзыва пользователя на произведение).",
+        )
+        parser.add_argument("--comments", type=int, default=10000)
+        parser.add_argument("--categories", type=int, default=6)
+        parser.add_argument("--genres", type=int, default=30)
+        parser.add_argument(
+            "--skew",
+            type=float,
+            default=1.1,
+            help="Показатель распределения Ципфа популярности произведений.",
+        )
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Удалить существующие данные перед генерацией.",
+        )
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def zipf_weights(self, count: int):
+        """Веса Ципфа в случайном порядке: немногие элементы популярны."""
+        ranks = list(range(1, count + 1))
+        self.random.shuffle(ranks)
+        return [1 / rank**self.skew for rank in ranks]
+
+    def next_id(self, model) -> int:
+        last = (
+            model.objects.using(self.using)
+            .aggregate(last=Max("id"))["last"]
+        )
+        return (last or 0) + 1
+
+    def random_date(self):
+        return self.now - PERIOD * self.random.random()
+
+    def words(self, low: int, high: int) -> str:
+        count = self.random.randint(low, high)
+        return " ".join(self.random.choices(WORDS, k=count))
+
+    def users(self, count: int):
+        roles, weights = zip(*ROLES)
+        for user_id in range(self.first["user"], self.first["user"] + count):
+            yield {
+                "id": user_id,
+                "username": f"user{user_id}",
+                "email": f"user{user_id}@yamdb.fake",
+                "role": self.random.choices(roles, weights)[0],
+                "date_joined": self.random_date(),
+            }
+
+    def categories(self, count: int):
+        for index in range(count):
+            category_id = self.first["category"] + index
+            name = CATEGORIES[index % len(CATEGORIES)]
+            yield {
+                "id": category_id,
+                "name": f"{name} {category_id}",
+                "slug": f"category-{category_id}",
+            }
+
+    def genres(self, count: int):
+        for index in range(count):
+            genre_id = self.first["genre"] + index
+            yield {
+                "id": genre_id,
+                "name": f"{self.words(1, 2).capitalize()} {genre_id}",
+                "slug": f"genre-{genre_id}",
+            }
+
+    def titles(self, count: int, categories: int):
+        category_weights = self.zipf_weights(categories)
+        category_ids = range(
+            self.first["category"], self.first["category"] + categories
+        )
+        first = self.first["title"]
+        for title_id in range(first, first + count):
+            age = min(int(self.random.expovariate(1 / 15)), 120)
+            yield {
+                "id": title_id,
+                "name": self.words(1, 4).capitalize(),
+                "year": self.now.year - age,
+                "description": self.words(5, 30).capitalize(),
+                "category_id": self.random.choices(
+                    category_ids, category_weights
+                )[0],
+            }
+
+    def genre_titles(self, titles: int, genres: int):
+        genre_weights = self.zipf_weights(genres)
+        genre_ids = range(self.first["genre"], self.first["genre"] + genres)
+        link_id = self.first["genre_title"]
+        for title_id in range(
+            self.first["title"], self.first["title"] + titles
+        ):
+            chosen = self.random.choices(
+                genre_ids, genre_weights, k=self.random.randint(1, 3)
+            )
+            for genre_id in dict.fromkeys(chosen):
+                yield {
+                    "id": link_id,
+                    "title_id": title_id,
+                    "genre_id": genre_id,
+                }
+                link_id += 1
+
+    def reviews(self, titles: int, users: int, total: int):
+        """
+        Отзывы распределены по произведениям по закону Ципфа,
+        оценки сгруппированы вокруг «качества» произведения.
+        """
+        weights = self.zipf_weights(titles)
+        scale = total / sum(weights)
+        review_id = self.first["review"]
+        for offset, weight in enumerate(weights):
+            count = min(round(weight * scale), users)
+            quality = self.random.gauss(6.5, 1.5)
+            for author in self.random.sample(range(users), count):
+                score = round(self.random.gauss(quality, 1.8))
+                yield {
+                    "id": review_id,
+                    "title_id": self.first["title"] + offset,
+                    "author_id": self.first["user"] + author,
+                    "text": self.words(5, 60).capitalize(),
+                    "score": min(max(score, 1), 10),
+                    "pub_date": self.random_date(),
+                }
+                review_id += 1
+        self.reviews_created = review_id - self.first["review"]
+
+    def comments(self, count: int, users: int):
+        """Большинство комментариев приходится на немногие отзывы."""
+        if not self.reviews_created:
+            return
+        for comment_id in range(
+            self.first["comment"], self.first["comment"] + count
+        ):
+            review = int(self.reviews_created * self.random.random() ** 3)
+            yield {
+                "id": comment_id,
+                "review_id": self.first["review"] + review,
+                "author_id": self.first["user"] + self.random.randrange(users),
+                "text": self.words(3, 30).capitalize(),
+                "pub_date": self.random_date(),
+            }
+
+    def write(self, key: str, model, rows) -> None:
+        loaded = 0
+        started = time.monotonic()
+        while batch := list(islice(rows, self.batch_size)):
+            self.writer.write(model, batch)
+            loaded += len(batch)
+            if self.stdout.isatty():
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    f"{key}: {loaded} строк, "
+                    f"{loaded / elapsed if elapsed else 0:.0f} строк/с",
+                    ending="\r",
+                )
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{key}: создано {loaded} строк за {elapsed:.2f} с "
+                f"({loaded / elapsed if elapsed else 0:.0f} строк/с)"
+            )
+        )
+
+    def handle(self, *args, **options):
+        self.using = options["database"]
+        self.random = random.Random(options["seed"])
+        self.skew = options["skew"]
+        self.batch_size = options["batch_size"]
+        self.writer = BulkWriter(self.using)
+        self.reviews_created = 0
+        # Фиксированная точка отсчёта дат для воспроизводимости.
+        self.now = dt.datetime(2024, 12, 1, tzinfo=dt.timezone.utc)
+        users = max(options["users"], 1)
+        categories = max(options["categories"], 1)
+        genres = max(options["genres"], 1)
+        titles = options["titles"]
+
+        with transaction.atomic(using=self.using):
+            if options["clear"]:
+                try:
+                    self.writer.clear(list(MODELS))
+                except ValueError as error:
+                    raise CommandError(str(error))
+            self.first = {
+                key: self.next_id(model)
+                for key, model in (
+                    ("user", User),
+                    ("category", Category),
+                    ("genre", Genre),
+                    ("title", Title),
+                    ("genre_title", GenreTitle),
+                    ("review", Review),
+                    ("comment", Comment),
+                )
+            }
+            self.write("user", User, self.users(users))
+            self.write("category", Category, self.categories(categories))
+            self.write("genre", Genre, self.genres(genres))
+            self.write("title", Title, self.titles(titles, categories))
+            self.write(
+                "genre_title", GenreTitle, self.genre_titles(titles, genres)
+            )
+            self.write(
+                "review",
+                Review,
+                self.reviews(titles, users, options["reviews"]),
+            )
+            self.write(
+                "comment", Comment, self.comments(options["comments"], users)
+            )
+            self.writer.reset_sequences(list(MODELS))
+            rebuild_ratings(Title.objects.using(self.using))
+            rebuild_search_index(using=self.using)
+            data_imported.send(
+                sender=self.__class__,
+                models=[
+                    "user",
+                    "category",
+                    "genre",
+                    "title",
+                    "genre_title",
+                    "review",
+                    "comment",
+                ],
+                using=self.using,
+            )
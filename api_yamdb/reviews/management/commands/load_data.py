@@ -1,42 +1,123 @@
 import csv
 import os
+import time
+from itertools import islice
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, transaction
+from reviews.bulk import BulkWriter
 from reviews.models import Category, Comment, Genre, GenreTitle, Review, Title
+from reviews.search import rebuild_search_index
+from reviews.services import rebuild_ratings
+from reviews.signals import data_imported
 
 User = get_user_model()
 
 BASE_DIR = settings.BASE_DIR
 
-
+# Модели перечислены в порядке зависимостей внешних ключей
 MODEL = {
     "user": (User, "users.csv"),
     "category": (Category, "category.csv"),
     "genre": (Genre, "genre.csv"),
     "title": (Title, "titles.csv"),
+    "genre_title": (GenreTitle, "genre_title.csv"),
     "review": (Review, "review.csv"),
     "comment": (Comment, "comments.csv"),
-    "genre_title": (GenreTitle, "genre_title.csv"),
 }
 
+BATCH_SIZE = 5000
+
 
 class Command(BaseCommand):
     help = "Загрузка данных из csv-файла в БД."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="Количество строк, записываемых за один запрос.",
+        )
+        parser.add_argument(
+            "--only",
+            action="append",
+            choices=list(MODEL),
+            help=(
+                "Загрузить только указанные модели (можно повторять). "
+                "Данные других моделей не удаляются; если они ссылаются "
+                "на удаляемые строки, загрузка прерывается."
+            ),
+        )
+        parser.add_argument(
+            "--append",
+            action="store_true",
+            help="Не удалять существующие данные перед загрузкой.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Псевдоним базы данных.",
+        )
+
     def get_csv_file(self, filename) -> str:
         return os.path.join(BASE_DIR, "static", "data", filename)
 
-    def load_data(self, key: str):
+    def read_batches(self, file_path: str, batch_size: int):
+        """Чтение csv-файла частями по batch_size строк."""
+        with open(file_path, encoding="utf-8", newline="") as file:
+            rows = csv.DictReader(file)
+            while batch := list(islice(rows, batch_size)):
+                yield batch
+
+    def load_data(self, key: str, batch_size: int) -> None:
         model, filename = MODEL.get(key)
         file_path = self.get_csv_file(filename)
-        with open(file_path, encoding="utf-8") as file:
-            csv_file = csv.DictReader(file)
-            model.objects.all().delete()
-            for row in csv_file:
-                model.objects.create(**row)
+        loaded = 0
+        started = time.monotonic()
+        for rows in self.read_batches(file_path, batch_size):
+            self.writer.write(model, rows)
+            loaded += len(rows)
+            if self.stdout.isatty():
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    f"{key}: {loaded} строк, "
+                    f"{loaded / elapsed if elapsed else 0:.0f} строк/с",
+                    ending="\r",
+                )
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{key}: загружено {loaded} строк за {elapsed:.2f} с "
+                f"({loaded / elapsed if elapsed else 0:.0f} строк/с)"
+            )
+        )
 
     def handle(self, *args, **options):
-        for key in MODEL:
-            self.load_data(key)
+        self.using = options["database"]
+        self.writer = BulkWriter(self.using)
+        only = options["only"] or []
+        keys = [key for key in MODEL if not only or key in only]
+        with transaction.atomic(using=self.using):
+            if not options["append"]:
+                try:
+                    self.writer.clear([MODEL[key][0] for key in keys])
+                except ValueError as error:
+                    raise CommandError(
+                        f"{error} Добавьте их модели в --only "
+                        "или используйте --append."
+                    )
+            for key in keys:
+                self.load_data(key, options["batch_size"])
+            self.writer.reset_sequences([MODEL[key][0] for key in keys])
+            # Массовая запись не отправляет сигналы моделей,
+            # поэтому производные данные пересчитываем явно.
+            if {"title", "review"} & set(keys):
+                rebuild_ratings(Title.objects.using(self.using))
+            if "title" in keys:
+                rebuild_search_index(using=self.using)
+            data_imported.send(
+                sender=self.__class__, models=keys, using=self.using
+            )
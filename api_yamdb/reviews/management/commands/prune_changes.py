@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from reviews.models import Change
+
+
+class Command(BaseCommand):
+    help = (
+        "Удаление записей журнала изменений старше указанного числа дней. "
+        "Срок хранения должен превышать интервал синхронизации "
+        "потребителей ленты."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Срок хранения записей в днях (по умолчанию 30).",
+        )
+
+    def handle(self, *args, **options):
+        before = timezone.now() - timedelta(days=options["days"])
+        deleted, _ = Change.objects.filter(changed_at__lt=before).delete()
+        self.stdout.write(
+            self.style.SUCCESS(f"Удалено {deleted} записей журнала.")
+        )
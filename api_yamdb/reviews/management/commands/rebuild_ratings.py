@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from reviews.services import rebuild_ratings
+from reviews.signals import ratings_rebuilt
+
+
+class Command(BaseCommand):
+    help = (
+        "Пересчёт хранимого рейтинга и распределения оценок "
+        "произведений по отзывам."
+    )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            updated = rebuild_ratings()
+            ratings_rebuilt.send(sender=self.__class__)
+        self.stdout.write(
+            self.style.SUCCESS(f"Пересчитан рейтинг {updated} произведений.")
+        )
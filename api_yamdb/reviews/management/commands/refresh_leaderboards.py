@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from reviews.leaderboards import refresh_leaderboards
+
+
+class Command(BaseCommand):
+    help = (
+        "Пересчёт рейтингов лучших произведений по журналу изменений "
+        "(с --full — всех разделов)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Пересчитать все разделы заново.",
+        )
+
+    def handle(self, *args, **options):
+        boards = refresh_leaderboards(full=options["full"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Пересчитано разделов рейтингов: {boards}.")
+        )
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from reviews.trending import update_trending
+
+
+class Command(BaseCommand):
+    help = (
+        "Пересчёт популярности произведений по новым отзывам "
+        "(с --full — заново по отзывам последних дней)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Пересчитать популярность всех произведений заново.",
+        )
+
+    def handle(self, *args, **options):
+        titles = update_trending(full=options["full"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Учтены новые отзывы произведений: {titles}."
+            )
+        )
@@ -0,0 +1,54 @@
+# Generated by Django 5.1.3 on 2026-10-18 18:48
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce, NullIf
+
+
+def fill_ratings(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    Review = apps.get_model('reviews', 'Review')
+    reviews = (
+        Review.objects.filter(title=OuterRef('pk')).order_by().values('title')
+    )
+    rating_sum = Coalesce(
+        Subquery(reviews.annotate(total=Sum('score')).values('total')),
+        0,
+        output_field=IntegerField(),
+    )
+    reviews_count = Coalesce(
+        Subquery(reviews.annotate(total=Count('id')).values('total')),
+        0,
+        output_field=IntegerField(),
+    )
+    Title.objects.update(
+        rating_sum=rating_sum,
+        reviews_count=reviews_count,
+        rating=rating_sum / NullIf(reviews_count, 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='rating',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True, verbose_name='Рейтинг'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Сумма оценок'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='reviews_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество отзывов'),
+        ),
+        migrations.RunPython(fill_ratings, migrations.RunPython.noop),
+    ]
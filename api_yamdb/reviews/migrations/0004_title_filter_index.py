@@ -0,0 +1,17 @@
+# Generated by Django 5.1.3 on 2026-10-18 18:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0003_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(fields=['year', 'category', 'name'], name='title_year_category_name_idx'),
+        ),
+    ]
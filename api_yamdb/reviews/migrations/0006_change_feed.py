@@ -0,0 +1,55 @@
+# Generated by Django 5.1.3 on 2026-10-18 19:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0005_title_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Дата изменения'),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Дата изменения'),
+        ),
+        migrations.AddField(
+            model_name='genre',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Дата изменения'),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Дата изменения'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Дата изменения'),
+        ),
+        migrations.CreateModel(
+            name='Change',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('resource', models.CharField(choices=[('titles', 'Произведения'), ('reviews', 'Отзывы'), ('comments', 'Комментарии'), ('categories', 'Категории'), ('genres', 'Жанры')], max_length=20, verbose_name='Ресурс')),
+                ('object_id', models.CharField(blank=True, help_text='id, для категорий и жанров — слаг', max_length=50, verbose_name='Идентификатор объекта')),
+                ('parent_id', models.PositiveIntegerField(blank=True, help_text='id произведения отзыва или id отзыва комментария', null=True, verbose_name='Родительский объект')),
+                ('action', models.CharField(choices=[('update', 'Создание или изменение'), ('delete', 'Удаление'), ('reset', 'Полная синхронизация')], max_length=10, verbose_name='Действие')),
+                ('changed_at', models.DateTimeField(auto_now_add=True, verbose_name='Дата изменения')),
+            ],
+            options={
+                'verbose_name': 'Изменение',
+                'verbose_name_plural': 'Изменения',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['resource', 'id'], name='change_resource_id_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.3 on 2026-10-18 19:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0006_change_feed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaderboardEntry',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('rating', 'По рейтингу'), ('reviews', 'По количеству отзывов')], max_length=10, verbose_name='Рейтинг')),
+                ('scope', models.CharField(choices=[('all', 'Все произведения'), ('category', 'Категория'), ('genre', 'Жанр'), ('year', 'Год выпуска')], max_length=10, verbose_name='Раздел')),
+                ('scope_key', models.IntegerField(default=0, help_text='id категории или жанра, год выпуска, 0 для всех', verbose_name='Ключ раздела')),
+                ('position', models.PositiveIntegerField(verbose_name='Место')),
+                ('value', models.IntegerField(verbose_name='Значение')),
+                ('title', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='reviews.title', verbose_name='Произведение')),
+            ],
+            options={
+                'verbose_name': 'Место в рейтинге',
+                'verbose_name_plural': 'Места в рейтингах',
+                'ordering': ['kind', 'scope', 'scope_key', 'position'],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'scope', 'scope_key', 'position'), name='unique_leaderboard_position')],
+            },
+        ),
+    ]
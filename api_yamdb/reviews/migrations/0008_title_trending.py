@@ -0,0 +1,22 @@
+# Generated by Django 5.1.3 on 2026-10-18 19:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0007_leaderboards'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='trending_score',
+            field=models.FloatField(default=0, editable=False, help_text='Сумма оценок новых отзывов с затуханием по времени', verbose_name='Популярность'),
+        ),
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(fields=['-trending_score', 'id'], name='title_trending_idx'),
+        ),
+    ]
@@ -1,15 +1,31 @@
 import datetime as dt
 
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
 from users.models import User
 
 
-class Category(models.Model):
+class LoadedSlugMixin:
+    """
+    Запоминание загруженного слага: при его изменении журнал изменений
+    получает запись-надгробие прежнего слага.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_slug = instance.__dict__.get("slug")
+        return instance
+
+
+class Category(LoadedSlugMixin, models.Model):
     """Модель категорий произведений."""
 
     name = models.CharField(max_length=50, verbose_name="Название категории")
     slug = models.SlugField(max_length=50, unique=True)
+    updated_at = models.DateTimeField(
+        auto_now=True, db_index=True, verbose_name="Дата изменения"
+    )
 
     class Meta:
         verbose_name = "Категория"
@@ -20,11 +36,14 @@ class Category(models.Model):
         return self.name
 
 
-class Genre(models.Model):
+class Genre(LoadedSlugMixin, models.Model):
     """Модель жанров произведений."""
 
     name = models.CharField(max_length=50, verbose_name="Название жанра")
     slug = models.SlugField(max_length=50, unique=True)
+    updated_at = models.DateTimeField(
+        auto_now=True, db_index=True, verbose_name="Дата изменения"
+    )
 
     class Meta:
         verbose_name = "Жанр"
@@ -58,15 +77,104 @@ class Title(models.Model):
         Category, related_name="titles", on_delete=models.SET_NULL, null=True
     )
     genre = models.ManyToManyField(Genre, through="GenreTitle")
+    rating_sum = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Сумма оценок"
+    )
+    reviews_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Количество отзывов"
+    )
+    rating = models.PositiveSmallIntegerField(
+        null=True, blank=True, editable=False, verbose_name="Рейтинг"
+    )
+    trending_score = models.FloatField(
+        default=0,
+        editable=False,
+        verbose_name="Популярность",
+        help_text="Сумма оценок новых отзывов с затуханием по времени",
+    )
+    # Распределение оценок: количество отзывов с каждой оценкой
+    score_1 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Оценок 1"
+    )
+    score_2 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Оценок 2"
+    )
+    score_3 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Оценок 3"
+    )
+    score_4 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Оценок 4"
+    )
+    score_5 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Оценок 5"
+    )
+    score_6 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Оценок 6"
+    )
+    score_7 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Оценок 7"
+    )
+    score_8 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Оценок 8"
+    )
+    score_9 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Оценок 9"
+    )
+    score_10 = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Оценок 10"
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True, db_index=True, verbose_name="Дата изменения"
+    )
 
     class Meta:
         verbose_name = "Произведение"
         verbose_name_plural = "Произведения"
         ordering = ["name"]
+        indexes = [
+            models.Index(fields=["name", "id"], name="title_name_id_idx"),
+            models.Index(
+                fields=["year", "category", "name"],
+                name="title_year_category_name_idx",
+            ),
+            models.Index(
+                fields=["-trending_score", "id"], name="title_trending_idx"
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
+    # Счётчики отзывов с оценками от 1 до 10
+    SCORE_FIELDS = tuple(f"score_{score}" for score in range(1, 11))
+    # Поля изменяются только запросами UPDATE при изменении отзывов
+    # и фоновой задачей (популярность).
+    COUNTER_FIELDS = (
+        "rating_sum",
+        "reviews_count",
+        "rating",
+        "trending_score",
+    ) + SCORE_FIELDS
+
+    @staticmethod
+    def score_field(score: int) -> str:
+        """Поле счётчика отзывов с оценкой `score`."""
+        return f"score_{score}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            # Иначе полное сохранение перезапишет счётчики устаревшими
+            # значениями из памяти.
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.COUNTER_FIELDS
+                and field.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
+
 
 class GenreTitle(models.Model):
     """Модель Жанры произведений - Произведения."""
@@ -118,11 +226,20 @@ class Review(models.Model):
     pub_date = models.DateTimeField(
         verbose_name="Дата публикации", auto_now_add=True
     )
+    updated_at = models.DateTimeField(
+        auto_now=True, db_index=True, verbose_name="Дата изменения"
+    )
 
     class Meta:
         ordering = ["-pub_date"]
         verbose_name = "Отзыв"
         verbose_name_plural = "Отзывы"
+        indexes = [
+            models.Index(
+                fields=["title", "-pub_date", "-id"],
+                name="review_title_pub_date_idx",
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["title", "author"], name="unique_review"
@@ -132,6 +249,21 @@ class Review(models.Model):
     def __str__(self):
         return self.author, self.score, self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Запоминаем загруженные значения, чтобы при обновлении отзыва
+        # пересчитать рейтинг произведения на разницу оценок.
+        instance._loaded_title_id = instance.__dict__.get("title_id")
+        instance._loaded_score = instance.__dict__.get("score")
+        return instance
+
+    def save(self, *args, **kwargs):
+        # Рейтинг произведения обновляется в post_save,
+        # поэтому сохраняем отзыв и рейтинг в одной транзакции.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
 
 class Comment(models.Model):
     """Класс для представления комментариев к отзывам."""
@@ -152,11 +284,163 @@ class Comment(models.Model):
     pub_date = models.DateTimeField(
         verbose_name="Дата публикации", auto_now_add=True
     )
+    updated_at = models.DateTimeField(
+        auto_now=True, db_index=True, verbose_name="Дата изменения"
+    )
 
     class Meta:
         verbose_name = "Комментарий"
         verbose_name_plural = "Комментарии"
         ordering = ["-pub_date"]
+        indexes = [
+            models.Index(
+                fields=["review", "-pub_date", "-id"],
+                name="comment_review_pub_date_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.text
+
+
+class Change(models.Model):
+    """
+    Журнал изменений для инкрементальной синхронизации (change feed).
+    Запись добавляется при каждом изменении строки произведения, отзыва,
+    комментария, категории или жанра (для произведения — также при
+    изменении рейтинга и жанров); удаление оставляет запись-надгробие.
+    Порядковый номер записи служит курсором ленты.
+    """
+
+    class Resource(models.TextChoices):
+        TITLES = "titles", "Произведения"
+        REVIEWS = "reviews", "Отзывы"
+        COMMENTS = "comments", "Комментарии"
+        CATEGORIES = "categories", "Категории"
+        GENRES = "genres", "Жанры"
+
+    class Action(models.TextChoices):
+        UPDATE = "update", "Создание или изменение"
+        DELETE = "delete", "Удаление"
+        # Данные ресурса загружены массово, нужна полная синхронизация.
+        RESET = "reset", "Полная синхронизация"
+
+    id = models.BigAutoField(primary_key=True)
+    resource = models.CharField(
+        max_length=20, choices=Resource.choices, verbose_name="Ресурс"
+    )
+    object_id = models.CharField(
+        max_length=50,
+        blank=True,
+        verbose_name="Идентификатор объекта",
+        help_text="id, для категорий и жанров — слаг",
+    )
+    parent_id = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        verbose_name="Родительский объект",
+        help_text="id произведения отзыва или id отзыва комментария",
+    )
+    action = models.CharField(
+        max_length=10, choices=Action.choices, verbose_name="Действие"
+    )
+    changed_at = models.DateTimeField(
+        auto_now_add=True, verbose_name="Дата изменения"
+    )
+
+    class Meta:
+        verbose_name = "Изменение"
+        verbose_name_plural = "Изменения"
+        ordering = ["id"]
+        indexes = [
+            models.Index(
+                fields=["resource", "id"], name="change_resource_id_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.resource}:{self.object_id} {self.action}"
+
+    @classmethod
+    def for_object(cls, instance, action):
+        """Запись журнала для экземпляра модели каталога."""
+        model = type(instance)
+        if model is Category or model is Genre:
+            object_id = instance.slug
+        else:
+            object_id = str(instance.pk)
+        return cls(
+            resource=CHANGE_RESOURCES[model],
+            object_id=object_id,
+            parent_id=(
+                getattr(instance, "title_id", None)
+                if model is Review
+                else getattr(instance, "review_id", None)
+            ),
+            action=action,
+        )
+
+
+CHANGE_RESOURCES = {
+    Title: Change.Resource.TITLES,
+    Review: Change.Resource.REVIEWS,
+    Comment: Change.Resource.COMMENTS,
+    Category: Change.Resource.CATEGORIES,
+    Genre: Change.Resource.GENRES,
+}
+
+
+class LeaderboardEntry(models.Model):
+    """
+    Строка рейтинга лучших произведений: место, произведение и значение
+    (рейтинг или количество отзывов). Рейтинги пересчитываются фоновой
+    задачей (reviews.leaderboards), чтение страницы — выборка по индексу
+    без агрегации.
+    """
+
+    class Kind(models.TextChoices):
+        RATING = "rating", "По рейтингу"
+        REVIEWS = "reviews", "По количеству отзывов"
+
+    class Scope(models.TextChoices):
+        ALL = "all", "Все произведения"
+        CATEGORY = "category", "Категория"
+        GENRE = "genre", "Жанр"
+        YEAR = "year", "Год выпуска"
+
+    kind = models.CharField(
+        max_length=10, choices=Kind.choices, verbose_name="Рейтинг"
+    )
+    scope = models.CharField(
+        max_length=10, choices=Scope.choices, verbose_name="Раздел"
+    )
+    scope_key = models.IntegerField(
+        default=0,
+        verbose_name="Ключ раздела",
+        help_text="id категории или жанра, год выпуска, 0 для всех",
+    )
+    position = models.PositiveIntegerField(verbose_name="Место")
+    # Без внешнего ключа в БД: строки удалённого произведения удаляет
+    # следующий пересчёт, которому они нужны, чтобы найти его рейтинги.
+    title = models.ForeignKey(
+        Title,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+        verbose_name="Произведение",
+    )
+    value = models.IntegerField(verbose_name="Значение")
+
+    class Meta:
+        verbose_name = "Место в рейтинге"
+        verbose_name_plural = "Места в рейтингах"
+        ordering = ["kind", "scope", "scope_key", "position"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "scope", "scope_key", "position"],
+                name="unique_leaderboard_position",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.scope}:{self.scope_key} #{self.position}"
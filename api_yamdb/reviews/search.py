@@ -0,0 +1,156 @@
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.db import connections
+from django.db.models import FloatField, Q
+from django.db.models.expressions import RawSQL
+
+from .models import Title
+
+# Конфигурация словаря PostgreSQL: без стемминга, подходит для любых языков
+SEARCH_CONFIG: str = "simple"
+# Таблица FTS5 для поиска на SQLite (локальное тестирование)
+FTS_TABLE: str = "reviews_title_fts"
+
+
+def title_search_vector():
+    """
+    Поисковый вектор произведения: название важнее описания.
+    Выражение совпадает с выражением GIN-индекса title_search_idx.
+    """
+    return SearchVector(
+        "name", config=SEARCH_CONFIG, weight="A"
+    ) + SearchVector("description", config=SEARCH_CONFIG, weight="B")
+
+
+def fts_query(query: str) -> str:
+    """
+    Экранирование запроса для FTS5: каждое слово в кавычках,
+    последнее слово ищется по префиксу.
+    """
+    terms = ['"{}"'.format(term.replace('"', '""')) for term in query.split()]
+    if terms:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+
+def ts_query(query: str) -> str:
+    """
+    Запрос для to_tsquery PostgreSQL: каждое слово в кавычках,
+    слова объединяются через &, последнее слово ищется по префиксу.
+    """
+    terms = [
+        "'{}'".format(term.replace("\\", "\\\\").replace("'", "''"))
+        for term in query.split()
+    ]
+    if terms:
+        terms[-1] += ":*"
+    return " & ".join(terms)
+
+
+def search_titles(queryset, query: str):
+    """
+    Поиск произведений по названию и описанию с ранжированием
+    по релевантности. Результат содержит аннотацию `search_rank`.
+    """
+    vendor = connections[queryset.db].vendor
+    if vendor == "postgresql":
+        search_query = SearchQuery(
+            ts_query(query), config=SEARCH_CONFIG, search_type="raw"
+        )
+        vector = title_search_vector()
+        return (
+            queryset.annotate(search=vector)
+            .filter(search=search_query)
+            # Ссылка на аннотацию приводит вектор к тексту, и веса
+            # названия и описания теряются
+            .annotate(search_rank=SearchRank(vector, search_query))
+            .order_by("-search_rank", "name", "id")
+        )
+    if vendor == "sqlite":
+        match = fts_query(query)
+        table = connections[queryset.db].ops.quote_name(Title._meta.db_table)
+        return (
+            queryset.filter(
+                id__in=RawSQL(
+                    f"SELECT rowid FROM {FTS_TABLE} "
+                    f"WHERE {FTS_TABLE} MATCH %s",
+                    (match,),
+                )
+            )
+            .annotate(
+                search_rank=RawSQL(
+                    f"SELECT -rank FROM {FTS_TABLE} "
+                    f"WHERE {FTS_TABLE} MATCH %s AND rowid = {table}.id",
+                    (match,),
+                    output_field=FloatField(),
+                )
+            )
+            .order_by("-search_rank", "name", "id")
+        )
+    return queryset.filter(
+        Q(name__icontains=query) | Q(description__icontains=query)
+    )
+
+
+def uses_fts(using: str = "default") -> bool:
+    return connections[using].vendor == "sqlite"
+
+
+def index_title(title, using: str = "default") -> None:
+    """Обновление записи произведения в таблице FTS5."""
+    if not uses_fts(using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [title.pk]
+        )
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, name, description) "
+            "VALUES (%s, %s, %s)",
+            [title.pk, title.name, title.description],
+        )
+
+
+def index_titles(titles, using: str = "default") -> None:
+    """Обновление записей нескольких произведений в таблице FTS5."""
+    if not uses_fts(using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.executemany(
+            f"DELETE FROM {FTS_TABLE} WHERE rowid = %s",
+            [[title.pk] for title in titles],
+        )
+        cursor.executemany(
+            f"INSERT INTO {FTS_TABLE} (rowid, name, description) "
+            "VALUES (%s, %s, %s)",
+            [[title.pk, title.name, title.description] for title in titles],
+        )
+
+
+def unindex_title(title_id: int, using: str = "default") -> None:
+    """Удаление произведения из таблицы FTS5."""
+    if not uses_fts(using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [title_id]
+        )
+
+
+def rebuild_search_index(using: str = "default") -> None:
+    """
+    Перестроение таблицы FTS5 по всем произведениям.
+    На PostgreSQL GIN-индекс поддерживается самой СУБД.
+    """
+    if not uses_fts(using):
+        return
+    table = connections[using].ops.quote_name(Title._meta.db_table)
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, name, description) "
+            f"SELECT id, name, description FROM {table}"
+        )
@@ -0,0 +1,173 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce, NullIf
+from django.utils import timezone
+
+from .models import Change, GenreTitle, Review, Title
+
+# Поля произведения, которые изменяет массовое обновление
+TITLE_UPDATE_FIELDS = (
+    "name",
+    "year",
+    "description",
+    "category",
+    "updated_at",
+)
+
+
+def record_changes(instances, action=Change.Action.UPDATE) -> None:
+    """Запись изменений объектов в журнал одним запросом."""
+    Change.objects.bulk_create(
+        Change.for_object(instance, action) for instance in instances
+    )
+
+
+def settled_id(queryset, date_field: str) -> int:
+    """
+    Наибольший id строк, добавленных раньше COMMIT_LAG секунд назад
+    по полю даты `date_field`. Строки с меньшим id добавлены ещё раньше,
+    их транзакции уже зафиксированы, поэтому курсор по id до этого
+    значения не пропустит строку, которая станет видна позже.
+    """
+    horizon = timezone.now() - timedelta(seconds=settings.COMMIT_LAG)
+    return (
+        queryset.filter(**{f"{date_field}__lte": horizon})
+        .order_by("-id")
+        .values_list("id", flat=True)
+        .first()
+    ) or 0
+
+
+def touch_titles(title_ids) -> None:
+    """
+    Отметка изменения произведений, строки которых изменены в обход
+    save() (запросом UPDATE) или у которых изменились жанры.
+    """
+    title_ids = list(title_ids)
+    if not title_ids:
+        return
+    Title.objects.filter(pk__in=title_ids).update(updated_at=timezone.now())
+    record_changes(Title(pk=title_id) for title_id in title_ids)
+
+
+def update_title_rating(
+    title_id: int, added: int | None = None, removed: int | None = None
+) -> None:
+    """
+    Изменение хранимого рейтинга и распределения оценок произведения
+    одним запросом UPDATE: `added` — оценка добавленного отзыва,
+    `removed` — удалённого (при изменении оценки переданы обе).
+    """
+    score = int(added or 0) - int(removed or 0)
+    count = (added is not None) - (removed is not None)
+    histogram = {}
+    if added is not None:
+        field = Title.score_field(added)
+        histogram[field] = F(field) + 1
+    if removed is not None:
+        field = Title.score_field(removed)
+        histogram[field] = histogram.get(field, F(field)) - 1
+    Title.objects.filter(pk=title_id).update(
+        rating_sum=F("rating_sum") + score,
+        reviews_count=F("reviews_count") + count,
+        rating=(F("rating_sum") + score)
+        / NullIf(F("reviews_count") + count, 0),
+        updated_at=timezone.now(),
+        **histogram,
+    )
+    record_changes([Title(pk=title_id)])
+
+
+def rebuild_ratings(titles=None) -> int:
+    """
+    Пересчёт хранимого рейтинга и распределения оценок по отзывам
+    с нуля. Возвращает количество обновлённых произведений.
+    """
+    if titles is None:
+        titles = Title.objects.all()
+    reviews = (
+        Review.objects.filter(title=OuterRef("pk"))
+        .order_by()
+        .values("title")
+    )
+
+    def total(reviews, aggregate):
+        return Coalesce(
+            Subquery(reviews.annotate(total=aggregate).values("total")),
+            0,
+            output_field=IntegerField(),
+        )
+
+    rating_sum = total(reviews, Sum("score"))
+    reviews_count = total(reviews, Count("id"))
+    return titles.update(
+        rating_sum=rating_sum,
+        reviews_count=reviews_count,
+        rating=rating_sum / NullIf(reviews_count, 0),
+        **{
+            Title.score_field(score): total(
+                reviews.filter(score=score), Count("id")
+            )
+            for score in range(1, 11)
+        },
+    )
+
+
+def score_stats(histogram: list[int]) -> dict:
+    """
+    Количество, среднее и медиана оценок по распределению:
+    `histogram[i]` — количество отзывов с оценкой i + 1.
+    """
+    count = sum(histogram)
+    if not count:
+        return {"count": 0, "mean": None, "median": None}
+    scores = list(enumerate(histogram, start=1))
+    mean = sum(score * number for score, number in scores) / count
+
+    def nth(position):
+        # Оценка отзыва с номером `position` в порядке возрастания
+        for score, number in scores:
+            position -= number
+            if position < 0:
+                return score
+
+    middle = count // 2
+    median = (
+        nth(middle) if count % 2 else (nth(middle - 1) + nth(middle)) / 2
+    )
+    return {"count": count, "mean": round(mean, 2), "median": median}
+
+
+def save_titles(items) -> list[Title]:
+    """
+    Массовое создание и обновление произведений со связями с жанрами:
+    по одному запросу на вставку, обновление и замену связей.
+    Элементы — словари полей Title и `genre_ids`; элементы с `id`
+    обновляются. Сигналы моделей не отправляются: время изменения
+    и записи журнала изменений пишутся для всего пакета сразу.
+    """
+    titles, created, updated = [], [], []
+    now = timezone.now()
+    for item in items:
+        fields = dict(item)
+        genre_ids = fields.pop("genre_ids")
+        title = Title(**fields, updated_at=now)
+        (updated if title.pk else created).append(title)
+        titles.append((title, genre_ids))
+    with transaction.atomic():
+        Title.objects.bulk_create(created)
+        if updated:
+            Title.objects.bulk_update(updated, TITLE_UPDATE_FIELDS)
+            # delete() отправил бы post_delete для каждой связи
+            links = GenreTitle.objects.filter(title__in=updated)
+            links._raw_delete(links.db)
+        GenreTitle.objects.bulk_create(
+            GenreTitle(title=title, genre_id=genre_id)
+            for title, genre_ids in titles
+            for genre_id in genre_ids
+        )
+        record_changes(title for title, _ in titles)
+    return [title for title, _ in titles]
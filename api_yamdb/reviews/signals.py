@@ -0,0 +1,212 @@
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import Signal, receiver
+
+from .models import (
+    CHANGE_RESOURCES,
+    Category,
+    Change,
+    Comment,
+    Genre,
+    GenreTitle,
+    Review,
+    Title,
+)
+from .search import index_title, index_titles, unindex_title
+from .services import (
+    rebuild_ratings,
+    record_changes,
+    touch_titles,
+    update_title_rating,
+)
+
+# Отправляется после массовой загрузки данных в обход сигналов моделей,
+# аргумент models содержит ключи загруженных моделей.
+data_imported = Signal()
+# Отправляется после массовой записи произведений (services.save_titles),
+# аргумент titles содержит сохранённые произведения.
+titles_saved = Signal()
+# Отправляется после пересчёта рейтинга всех произведений запросом
+# UPDATE (services.rebuild_ratings) в обход сигналов моделей.
+ratings_rebuilt = Signal()
+# Отправляется после пересчёта рейтингов лучших произведений
+# (leaderboards.refresh_leaderboards), аргумент boards — число разделов.
+leaderboards_refreshed = Signal()
+# Отправляется после пересчёта популярности произведений
+# (trending.update_trending), аргумент titles — число произведений
+# с новыми отзывами.
+trending_updated = Signal()
+
+
+@receiver(post_save, sender=Review)
+def review_saved(sender, instance, created, raw=False, **kwargs):
+    """Пересчёт рейтинга произведения при создании и изменении отзыва."""
+    if raw:
+        return
+    loaded_title_id = getattr(instance, "_loaded_title_id", None)
+    loaded_score = getattr(instance, "_loaded_score", None)
+    if created:
+        update_title_rating(instance.title_id, added=instance.score)
+    elif loaded_title_id is None or loaded_score is None:
+        # Отзыв загружен без оценки, разницу вычислить нельзя.
+        rebuild_ratings(Title.objects.filter(pk=instance.title_id))
+        touch_titles([instance.title_id])
+    elif loaded_title_id != instance.title_id:
+        update_title_rating(loaded_title_id, removed=loaded_score)
+        update_title_rating(instance.title_id, added=instance.score)
+    elif loaded_score != instance.score:
+        update_title_rating(
+            instance.title_id, added=instance.score, removed=loaded_score
+        )
+    instance._loaded_title_id = instance.title_id
+    instance._loaded_score = instance.score
+
+
+@receiver(pre_delete, sender=Review)
+def review_deleting(sender, instance, **kwargs):
+    """Загрузка оценки отзыва, если он получен без неё."""
+    if (
+        getattr(instance, "_loaded_title_id", None) is None
+        or getattr(instance, "_loaded_score", None) is None
+    ):
+        instance._loaded_title_id, instance._loaded_score = (
+            Review.objects.values_list("title_id", "score").get(pk=instance.pk)
+        )
+    if "title_id" in instance.get_deferred_fields():
+        # После удаления отложенное поле уже нельзя будет загрузить.
+        instance.title_id = instance._loaded_title_id
+
+
+@receiver(post_delete, sender=Review)
+def review_deleted(sender, instance, **kwargs):
+    """Пересчёт рейтинга произведения при удалении отзыва."""
+    update_title_rating(
+        instance._loaded_title_id, removed=instance._loaded_score
+    )
+
+
+@receiver(post_save, sender=Title)
+def title_saved(sender, instance, raw=False, using="default", **kwargs):
+    """Обновление поискового индекса FTS5 (только SQLite)."""
+    update_fields = kwargs.get("update_fields")
+    if update_fields and not {"name", "description"} & set(update_fields):
+        return
+    index_title(instance, using=using)
+
+
+@receiver(post_delete, sender=Title)
+def title_deleted(sender, instance, using="default", **kwargs):
+    unindex_title(instance.pk, using=using)
+
+
+@receiver(titles_saved)
+def titles_bulk_saved(sender, titles, using="default", **kwargs):
+    index_titles(titles, using=using)
+
+
+# Журнал изменений (change feed)
+# Ключи data_imported и ресурсы, которые они затрагивают.
+IMPORTED_RESOURCES = {
+    "category": (Change.Resource.CATEGORIES,),
+    "genre": (Change.Resource.GENRES,),
+    "title": (Change.Resource.TITLES,),
+    "genre_title": (Change.Resource.TITLES,),
+    "review": (Change.Resource.REVIEWS, Change.Resource.TITLES),
+    "comment": (Change.Resource.COMMENTS,),
+}
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Genre)
+def slug_changed(sender, instance, raw=False, **kwargs):
+    """
+    Категории и жанры в журнале определяются слагом: при смене слага
+    прежний слаг удаляется, а произведения, которые выводят слаг,
+    отмечаются изменёнными. Приёмник подключён раньше catalog_saved,
+    поэтому надгробие идёт перед записью нового слага.
+    """
+    loaded_slug = getattr(instance, "_loaded_slug", None)
+    if not raw and loaded_slug is not None and loaded_slug != instance.slug:
+        Change.objects.create(
+            resource=CHANGE_RESOURCES[sender],
+            object_id=loaded_slug,
+            action=Change.Action.DELETE,
+        )
+        if sender is Category:
+            title_ids = instance.titles.values_list("pk", flat=True)
+        else:
+            title_ids = GenreTitle.objects.filter(genre=instance).values_list(
+                "title_id", flat=True
+            )
+        touch_titles(title_ids)
+    instance._loaded_slug = instance.slug
+
+
+@receiver(post_save, sender=Title)
+@receiver(post_save, sender=Review)
+@receiver(post_save, sender=Comment)
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Genre)
+def catalog_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        record_changes([instance])
+
+
+@receiver(post_delete, sender=Title)
+@receiver(post_delete, sender=Review)
+@receiver(post_delete, sender=Comment)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Genre)
+def catalog_deleted(sender, instance, **kwargs):
+    record_changes([instance], Change.Action.DELETE)
+
+
+@receiver(pre_delete, sender=Category)
+def category_deleting(sender, instance, **kwargs):
+    """Категория удаляемой категории обнуляется у произведений."""
+    touch_titles(instance.titles.values_list("pk", flat=True))
+
+
+@receiver(pre_delete, sender=Genre)
+def genre_deleting(sender, instance, **kwargs):
+    """Жанр удаляется из связей с произведениями."""
+    touch_titles(
+        GenreTitle.objects.filter(genre=instance).values_list(
+            "title_id", flat=True
+        )
+    )
+
+
+@receiver(post_save, sender=GenreTitle)
+@receiver(post_delete, sender=GenreTitle)
+def genre_title_changed(sender, instance, raw=False, **kwargs):
+    if not raw and instance.title_id is not None:
+        touch_titles([instance.title_id])
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def title_genres_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action in ("post_add", "post_remove"):
+        touch_titles(pk_set if reverse else [instance.pk])
+    elif action == "post_clear" and not reverse:
+        touch_titles([instance.pk])
+    elif action == "pre_clear" and reverse:
+        touch_titles(instance.title_set.values_list("pk", flat=True))
+
+
+@receiver(data_imported)
+def data_loaded(sender, models, using="default", **kwargs):
+    """Массовая загрузка: потребителям нужна полная синхронизация."""
+    resources = dict.fromkeys(
+        resource
+        for key in models
+        for resource in IMPORTED_RESOURCES.get(key, ())
+    )
+    Change.objects.using(using).bulk_create(
+        Change(resource=resource, action=Change.Action.RESET)
+        for resource in resources
+    )
@@ -0,0 +1,16 @@
+from celery import shared_task
+
+from .leaderboards import refresh_leaderboards as refresh
+from .trending import update_trending as update
+
+
+@shared_task
+def refresh_leaderboards() -> int:
+    """Периодическая задача: пересчёт рейтингов изменённых разделов."""
+    return refresh()
+
+
+@shared_task
+def update_trending() -> int:
+    """Периодическая задача: затухание и учёт новых отзывов."""
+    return update()
@@ -0,0 +1,97 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, F, Value, When
+from django.utils import timezone
+
+from .models import Review, Title
+from .services import settled_id
+from .signals import trending_updated
+
+# Последний учтённый отзыв и время прошлого пересчёта
+STATE_KEY: str = "trending:state"
+# Популярность ниже порога обнуляется и выпадает из пересчётов
+MIN_SCORE: float = 0.001
+# При полном пересчёте учитываются отзывы за столько периодов
+# полураспада: вклад более старых отзывов меньше MIN_SCORE
+FULL_WINDOW: int = 10
+
+
+def decay(seconds: float) -> float:
+    """Множитель затухания вклада за `seconds` секунд."""
+    return 0.5 ** (max(seconds, 0) / settings.TRENDING_HALF_LIFE)
+
+
+def review_weight(score: int) -> float:
+    """Вклад нового отзыва: оценка 10 весит как один отзыв."""
+    return score / 10
+
+
+def get_contributions(reviews, now) -> dict[int, float]:
+    """Сумма вкладов отзывов по произведениям на момент `now`."""
+    contributions = defaultdict(float)
+    for title_id, score, pub_date in reviews.values_list(
+        "title_id", "score", "pub_date"
+    ).order_by():
+        contributions[title_id] += review_weight(score) * decay(
+            (now - pub_date).total_seconds()
+        )
+    return contributions
+
+
+def add_contributions(contributions) -> None:
+    titles = list(
+        Title.objects.filter(pk__in=contributions).only("id", "trending_score")
+    )
+    for title in titles:
+        title.trending_score += contributions[title.pk]
+    Title.objects.bulk_update(titles, ["trending_score"], batch_size=500)
+
+
+def update_trending(full: bool = False) -> int:
+    """
+    Пересчёт популярности произведений. Накопленные значения умножаются
+    на затухание за время с прошлого запуска одним запросом UPDATE,
+    затем добавляются вклады только новых отзывов. Без сохранённого
+    состояния популярность считается заново по отзывам за FULL_WINDOW
+    периодов полураспада. Учитываются отзывы старше COMMIT_LAG секунд:
+    отзыв ещё не зафиксированной транзакции войдёт в следующий запуск.
+    Возвращает число произведений с новыми отзывами.
+    """
+    now = timezone.now()
+    state = None if full else cache.get(STATE_KEY)
+    last_id = settled_id(Review.objects.all(), "pub_date")
+    if state is not None:
+        last_id = max(last_id, state[0])
+    with transaction.atomic():
+        if state is None:
+            Title.objects.filter(trending_score__gt=0).update(
+                trending_score=0
+            )
+            since = now - timedelta(
+                seconds=settings.TRENDING_HALF_LIFE * FULL_WINDOW
+            )
+            reviews = Review.objects.filter(
+                pub_date__gte=since, id__lte=last_id
+            )
+        else:
+            cursor, last_run = state
+            factor = decay((now - last_run).total_seconds())
+            Title.objects.filter(trending_score__gt=0).update(
+                trending_score=Case(
+                    When(
+                        trending_score__gte=MIN_SCORE / factor,
+                        then=F("trending_score") * factor,
+                    ),
+                    default=Value(0.0),
+                )
+            )
+            reviews = Review.objects.filter(id__gt=cursor, id__lte=last_id)
+        contributions = get_contributions(reviews, now)
+        add_contributions(contributions)
+    cache.set(STATE_KEY, (last_id, now), timeout=None)
+    trending_updated.send(sender=Title, titles=len(contributions))
+    return len(contributions)
@@ -1,9 +1,120 @@
 import sys
 from os.path import abspath, dirname, join
 
+import pytest
+
 root_dir = dirname(dirname(abspath(__file__)))
 sys.path.append(root_dir)
 infra_dir_path = join(root_dir, 'infra')
 
 pytest_plugins = [
 ]
+
+
+def pytest_collection_modifyitems(config, items):
+    """Тесты с меткой postgres пропускаются на других СУБД."""
+    from django.conf import settings
+
+    engine = settings.DATABASES['default']['ENGINE']
+    if engine.endswith('postgresql'):
+        return
+    skip = pytest.mark.skip(reason='Только PostgreSQL')
+    for item in items:
+        if 'postgres' in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def local_cache(settings):
+    """Тесты не зависят от сервера Redis."""
+    from api.authentication import clear_local_cache
+    from django.core.cache import cache
+
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+    cache.clear()
+    clear_local_cache()
+    yield
+    cache.clear()
+    clear_local_cache()
+
+
+@pytest.fixture(autouse=True)
+def no_commit_lag(settings):
+    """Записи ленты и пересчётов видны тестам сразу после вставки."""
+    settings.COMMIT_LAG = 0
+
+
+@pytest.fixture
+def redis_cache(settings):
+    """
+    Кеш RedisCache на fakeredis: команды и скрипты Lua выполняются
+    без сервера Redis.
+    """
+    fakeredis = pytest.importorskip('fakeredis')
+    pytest.importorskip('lupa')
+    from django.core.cache import caches
+
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': 'redis://localhost:6379',
+            'OPTIONS': {
+                'connection_class': fakeredis.FakeConnection,
+                'server': fakeredis.FakeServer(),
+            },
+        }
+    }
+    return caches['default']
+
+
+@pytest.fixture
+def api_client():
+    from rest_framework.test import APIClient
+
+    return APIClient()
+
+
+@pytest.fixture
+def make_catalog(db):
+    """Создание произведений с жанрами и отзывами."""
+    from reviews.models import Category, Genre, GenreTitle, Review, Title
+    from reviews.services import rebuild_ratings
+    from users.models import User
+
+    def make(titles=10, reviews=3, genres=2):
+        category = Category.objects.create(name='Фильм', slug='movie')
+        genre_list = [
+            Genre.objects.create(name=f'Жанр {i}', slug=f'genre-{i}')
+            for i in range(genres)
+        ]
+        users = [
+            User.objects.create(
+                email=f'user{i}@yamdb.fake', username=f'user{i}'
+            )
+            for i in range(reviews)
+        ]
+        title_list = []
+        for i in range(titles):
+            title = Title.objects.create(
+                name=f'Произведение {i:05}',
+                year=2000,
+                description='Описание',
+                category=category,
+            )
+            GenreTitle.objects.bulk_create(
+                GenreTitle(genre=genre, title=title) for genre in genre_list
+            )
+            Review.objects.bulk_create(
+                Review(title=title, author=user, text='Текст', score=5)
+                for user in users
+            )
+            title_list.append(title)
+        # bulk_create не отправляет сигналы, рейтинг пересчитываем явно.
+        rebuild_ratings()
+        return title_list
+
+    return make
@@ -0,0 +1,3 @@
+SELECT ? AS "a" FROM "reviews_review" WHERE ("reviews_review"."id" = ? AND "reviews_review"."title_id" = ?) LIMIT ?;
+
+SELECT "reviews_comment"."id", "reviews_comment"."text", "reviews_comment"."author_id", "reviews_comment"."pub_date", "users_user"."id", "users_user"."username" FROM "reviews_comment" INNER JOIN "users_user" ON ("reviews_comment"."author_id" = "users_user"."id") WHERE ("reviews_comment"."review_id" = ? AND "reviews_comment"."id" = ?) LIMIT ?;
@@ -0,0 +1 @@
+DECLARE "_django_curs_?" NO SCROLL CURSOR WITHOUT HOLD FOR SELECT "reviews_comment"."id", "reviews_comment"."review_id", "reviews_comment"."text", "users_user"."username", "reviews_comment"."pub_date", "reviews_comment"."updated_at" FROM "reviews_comment" INNER JOIN "users_user" ON ("reviews_comment"."author_id" = "users_user"."id") ORDER BY "reviews_comment"."id" ASC;
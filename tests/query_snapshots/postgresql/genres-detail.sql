@@ -0,0 +1,13 @@
+SELECT "reviews_genre"."id", "reviews_genre"."name", "reviews_genre"."slug", "reviews_genre"."updated_at" FROM "reviews_genre" WHERE "reviews_genre"."slug" = '?' LIMIT ?;
+
+SELECT "reviews_genretitle"."title_id" FROM "reviews_genretitle" WHERE "reviews_genretitle"."genre_id" = ?;
+
+UPDATE "reviews_title" SET "updated_at" = '?'::timestamptz WHERE "reviews_title"."id" IN (...);
+
+INSERT INTO "reviews_change" ("resource", "object_id", "parent_id", "action", "changed_at") VALUES ('?', '?', NULL, '?', '?'::timestamptz), ... RETURNING "reviews_change"."id";
+
+UPDATE "reviews_genretitle" SET "genre_id" = NULL WHERE "reviews_genretitle"."genre_id" IN (...);
+
+DELETE FROM "reviews_genre" WHERE "reviews_genre"."id" IN (...);
+
+INSERT INTO "reviews_change" ("resource", "object_id", "parent_id", "action", "changed_at") VALUES ('?', '?', NULL, '?', '?'::timestamptz) RETURNING "reviews_change"."id";
@@ -0,0 +1,3 @@
+SELECT ? AS "a" FROM "reviews_title" WHERE "reviews_title"."id" = ? LIMIT ?;
+
+SELECT "reviews_review"."id", "reviews_review"."text", "reviews_review"."author_id", "reviews_review"."score", "reviews_review"."pub_date", "users_user"."id", "users_user"."username" FROM "reviews_review" INNER JOIN "users_user" ON ("reviews_review"."author_id" = "users_user"."id") WHERE ("reviews_review"."title_id" = ? AND "reviews_review"."id" = ?) LIMIT ?;
@@ -0,0 +1,5 @@
+SELECT ? AS "a" FROM "reviews_title" WHERE "reviews_title"."id" = ? LIMIT ?;
+
+SELECT COUNT(*) AS "__count" FROM "reviews_review" WHERE "reviews_review"."title_id" = ?;
+
+SELECT "reviews_review"."id", "reviews_review"."text", "users_user"."username", "reviews_review"."score", "reviews_review"."pub_date" FROM "reviews_review" INNER JOIN "users_user" ON ("reviews_review"."author_id" = "users_user"."id") WHERE "reviews_review"."title_id" = ? ORDER BY "reviews_review"."pub_date" DESC LIMIT ?;
@@ -0,0 +1,17 @@
+SELECT "reviews_category"."slug", "reviews_category"."id" FROM "reviews_category" WHERE "reviews_category"."slug" IN (...);
+
+SELECT "reviews_genre"."slug", "reviews_genre"."id" FROM "reviews_genre" WHERE "reviews_genre"."slug" IN (...);
+
+SELECT "reviews_title"."id" FROM "reviews_title" WHERE "reviews_title"."id" IN (...) ORDER BY "reviews_title"."name" ASC;
+
+SAVEPOINT "?";
+
+UPDATE "reviews_title" SET "name" = (CASE WHEN ("reviews_title"."id" = ?) THEN '?' ... ELSE NULL END)::varchar(?), "year" = (CASE WHEN ("reviews_title"."id" = ?) THEN ? ... ELSE NULL END)::smallint, "description" = (CASE WHEN ("reviews_title"."id" = ?) THEN NULL ... ELSE NULL END)::text, "category_id" = (CASE WHEN ("reviews_title"."id" = ?) THEN ? ... ELSE NULL END)::integer, "updated_at" = (CASE WHEN ("reviews_title"."id" = ?) THEN '?'::timestamptz ... ELSE NULL END)::timestamp with time zone WHERE "reviews_title"."id" IN (...);
+
+DELETE FROM "reviews_genretitle" WHERE "reviews_genretitle"."title_id" IN (...);
+
+INSERT INTO "reviews_genretitle" ("genre_id", "title_id") VALUES (?, ?), ... RETURNING "reviews_genretitle"."id";
+
+INSERT INTO "reviews_change" ("resource", "object_id", "parent_id", "action", "changed_at") VALUES ('?', '?', NULL, '?', '?'::timestamptz), ... RETURNING "reviews_change"."id";
+
+RELEASE SAVEPOINT "?";
@@ -0,0 +1,13 @@
+SELECT "reviews_category"."slug", "reviews_category"."id" FROM "reviews_category" WHERE "reviews_category"."slug" IN (...);
+
+SELECT "reviews_genre"."slug", "reviews_genre"."id" FROM "reviews_genre" WHERE "reviews_genre"."slug" IN (...);
+
+SAVEPOINT "?";
+
+INSERT INTO "reviews_title" ("name", "year", "description", "category_id", "rating_sum", "reviews_count", "rating", "trending_score", "score_1", "score_2", "score_3", "score_4", "score_5", "score_6", "score_7", "score_8", "score_9", "score_10", "updated_at") VALUES ('?', ?, NULL, ?, ?, ?, NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, '?'::timestamptz), ... RETURNING "reviews_title"."id";
+
+INSERT INTO "reviews_genretitle" ("genre_id", "title_id") VALUES (?, ?), ... RETURNING "reviews_genretitle"."id";
+
+INSERT INTO "reviews_change" ("resource", "object_id", "parent_id", "action", "changed_at") VALUES ('?', '?', NULL, '?', '?'::timestamptz), ... RETURNING "reviews_change"."id";
+
+RELEASE SAVEPOINT "?";
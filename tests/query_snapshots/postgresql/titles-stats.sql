@@ -0,0 +1 @@
+SELECT "reviews_title"."score_1", "reviews_title"."score_2", "reviews_title"."score_3", "reviews_title"."score_4", "reviews_title"."score_5", "reviews_title"."score_6", "reviews_title"."score_7", "reviews_title"."score_8", "reviews_title"."score_9", "reviews_title"."score_10" FROM "reviews_title" WHERE "reviews_title"."id" = ? LIMIT ?;
@@ -0,0 +1,13 @@
+SELECT "reviews_category"."id", "reviews_category"."name", "reviews_category"."slug", "reviews_category"."updated_at" FROM "reviews_category" WHERE "reviews_category"."slug" = '?' LIMIT ?;
+
+SELECT "reviews_title"."id" FROM "reviews_title" WHERE "reviews_title"."category_id" = ? ORDER BY "reviews_title"."name" ASC;
+
+UPDATE "reviews_title" SET "updated_at" = '?' WHERE "reviews_title"."id" IN (...);
+
+INSERT INTO "reviews_change" ("resource", "object_id", "parent_id", "action", "changed_at") VALUES ('?', '?', NULL, '?', '?'), ... RETURNING "reviews_change"."id";
+
+UPDATE "reviews_title" SET "category_id" = NULL WHERE "reviews_title"."category_id" IN (...);
+
+DELETE FROM "reviews_category" WHERE "reviews_category"."id" IN (...);
+
+INSERT INTO "reviews_change" ("resource", "object_id", "parent_id", "action", "changed_at") VALUES ('?', '?', NULL, '?', '?') RETURNING "reviews_change"."id";
@@ -0,0 +1,3 @@
+SELECT COUNT(*) AS "__count" FROM "reviews_category";
+
+SELECT "reviews_category"."id", "reviews_category"."name", "reviews_category"."slug", "reviews_category"."updated_at" FROM "reviews_category" ORDER BY "reviews_category"."name" ASC LIMIT ?;
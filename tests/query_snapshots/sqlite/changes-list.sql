@@ -0,0 +1,3 @@
+SELECT "reviews_change"."id" FROM "reviews_change" WHERE "reviews_change"."changed_at" <= '?' ORDER BY "reviews_change"."id" DESC LIMIT ?;
+
+SELECT "reviews_change"."id", "reviews_change"."resource", "reviews_change"."object_id", "reviews_change"."parent_id", "reviews_change"."action", "reviews_change"."changed_at" FROM "reviews_change" WHERE ("reviews_change"."id" <= ? AND "reviews_change"."id" > ?) ORDER BY "reviews_change"."id" ASC LIMIT ?;
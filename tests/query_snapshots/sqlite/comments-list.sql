@@ -0,0 +1,5 @@
+SELECT ? AS "a" FROM "reviews_review" WHERE ("reviews_review"."id" = ? AND "reviews_review"."title_id" = ?) LIMIT ?;
+
+SELECT COUNT(*) AS "__count" FROM "reviews_comment" WHERE "reviews_comment"."review_id" = ?;
+
+SELECT "reviews_comment"."id", "reviews_comment"."text", "users_user"."username", "reviews_comment"."pub_date" FROM "reviews_comment" INNER JOIN "users_user" ON ("reviews_comment"."author_id" = "users_user"."id") WHERE "reviews_comment"."review_id" = ? ORDER BY "reviews_comment"."pub_date" DESC LIMIT ?;
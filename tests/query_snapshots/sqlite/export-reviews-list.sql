@@ -0,0 +1 @@
+SELECT "reviews_review"."id", "reviews_review"."title_id", "reviews_review"."text", "users_user"."username", "reviews_review"."score", "reviews_review"."pub_date", "reviews_review"."updated_at" FROM "reviews_review" INNER JOIN "users_user" ON ("reviews_review"."author_id" = "users_user"."id") ORDER BY "reviews_review"."id" ASC;
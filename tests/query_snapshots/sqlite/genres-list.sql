@@ -0,0 +1,3 @@
+SELECT COUNT(*) AS "__count" FROM "reviews_genre";
+
+SELECT "reviews_genre"."id", "reviews_genre"."name", "reviews_genre"."slug", "reviews_genre"."updated_at" FROM "reviews_genre" ORDER BY "reviews_genre"."name" ASC LIMIT ?;
@@ -0,0 +1,3 @@
+SELECT COUNT(*) AS "__count" FROM "reviews_leaderboardentry" WHERE ("reviews_leaderboardentry"."kind" = '?' AND "reviews_leaderboardentry"."scope" = '?' AND "reviews_leaderboardentry"."scope_key" = ?);
+
+SELECT "reviews_leaderboardentry"."id", "reviews_leaderboardentry"."position", "reviews_leaderboardentry"."title_id", "reviews_leaderboardentry"."value", "reviews_title"."id", "reviews_title"."name", "reviews_title"."year", "reviews_title"."reviews_count", "reviews_title"."rating" FROM "reviews_leaderboardentry" INNER JOIN "reviews_title" ON ("reviews_leaderboardentry"."title_id" = "reviews_title"."id") WHERE ("reviews_leaderboardentry"."kind" = '?' AND "reviews_leaderboardentry"."scope" = '?' AND "reviews_leaderboardentry"."scope_key" = ?) ORDER BY "reviews_leaderboardentry"."position" ASC LIMIT ?;
@@ -0,0 +1,21 @@
+SELECT "reviews_category"."slug", "reviews_category"."id" FROM "reviews_category" WHERE "reviews_category"."slug" IN (...);
+
+SELECT "reviews_genre"."slug", "reviews_genre"."id" FROM "reviews_genre" WHERE "reviews_genre"."slug" IN (...);
+
+SELECT "reviews_title"."id" FROM "reviews_title" WHERE "reviews_title"."id" IN (...) ORDER BY "reviews_title"."name" ASC;
+
+SAVEPOINT "?";
+
+UPDATE "reviews_title" SET "name" = CASE WHEN ("reviews_title"."id" = ?) THEN '?' ... ELSE NULL END, "year" = CASE WHEN ("reviews_title"."id" = ?) THEN ? ... ELSE NULL END, "description" = CASE WHEN ("reviews_title"."id" = ?) THEN NULL ... ELSE NULL END, "category_id" = CASE WHEN ("reviews_title"."id" = ?) THEN ? ... ELSE NULL END, "updated_at" = CASE WHEN ("reviews_title"."id" = ?) THEN '?' ... ELSE NULL END WHERE "reviews_title"."id" IN (...);
+
+DELETE FROM "reviews_genretitle" WHERE "reviews_genretitle"."title_id" IN (...);
+
+INSERT INTO "reviews_genretitle" ("genre_id", "title_id") VALUES (?, ?), ... RETURNING "reviews_genretitle"."id";
+
+INSERT INTO "reviews_change" ("resource", "object_id", "parent_id", "action", "changed_at") VALUES ('?', '?', NULL, '?', '?'), ... RETURNING "reviews_change"."id";
+
+RELEASE SAVEPOINT "?";
+
+? times: DELETE FROM reviews_title_fts WHERE rowid = %s;
+
+? times: INSERT INTO reviews_title_fts (rowid, name, description) VALUES (%s, %s, %s);
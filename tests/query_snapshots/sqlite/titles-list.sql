@@ -0,0 +1,5 @@
+SELECT COUNT(*) AS "__count" FROM "reviews_title";
+
+SELECT "reviews_title"."id", "reviews_title"."name", "reviews_title"."year", "reviews_title"."description", "reviews_category"."name", "reviews_category"."slug", "reviews_title"."rating" FROM "reviews_title" LEFT OUTER JOIN "reviews_category" ON ("reviews_title"."category_id" = "reviews_category"."id") ORDER BY "reviews_title"."name" ASC LIMIT ?;
+
+SELECT "reviews_genretitle"."title_id", "reviews_genre"."name", "reviews_genre"."slug" FROM "reviews_genre" INNER JOIN "reviews_genretitle" ON ("reviews_genre"."id" = "reviews_genretitle"."genre_id") WHERE "reviews_genretitle"."title_id" IN (...) ORDER BY "reviews_genre"."name" ASC;
@@ -0,0 +1,3 @@
+SELECT COUNT(*) AS "__count" FROM "users_user";
+
+SELECT "users_user"."id", "users_user"."password", "users_user"."last_login", "users_user"."is_superuser", "users_user"."first_name", "users_user"."last_name", "users_user"."is_staff", "users_user"."is_active", "users_user"."date_joined", "users_user"."email", "users_user"."username", "users_user"."bio", "users_user"."role" FROM "users_user" LIMIT ?;
@@ -0,0 +1,109 @@
+import pytest
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    from api.serializers import user_serializers
+
+    calls = []
+    monkeypatch.setattr(
+        user_serializers, 'queue_confirm_code',
+        lambda *args: calls.append(args),
+    )
+    return calls
+
+
+@pytest.mark.django_db
+class TestAuthThrottling:
+    send_url = '/api/v1/auth/send_confirm_code/'
+    token_url = '/api/v1/auth/token/'
+
+    def test_code_is_not_resent_while_valid(self, api_client, sent):
+        from api.utils import get_confirm_code_from_cache
+
+        for _ in range(2):
+            response = api_client.post(
+                self.send_url, {'email': 'user@yamdb.fake'}
+            )
+            assert response.status_code == 200
+        code = get_confirm_code_from_cache('user@yamdb.fake')
+        assert sent == [('user@yamdb.fake', code)]
+
+    def test_email_bucket(self, api_client, sent):
+        for _ in range(3):
+            response = api_client.post(
+                self.send_url, {'email': 'User@yamdb.fake'}
+            )
+            assert response.status_code == 200
+        response = api_client.post(
+            self.send_url, {'email': ' user@yamdb.fake'}
+        )
+        assert response.status_code == 429
+        assert int(response['Retry-After']) == 20
+
+        response = api_client.post(
+            self.send_url, {'email': 'other@yamdb.fake'}
+        )
+        assert response.status_code == 200
+
+    def test_ip_bucket(self, api_client, sent):
+        for i in range(10):
+            response = api_client.post(
+                self.send_url, {'email': f'user{i}@yamdb.fake'}
+            )
+            assert response.status_code == 200
+        response = api_client.post(
+            self.send_url, {'email': 'user@yamdb.fake'},
+            REMOTE_ADDR='10.0.0.1',
+        )
+        assert response.status_code == 200
+        response = api_client.post(
+            self.send_url, {'email': 'user@yamdb.fake'}
+        )
+        assert response.status_code == 429
+
+    def test_spoofed_forwarded_for_shares_bucket(self, api_client, sent):
+        # nginx дописывает адрес клиента в конец X-Forwarded-For
+        statuses = [
+            api_client.post(
+                self.send_url, {'email': f'user{i}@yamdb.fake'},
+                HTTP_X_FORWARDED_FOR=f'10.0.{i}.1, 203.0.113.7',
+            ).status_code
+            for i in range(11)
+        ]
+        assert statuses == [200] * 10 + [429]
+        response = api_client.post(
+            self.send_url, {'email': 'user@yamdb.fake'},
+            HTTP_X_FORWARDED_FOR='203.0.113.7, 203.0.113.8',
+        )
+        assert response.status_code == 200
+
+    def test_token_guessing_is_limited(self, api_client):
+        data = {'email': 'user@yamdb.fake', 'confirmation_code': '000000'}
+        statuses = [
+            api_client.post(self.token_url, data).status_code
+            for _ in range(6)
+        ]
+        assert statuses == [400] * 5 + [429]
+
+    def test_bucket_refills(self, monkeypatch):
+        from api import throttling
+
+        now = 1000.0
+        monkeypatch.setattr(throttling.time, 'time', lambda: now)
+        waits = [throttling.take_token('test', '2/min') for _ in range(3)]
+        assert waits == [0, 0, 30]
+        now += 30
+        assert throttling.take_token('test', '2/min') == 0
+
+    def test_redis_bucket(self, redis_cache):
+        from api import throttling
+        from api.utils import get_redis_client
+
+        waits = [throttling.take_token('test', '2/min') for _ in range(3)]
+        assert waits[:2] == [0, 0]
+        assert 29 < waits[2] <= 30
+        # Корзина обновлена скриптом Lua в хеше Redis
+        client, key = get_redis_client(f'{throttling.CACHE_PREFIX}:test')
+        assert client is not None
+        assert set(client.hgetall(key)) == {b'tokens', b'ts'}
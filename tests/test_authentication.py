@@ -0,0 +1,80 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def user_queries(queries):
+    return [q for q in queries if 'users_user' in q['sql']]
+
+
+@pytest.fixture
+def user(db):
+    from users.models import User
+
+    return User.objects.create(email='user@yamdb.fake', username='user')
+
+
+@pytest.fixture
+def user_client(api_client, user):
+    api_client.credentials(
+        HTTP_AUTHORIZATION=f'Bearer {user.get_token()["token"]}'
+    )
+    return api_client
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    url = '/api/v1/categories/'
+
+    def post(self, client):
+        with CaptureQueriesContext(connection) as context:
+            response = client.post(
+                self.url, {'name': 'Фильм', 'slug': 'movie'}, format='json'
+            )
+        return response, user_queries(context.captured_queries)
+
+    def test_cached_user_skips_users_query(self, user_client):
+        response, queries = self.post(user_client)
+        assert response.status_code == 403
+        assert len(queries) == 1, 'Промах кеша читает пользователя из БД'
+
+        response, queries = self.post(user_client)
+        assert response.status_code == 403
+        assert queries == []
+
+    def test_role_change_invalidates_cache(
+        self, user_client, user, django_capture_on_commit_callbacks
+    ):
+        from api.authentication import clear_local_cache
+        from users.models import User
+
+        self.post(user_client)
+        with django_capture_on_commit_callbacks(execute=True):
+            user.role = User.Role.ADMIN
+            user.save()
+        # Другой процесс: локальный кеш пуст, общий кеш сброшен сигналом
+        clear_local_cache()
+        response, queries = self.post(user_client)
+        assert response.status_code == 201
+        assert len(queries) == 1
+
+    def test_cached_user_as_author(self, user_client, user, make_catalog):
+        title = make_catalog(titles=1, reviews=0)[0]
+        user_client.get('/api/v1/users/me/')
+
+        response = user_client.post(
+            f'/api/v1/titles/{title.id}/reviews/',
+            {'text': 'Текст', 'score': 7},
+            format='json',
+        )
+        assert response.status_code == 201
+        assert response.json()['author'] == user.username
+
+    def test_inactive_user(
+        self, user_client, user, django_capture_on_commit_callbacks
+    ):
+        user_client.get('/api/v1/users/me/')
+        with django_capture_on_commit_callbacks(execute=True):
+            user.is_active = False
+            user.save()
+        assert user_client.get('/api/v1/users/me/').status_code == 401
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+from django.core.management import call_command
+
+
+def generate(**options):
+    from reviews.models import Review, Title
+
+    call_command(
+        'generate_data', users=20, titles=30, reviews=200, comments=50,
+        categories=3, genres=5, seed=7, clear=True, **options
+    )
+    return (
+        list(Title.objects.values_list('name', 'rating').order_by('id')),
+        list(
+            Review.objects.values_list('title_id', 'author_id', 'score')
+            .order_by('id')
+        ),
+    )
+
+
+@pytest.mark.django_db
+class TestBenchmark:
+
+    def test_generate_data_is_reproducible(self):
+        from reviews.models import Review, Title
+
+        first = generate()
+        second = generate()
+
+        assert first == second
+        assert Title.objects.count() == 30
+        # Рейтинг пересчитан по сгенерированным отзывам
+        title = Title.objects.order_by('-reviews_count').first()
+        assert title.reviews_count == Review.objects.filter(
+            title=title
+        ).count()
+
+    def test_benchmark_reports_json(self, tmp_path):
+        generate()
+        output = tmp_path / 'result.json'
+
+        call_command(
+            'benchmark', iterations=2, output=str(output),
+            only=['titles_list', 'reviews_list', 'auth_token'],
+        )
+
+        report = json.loads(output.read_text(encoding='utf-8'))
+        assert report['dataset']['titles'] == 30
+        names = [result['name'] for result in report['results']]
+        assert names == ['titles_list', 'reviews_list', 'auth_token']
+        for result in report['results']:
+            assert result['status'] == 200
+            assert result['p50_ms'] <= result['p95_ms']
+
+    def test_email_suite(self, tmp_path):
+        output = tmp_path / 'result.json'
+
+        call_command(
+            'benchmark', 'email', iterations=1, warmup=0, output=str(output)
+        )
+
+        results = json.loads(output.read_text(encoding='utf-8'))['results']
+        connections = {
+            result['name']: result['connections'] for result in results
+        }
+        assert connections == {'send_each': 50, 'send_batch': 1}
+        assert all(result['messages'] == 50 for result in results)
@@ -0,0 +1,151 @@
+import pytest
+
+
+def test_csv_row_keeps_null_and_empty_string_apart():
+    from reviews.bulk import csv_row
+
+    assert csv_row([1, None, '', 'a"b', 'c,d']) == (
+        '"1",,"","a""b","c,d"\n'
+    )
+
+
+@pytest.mark.postgres
+@pytest.mark.django_db
+def test_copy_writes_null():
+    from reviews.bulk import BulkWriter
+    from reviews.models import Title
+    from users.models import User
+
+    writer = BulkWriter('default')
+    writer.write(
+        Title,
+        [
+            {'id': 1, 'name': 'Без описания', 'year': 2000},
+            {'id': 2, 'name': 'Пустое', 'year': 2000, 'description': ''},
+        ],
+    )
+    writer.write(
+        User,
+        [{'id': 1, 'username': 'user', 'email': 'user@yamdb.fake'}],
+    )
+    assert dict(Title.objects.values_list('id', 'description')) == {
+        1: None,
+        2: '',
+    }
+    assert Title.objects.get(pk=1).rating is None
+    assert User.objects.get(pk=1).last_login is None
+
+
+@pytest.mark.django_db
+class TestClear:
+
+    def test_filled_dependents_are_not_wiped(self, make_catalog):
+        from django.core.management import CommandError, call_command
+        from reviews.models import Review, Title
+
+        make_catalog(titles=2, reviews=1)
+        with pytest.raises(CommandError, match='reviews_review'):
+            call_command('load_data', '--only', 'title')
+        assert Title.objects.count() == 2
+        assert Review.objects.count() == 2
+
+    def test_only_selected_tables_are_cleared(self, make_catalog):
+        from reviews.bulk import BulkWriter
+        from reviews.models import Category, GenreTitle, Review, Title
+
+        make_catalog(titles=2, reviews=1)
+        Review.objects.all().delete()
+        BulkWriter('default').clear([Title, GenreTitle])
+        assert not Title.objects.exists()
+        assert not GenreTitle.objects.exists()
+        assert Category.objects.exists()
+
+    def test_clear_skips_model_signals(self, make_catalog):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from reviews.bulk import BulkWriter
+        from reviews.models import Change, GenreTitle, Review, Title
+
+        make_catalog(titles=3, reviews=2)
+        changes = Change.objects.count()
+        with CaptureQueriesContext(connection) as context:
+            BulkWriter('default').clear([Title, GenreTitle, Review])
+        writes = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith(('DELETE', 'TRUNCATE', 'UPDATE'))
+        ]
+        assert len(writes) <= 3, 'Не больше запроса на таблицу'
+        assert not Review.objects.exists()
+        assert Change.objects.count() == changes
+
+
+def read_csv(filename):
+    import csv
+    from os.path import join
+
+    from django.conf import settings
+
+    path = join(settings.BASE_DIR, 'static', 'data', filename)
+    with open(path, encoding='utf-8', newline='') as file:
+        return list(csv.DictReader(file))
+
+
+@pytest.mark.django_db
+class TestLoadData:
+
+    def test_load_bundled_data(self, api_client):
+        from collections import defaultdict
+
+        from django.core.management import call_command
+        from reviews.management.commands.load_data import MODEL
+        from reviews.models import Category, Title
+
+        call_command('load_data', '--batch-size', '7')
+        for model, filename in MODEL.values():
+            assert model.objects.count() == len(read_csv(filename)), filename
+
+        scores = defaultdict(list)
+        for row in read_csv('review.csv'):
+            scores[int(row['title_id'])].append(int(row['score']))
+        counters = Title.objects.values_list(
+            'pk', 'rating_sum', 'reviews_count', 'rating'
+        )
+        for pk, rating_sum, reviews_count, rating in counters:
+            expected = scores.get(pk, [])
+            assert (rating_sum, reviews_count) == (
+                sum(expected), len(expected)
+            )
+            assert rating == (
+                sum(expected) // len(expected) if expected else None
+            )
+
+        response = api_client.get('/api/v1/titles/', {'search': 'шоушенк'})
+        assert [item['name'] for item in response.json()['results']] == [
+            'Побег из Шоушенка'
+        ]
+        # Последовательности id сдвинуты за загруженные id
+        category = Category.objects.create(name='Новая', slug='new')
+        loaded = [int(row['id']) for row in read_csv('category.csv')]
+        assert category.pk > max(loaded)
+
+    def test_append(self):
+        from django.core.management import call_command
+        from reviews.models import Comment, Review, Title
+
+        call_command('load_data')
+        Comment.objects.all().delete()
+        ratings = list(Title.objects.values_list('pk', 'rating'))
+        call_command('load_data', '--only', 'comment', '--append')
+        assert Comment.objects.count() == len(read_csv('comments.csv'))
+        assert Review.objects.count() == len(read_csv('review.csv'))
+        assert list(Title.objects.values_list('pk', 'rating')) == ratings
+
+    def test_reload_replaces_data(self):
+        from django.core.management import call_command
+        from reviews.models import Review
+
+        call_command('load_data')
+        Review.objects.filter(pk=1).update(text='Изменено')
+        call_command('load_data')
+        assert Review.objects.get(pk=1).text != 'Изменено'
+        assert Review.objects.count() == len(read_csv('review.csv'))
@@ -0,0 +1,159 @@
+import pytest
+
+
+@pytest.fixture
+def admin_client(api_client):
+    from users.models import User
+
+    admin = User.objects.create(
+        email='admin@yamdb.fake', username='admin', role=User.Role.ADMIN
+    )
+    api_client.force_authenticate(admin)
+    return api_client
+
+
+def feed(client, **params):
+    response = client.get('/api/v1/changes/', params)
+    assert response.status_code == 200, response.content
+    return response.json()
+
+
+def entries(data):
+    return [
+        (item['resource'], item['object_id'], item['action'])
+        for item in data['results']
+    ]
+
+
+@pytest.mark.django_db
+class TestChangeFeed:
+
+    def test_feed_follows_cursor(self, admin_client):
+        from reviews.models import Category, Genre, Title
+
+        category = Category.objects.create(name='Фильм', slug='movie')
+        genre = Genre.objects.create(name='Драма', slug='drama')
+        start = feed(admin_client)['cursor']
+
+        response = admin_client.post('/api/v1/titles/', {
+            'name': 'Фильм', 'year': 2000,
+            'category': 'movie', 'genre': ['drama'],
+        }, format='json')
+        title_id = str(response.json()['id'])
+        review = admin_client.post(
+            f'/api/v1/titles/{title_id}/reviews/',
+            {'text': 'Текст', 'score': 7},
+            format='json',
+        ).json()
+        admin_client.delete(
+            f'/api/v1/titles/{title_id}/reviews/{review["id"]}/'
+        )
+
+        data = feed(admin_client, after=start)
+        changes = entries(data)
+        assert ('titles', title_id, 'update') in changes
+        assert changes[-2:] == [
+            ('titles', title_id, 'update'),
+            ('reviews', str(review['id']), 'delete'),
+        ]
+        assert data['results'][-1]['parent_id'] == int(title_id)
+        assert not data['has_more']
+
+        again = feed(admin_client, after=data['cursor'])
+        assert again == {
+            'cursor': data['cursor'], 'has_more': False, 'results': []
+        }
+
+        genre.delete()
+        category.delete()
+        changes = entries(feed(admin_client, after=data['cursor']))
+        assert changes == [
+            ('titles', title_id, 'update'),
+            ('genres', 'drama', 'delete'),
+            ('titles', title_id, 'update'),
+            ('categories', 'movie', 'delete'),
+        ]
+        assert Title.objects.get(pk=title_id).category is None
+
+    def test_limit_and_resource_filter(self, admin_client, make_catalog):
+        make_catalog(titles=2, reviews=2)
+
+        data = feed(admin_client, resource='categories,genres', limit=2)
+        assert entries(data) == [
+            ('categories', 'movie', 'update'),
+            ('genres', 'genre-0', 'update'),
+        ]
+        assert data['has_more']
+        data = feed(
+            admin_client, resource='categories,genres', after=data['cursor']
+        )
+        assert entries(data) == [('genres', 'genre-1', 'update')]
+
+        response = admin_client.get('/api/v1/changes/?resource=users')
+        assert response.status_code == 400
+
+    def test_import_resets_resources(self, admin_client):
+        from reviews.signals import data_imported
+
+        data_imported.send(sender=None, models=['user', 'review'])
+        assert entries(feed(admin_client)) == [
+            ('reviews', '', 'reset'),
+            ('titles', '', 'reset'),
+        ]
+
+    def test_slug_rename(self, admin_client, make_catalog):
+        from reviews.models import Category, Genre
+
+        title = make_catalog(titles=1, reviews=0, genres=1)[0]
+        start = feed(admin_client)['cursor']
+        category = Category.objects.get(slug='movie')
+        category.slug = 'film'
+        category.save()
+        category.name = 'Кино'
+        category.save()
+        genre = Genre.objects.only('id', 'slug').get(slug='genre-0')
+        genre.slug = 'drama'
+        genre.save()
+
+        assert entries(feed(admin_client, after=start)) == [
+            ('categories', 'movie', 'delete'),
+            ('titles', str(title.id), 'update'),
+            ('categories', 'film', 'update'),
+            ('categories', 'film', 'update'),
+            ('genres', 'genre-0', 'delete'),
+            ('titles', str(title.id), 'update'),
+            ('genres', 'drama', 'update'),
+        ]
+
+    def test_commit_lag(self, admin_client, settings):
+        from datetime import timedelta
+
+        from django.utils import timezone
+        from reviews.models import Category, Change
+
+        start = feed(admin_client)['cursor']
+        settings.COMMIT_LAG = 30
+        Category.objects.create(name='Фильм', slug='movie')
+        Category.objects.create(name='Книга', slug='book')
+        assert feed(admin_client, after=start)['results'] == []
+
+        first = Change.objects.order_by('id').first()
+        Change.objects.filter(pk=first.pk).update(
+            changed_at=timezone.now() - timedelta(seconds=60)
+        )
+        data = feed(admin_client, after=start)
+        assert entries(data) == [('categories', 'movie', 'update')]
+        assert data['cursor'] == first.pk
+
+    def test_updated_at(self, make_catalog):
+        from reviews.models import Review, Title
+
+        title = make_catalog(titles=1, reviews=1)[0]
+        before = Title.objects.get(pk=title.pk).updated_at
+        review = Review.objects.get(title=title)
+        review.score = 1
+        review.save()
+        assert Title.objects.get(pk=title.pk).updated_at > before
+
+    def test_admin_only(self, api_client):
+        assert api_client.get('/api/v1/changes/').status_code == 401
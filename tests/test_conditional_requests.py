@@ -0,0 +1,61 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.mark.django_db
+class TestConditionalRequests:
+
+    def test_etag_not_modified(self, api_client, make_catalog):
+        title = make_catalog(titles=1, reviews=3)[0]
+        url = f'/api/v1/titles/{title.id}/reviews/'
+        response = api_client.get(url)
+        etag = response['ETag']
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response['ETag'] == etag
+        assert len(context.captured_queries) == 0
+
+    def test_etag_changes_after_review(
+        self, api_client, make_catalog, django_capture_on_commit_callbacks
+    ):
+        from reviews.models import Review
+
+        title = make_catalog(titles=1, reviews=2)[0]
+        url = f'/api/v1/titles/{title.id}/'
+        etag = api_client.get(url)['ETag']
+        with django_capture_on_commit_callbacks(execute=True):
+            Review.objects.filter(title=title).first().delete()
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response['ETag'] != etag
+
+    def test_if_modified_since(
+        self, api_client, make_catalog, django_capture_on_commit_callbacks
+    ):
+        from reviews.models import Comment, Review
+
+        title = make_catalog(titles=1, reviews=1)[0]
+        review = Review.objects.get(title=title)
+        with django_capture_on_commit_callbacks(execute=True):
+            Comment.objects.create(
+                review=review, author=review.author, text='Текст'
+            )
+        url = f'/api/v1/titles/{title.id}/reviews/{review.id}/comments/'
+        last_modified = api_client.get(url)['Last-Modified']
+
+        response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == 304
+
+    def test_different_urls_have_different_etags(
+        self, api_client, make_catalog
+    ):
+        make_catalog(titles=6)
+
+        first = api_client.get('/api/v1/titles/')['ETag']
+        second = api_client.get('/api/v1/titles/?page=2')['ETag']
+        assert first != second
@@ -0,0 +1,108 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.db import connection, connections
+from django.test.utils import CaptureQueriesContext
+
+
+class BarrierCache:
+    """
+    Кеш, в котором чтение кода ждёт второй запрос: оба запроса
+    получают код до того, как один из них его удалит.
+    """
+
+    def __init__(self, cache, key, parties):
+        self.cache = cache
+        self.key = key
+        self.barrier = threading.Barrier(parties)
+
+    def get(self, key, *args, **kwargs):
+        value = self.cache.get(key, *args, **kwargs)
+        if key == self.key:
+            self.barrier.wait(timeout=5)
+        return value
+
+    def __getattr__(self, name):
+        return getattr(self.cache, name)
+
+
+@pytest.mark.django_db
+class TestConfirmCode:
+    url = '/api/v1/auth/token/'
+    email = 'user@yamdb.fake'
+
+    def get_token(self, api_client, confirm_code):
+        return api_client.post(
+            self.url, {'email': self.email, 'confirmation_code': confirm_code}
+        )
+
+    def test_code_is_single_use(self, api_client):
+        from api.utils import save_confirm_code_in_cache
+        from users.models import User
+
+        save_confirm_code_in_cache(self.email, '123456')
+        response = self.get_token(api_client, '123456')
+        assert response.status_code == 200
+        assert 'token' in response.json()
+        assert User.objects.filter(email=self.email).exists()
+
+        assert self.get_token(api_client, '123456').status_code == 400
+
+    def test_existing_user_is_not_written(self, api_client):
+        from api.utils import save_confirm_code_in_cache
+        from users.models import User
+
+        User.objects.create(email=self.email, username='user')
+        save_confirm_code_in_cache(self.email, '123456')
+        with CaptureQueriesContext(connection) as context:
+            response = self.get_token(api_client, '123456')
+        assert response.status_code == 200
+        assert len(context.captured_queries) == 1
+        assert context.captured_queries[0]['sql'].startswith('SELECT')
+
+    def test_failed_attempts_burn_code(self, settings):
+        from api.utils import (
+            get_confirm_code_from_cache,
+            save_confirm_code_in_cache,
+            verify_confirm_code,
+        )
+
+        settings.CONFIRM_CODE_MAX_ATTEMPTS = 3
+        save_confirm_code_in_cache(self.email, '123456')
+        assert not verify_confirm_code(self.email, '000000')
+        assert not verify_confirm_code(self.email, '000001')
+        assert get_confirm_code_from_cache(self.email) == '123456'
+        assert not verify_confirm_code(self.email, '000002')
+        assert get_confirm_code_from_cache(self.email) is None
+        assert not verify_confirm_code(self.email, '123456')
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize('backend', ['locmem', 'redis'])
+def test_concurrent_requests_spend_code_once(request, monkeypatch, backend):
+    from api import utils
+    from rest_framework.test import APIClient
+
+    email = 'user@yamdb.fake'
+    if backend == 'redis':
+        request.getfixturevalue('redis_cache')
+    else:
+        monkeypatch.setattr(
+            utils, 'cache',
+            BarrierCache(utils.cache, utils.confirm_code_key(email), 2),
+        )
+    utils.save_confirm_code_in_cache(email, '123456')
+
+    def get_token(_):
+        try:
+            return APIClient().post(
+                TestConfirmCode.url,
+                {'email': email, 'confirmation_code': '123456'},
+            ).status_code
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        statuses = sorted(pool.map(get_token, range(2)))
+    assert statuses == [200, 400]
@@ -0,0 +1,111 @@
+import csv
+import io
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.fixture
+def admin_client(api_client):
+    from users.models import User
+
+    admin = User.objects.create(
+        email='admin@yamdb.fake', username='admin', role=User.Role.ADMIN
+    )
+    api_client.force_authenticate(admin)
+    return api_client
+
+
+def content(response):
+    assert response.streaming
+    return b''.join(response.streaming_content).decode()
+
+
+@pytest.mark.django_db
+class TestExport:
+
+    def test_titles_ndjson(self, admin_client, make_catalog):
+        titles = make_catalog(titles=3, reviews=2)
+
+        response = admin_client.get('/api/v1/export/titles/')
+        assert response.status_code == 200
+        assert response['Content-Type'].startswith('application/x-ndjson')
+        rows = [json.loads(line) for line in content(response).splitlines()]
+        assert [row['id'] for row in rows] == [title.id for title in titles]
+        assert rows[0].pop('updated_at')
+        assert rows[0] == {
+            'id': titles[0].id,
+            'name': titles[0].name,
+            'year': 2000,
+            'description': 'Описание',
+            'category': 'movie',
+            'genre': ['genre-0', 'genre-1'],
+            'rating': 5,
+        }
+
+    def test_titles_csv_with_filter(self, admin_client, make_catalog):
+        make_catalog(titles=3)
+
+        response = admin_client.get(
+            '/api/v1/export/titles/?format=csv&name=00001'
+        )
+        assert response['Content-Type'].startswith('text/csv')
+        rows = list(csv.DictReader(io.StringIO(content(response))))
+        assert len(rows) == 1
+        assert rows[0]['genre'] == 'genre-0,genre-1'
+        assert rows[0]['name'] == 'Произведение 00001'
+
+    def test_chunks_use_constant_queries(
+        self, admin_client, make_catalog, monkeypatch
+    ):
+        from api.views.export_views import ExportViewSet
+
+        monkeypatch.setattr(ExportViewSet, 'chunk_size', 2)
+        make_catalog(titles=5)
+        with CaptureQueriesContext(connection) as context:
+            response = admin_client.get('/api/v1/export/titles/')
+            lines = content(response).splitlines()
+        assert len(lines) == 5
+        genre_queries = [
+            q for q in context.captured_queries
+            if 'reviews_genretitle' in q['sql']
+        ]
+        assert len(genre_queries) == 3, 'Жанры загружаются по пачкам'
+
+    def test_since(self, admin_client, make_catalog):
+        from datetime import timedelta
+
+        from django.utils import timezone
+        from reviews.models import Review
+
+        make_catalog(titles=1, reviews=3)
+        old, *new = Review.objects.order_by('id')
+        Review.objects.filter(pk=old.pk).update(
+            updated_at=timezone.now() - timedelta(days=2)
+        )
+        since = (timezone.now() - timedelta(days=1)).isoformat()
+
+        response = admin_client.get(
+            '/api/v1/export/reviews/', {'since': since}
+        )
+        rows = [json.loads(line) for line in content(response).splitlines()]
+        assert [row['id'] for row in rows] == [review.id for review in new]
+        assert set(rows[0]) == {
+            'id', 'title', 'text', 'author', 'score', 'pub_date', 'updated_at'
+        }
+
+        response = admin_client.get(
+            '/api/v1/export/comments/?since=yesterday'
+        )
+        assert response.status_code == 400
+        assert 'since' in json.loads(response.content)
+
+    def test_admin_only(self, api_client, make_catalog):
+        from users.models import User
+
+        user = User.objects.create(email='u@yamdb.fake', username='u')
+        api_client.force_authenticate(user)
+        response = api_client.get('/api/v1/export/comments/')
+        assert response.status_code == 403
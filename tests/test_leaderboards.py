@@ -0,0 +1,131 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def positions(client, url):
+    response = client.get(url)
+    assert response.status_code == 200, response.content
+    return [
+        (item['title']['id'], item['value'])
+        for item in response.json()['results']
+    ]
+
+
+@pytest.mark.django_db
+class TestLeaderboards:
+    rating_url = '/api/v1/leaderboards/rating/'
+    reviews_url = '/api/v1/leaderboards/reviews/'
+
+    @pytest.fixture
+    def titles(self, make_catalog):
+        from reviews.leaderboards import refresh_leaderboards
+        from reviews.models import Category, Review, Title
+
+        titles = make_catalog(titles=3, reviews=2)
+        # Второе произведение — другого года и без отзывов
+        Review.objects.filter(title=titles[1]).delete()
+        Title.objects.filter(pk=titles[1].pk).update(year=1999)
+        book = Category.objects.create(name='Книга', slug='book')
+        Title.objects.filter(pk=titles[2].pk).update(category=book)
+        review = Review.objects.filter(title=titles[2]).first()
+        review.score = 9
+        review.save()
+        refresh_leaderboards(full=True)
+        return titles
+
+    def test_boards(self, api_client, titles):
+        first, _, third = titles
+        assert positions(api_client, self.rating_url) == [
+            (third.id, 7), (first.id, 5)
+        ]
+        assert positions(api_client, self.reviews_url) == [
+            (third.id, 2), (first.id, 2)
+        ]
+        assert positions(api_client, f'{self.rating_url}?category=book') == [
+            (third.id, 7)
+        ]
+        assert positions(api_client, f'{self.rating_url}?genre=genre-1') == [
+            (third.id, 7), (first.id, 5)
+        ]
+        assert positions(api_client, f'{self.rating_url}?year=1999') == []
+        assert positions(api_client, f'{self.rating_url}?genre=none') == []
+
+    def test_read_without_aggregation(self, api_client, titles):
+        with CaptureQueriesContext(connection) as context:
+            api_client.get(f'{self.rating_url}?category=movie')
+        assert len(context.captured_queries) == 2, 'COUNT и страница'
+        sql = context.captured_queries[1]['sql']
+        assert 'reviews_review' not in sql
+        assert 'AVG' not in sql.upper()
+
+    def test_incremental_refresh(
+        self, api_client, titles, django_capture_on_commit_callbacks
+    ):
+        from reviews.leaderboards import refresh_leaderboards
+        from reviews.models import Review, Title
+        from users.models import User
+
+        first, second, third = titles
+        author = User.objects.create(email='new@yamdb.fake', username='new')
+        Review.objects.create(title=second, author=author, text='Т', score=10)
+        with django_capture_on_commit_callbacks(execute=True):
+            # Все, категория, два жанра и год второго произведения
+            assert refresh_leaderboards() == 5
+        assert positions(api_client, self.rating_url)[0] == (second.id, 10)
+        assert positions(api_client, f'{self.rating_url}?year=1999') == [
+            (second.id, 10)
+        ]
+
+        Title.objects.filter(pk=third.pk).delete()
+        with django_capture_on_commit_callbacks(execute=True):
+            refresh_leaderboards()
+        assert positions(api_client, f'{self.rating_url}?category=book') == []
+        assert refresh_leaderboards() == 0
+
+    def test_commit_lag(
+        self, api_client, titles, settings, django_capture_on_commit_callbacks
+    ):
+        from datetime import timedelta
+
+        from django.utils import timezone
+        from reviews.leaderboards import refresh_leaderboards
+        from reviews.models import Change, Review
+        from users.models import User
+
+        settings.COMMIT_LAG = 30
+        author = User.objects.create(email='new@yamdb.fake', username='new')
+        Review.objects.create(
+            title=titles[1], author=author, text='Т', score=10
+        )
+        # Запись журнала моложе задержки не сдвигает курсор
+        assert refresh_leaderboards() == 0
+        assert positions(api_client, f'{self.rating_url}?year=1999') == []
+
+        Change.objects.update(
+            changed_at=timezone.now() - timedelta(seconds=60)
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            assert refresh_leaderboards() == 5
+        assert positions(api_client, f'{self.rating_url}?year=1999') == [
+            (titles[1].id, 10)
+        ]
+
+    def test_duplicate_genre_link(self, api_client, titles):
+        from reviews.leaderboards import refresh_leaderboards
+        from reviews.models import GenreTitle
+
+        first, _, third = titles
+        link = GenreTitle.objects.filter(
+            title=first, genre__slug='genre-1'
+        ).first()
+        GenreTitle.objects.create(title=first, genre=link.genre)
+        refresh_leaderboards(full=True)
+        assert positions(api_client, f'{self.rating_url}?genre=genre-1') == [
+            (third.id, 7), (first.id, 5)
+        ]
+
+    @pytest.mark.parametrize('query', ['year=x', 'category=movie&year=2000'])
+    def test_invalid_scope(self, api_client, titles, query):
+        response = api_client.get(f'{self.rating_url}?{query}')
+        assert response.status_code == 400
@@ -0,0 +1,93 @@
+import pytest
+
+
+@pytest.fixture
+def scheduled(monkeypatch):
+    """Задачи Celery не отправляются брокеру, а записываются."""
+    from api.tasks import flush_confirm_codes, send_confirm_code
+
+    calls = []
+    for task in (flush_confirm_codes, send_confirm_code):
+        monkeypatch.setattr(
+            task, 'delay',
+            lambda *args, name=task.name: calls.append((name, args)),
+        )
+        monkeypatch.setattr(
+            task, 'apply_async',
+            lambda args=(), name=task.name, **kwargs: calls.append(
+                (name, tuple(args))
+            ),
+        )
+    return calls
+
+
+class TestConfirmCodeDelivery:
+
+    def test_codes_are_sent_in_one_connection(self, scheduled):
+        from api.benchmarks.mail import local_smtp
+        from api.tasks import flush_confirm_codes, queue_confirm_code
+
+        for i in range(3):
+            queue_confirm_code(f'user{i}@yamdb.fake', f'00000{i}')
+        assert scheduled == [('api.tasks.flush_confirm_codes', ())]
+
+        with local_smtp() as server:
+            assert flush_confirm_codes() == 3
+        assert server.connections == 1
+        assert server.messages == 3
+        assert len(scheduled) == 1, 'Очередь пуста, повторов нет'
+
+    def test_failed_message_is_retried(self, scheduled, settings):
+        from api.benchmarks.mail import local_smtp
+        from api.tasks import flush_confirm_codes, queue_confirm_code
+
+        settings.EMAIL_BATCH_SIZE = 2
+        for email in ('bad@yamdb.fake', 'ok@yamdb.fake', 'next@yamdb.fake'):
+            queue_confirm_code(email, '123456')
+
+        with local_smtp(reject=['bad@yamdb.fake']) as server:
+            assert flush_confirm_codes() == 1
+            assert server.messages == 1
+            assert server.connections == 2, 'Соединение открыто заново'
+        assert scheduled[1:] == [
+            ('api.tasks.flush_confirm_codes', ()),
+            ('api.tasks.send_confirm_code', ('bad@yamdb.fake', '123456')),
+        ]
+
+    def test_periodic_flush_drains_lost_batch(self, scheduled, settings):
+        from api.benchmarks.mail import local_smtp
+        from api.tasks import flush_confirm_codes, queue_confirm_code
+
+        assert flush_confirm_codes.name in {
+            entry['task'] for entry in settings.CELERY_BEAT_SCHEDULE.values()
+        }
+        for i in range(3):
+            queue_confirm_code(f'user{i}@yamdb.fake', f'00000{i}')
+        # Запланированная первым кодом отправка потеряна
+        assert len(scheduled) == 1
+
+        with local_smtp() as server:
+            assert flush_confirm_codes() == 3
+            assert flush_confirm_codes() == 0
+        assert server.messages == 3
+        assert server.connections == 1, 'Пустая очередь без соединения'
+
+    def test_redis_outbox(self, redis_cache, scheduled):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from api.benchmarks.mail import local_smtp
+        from api.mail import OUTBOX_KEY, outbox_size
+        from api.tasks import flush_confirm_codes, queue_confirm_code
+        from api.utils import get_redis_client
+
+        codes = [(f'user{i}@yamdb.fake', f'{i:06}') for i in range(20)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda item: queue_confirm_code(*item), codes))
+        client, key = get_redis_client(OUTBOX_KEY)
+        assert client.llen(key) == 20, 'Очередь — список Redis'
+        assert scheduled == [('api.tasks.flush_confirm_codes', ())]
+
+        with local_smtp() as server:
+            assert flush_confirm_codes() == 20
+        assert server.messages == 20
+        assert outbox_size() == 0
@@ -0,0 +1,74 @@
+import pytest
+
+
+def walk(api_client, url, direction='next'):
+    """Проход по всем страницам курсора, возвращает id записей."""
+    ids, pages = [], 0
+    while url:
+        response = api_client.get(url)
+        assert response.status_code == 200
+        data = response.json()
+        assert 'count' not in data
+        ids.extend(item['id'] for item in data['results'])
+        url = data[direction]
+        pages += 1
+    return ids, pages
+
+
+@pytest.mark.django_db
+class TestCursorPagination:
+
+    def test_titles_cursor_matches_page_number_order(
+        self, api_client, make_catalog
+    ):
+        from reviews.models import Title
+
+        make_catalog(titles=12, reviews=1, genres=1)
+        # Одинаковые названия проверяют уникальный ключ сортировки.
+        Title.objects.filter(id__lte=4).update(name='Одинаковое')
+        expected = list(
+            Title.objects.order_by('name', 'id').values_list('id', flat=True)
+        )
+
+        ids, pages = walk(api_client, '/api/v1/titles/?pagination=cursor')
+
+        assert ids == expected
+        assert pages == 3
+
+    def test_previous_link(self, api_client, make_catalog):
+        make_catalog(titles=12, reviews=1, genres=1)
+        first = api_client.get('/api/v1/titles/?pagination=cursor').json()
+        second = api_client.get(first['next']).json()
+        back = api_client.get(second['previous']).json()
+
+        assert back['results'] == first['results']
+        assert back['previous'] is None
+
+    def test_reviews_cursor(self, api_client, make_catalog):
+        from reviews.models import Review
+
+        title = make_catalog(titles=1, reviews=7, genres=1)[0]
+        expected = list(
+            Review.objects.filter(title=title)
+            .order_by('-pub_date', '-id')
+            .values_list('id', flat=True)
+        )
+
+        ids, _ = walk(
+            api_client,
+            f'/api/v1/titles/{title.id}/reviews/?pagination=cursor',
+        )
+
+        assert ids == expected
+
+    def test_invalid_cursor(self, api_client, make_catalog):
+        make_catalog(titles=1)
+        response = api_client.get('/api/v1/titles/?cursor=invalid')
+
+        assert response.status_code == 404
+
+    def test_page_number_by_default(self, api_client, make_catalog):
+        make_catalog(titles=6)
+        data = api_client.get('/api/v1/titles/').json()
+
+        assert data['count'] == 6
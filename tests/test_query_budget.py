@@ -0,0 +1,254 @@
+"""
+Бюджет запросов к БД для всех маршрутов router_v1.
+
+Каждый маршрут вызывается на двух наборах данных разного размера
+и с разным размером страницы: количество и форма запросов не должны
+меняться. Нормализованный SQL сверяется со снимком
+в query_snapshots/<СУБД>/ (в репозитории хранятся снимки SQLite
+и PostgreSQL), поэтому изменение запросов видно в диффе. Без снимка
+тест не проходит.
+Обновление снимков: UPDATE_QUERY_SNAPSHOTS=1 pytest tests/test_query_budget.py
+"""
+import os
+import re
+from pathlib import Path
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+SNAPSHOT_DIR = Path(__file__).parent / 'query_snapshots'
+UPDATE_SNAPSHOTS = os.getenv('UPDATE_QUERY_SNAPSHOTS') == '1'
+
+# Размер набора данных и размер страницы для двух прогонов
+SMALL = ('small', 3, 2)
+LARGE = ('large', 12, 10)
+
+# Объект набора данных для параметра маршрута
+OBJECTS = {
+    'user': 'user',
+    'titles': 'title',
+    'categories': 'category',
+    'genres': 'genre',
+    'reviews': 'review',
+    'comments': 'comment',
+}
+PARENTS = {
+    'title_id': 'title',
+    'review_id': 'review',
+}
+# Обязательные параметры запроса маршрута
+QUERIES = {
+    'titles-batch': lambda data: 'ids=' + ','.join(
+        str(title.id) for title in data['titles']
+    ),
+}
+
+
+def bulk_titles(data, update=False):
+    """Элементы массовой записи: по элементу на произведение."""
+    return [
+        {
+            **({'id': title.id} if update else {}),
+            'name': f'Новое {title.name}',
+            'year': 2000,
+            'category': data['category'].slug,
+            'genre': [data['genre'].slug],
+        }
+        for title in data['titles']
+    ]
+
+
+# Методы и тела запросов маршрутов только на запись; снимок метода,
+# кроме первого, сохраняется с суффиксом метода
+BODIES = {
+    'titles-bulk': {
+        'post': bulk_titles,
+        'put': lambda data: bulk_titles(data, update=True),
+    },
+}
+
+
+def get_routes():
+    """
+    Случаи проверки: маршрут, параметры, действия и метод из BODIES
+    (None — метод выбирается по действиям маршрута).
+    """
+    from api.urls import router_v1
+
+    routes = []
+    for pattern in router_v1.urls:
+        methods = list(BODIES.get(pattern.name, [None]))
+        for method in methods:
+            case = pattern.name
+            if method != methods[0]:
+                case = f'{case}-{method}'
+            routes.append((
+                case, pattern.name, pattern.pattern.regex.groupindex,
+                pattern.callback.actions, method,
+            ))
+    return routes
+
+
+def normalize(sql):
+    """
+    SQL без значений параметров: строки и числа заменены на `?`,
+    списки IN, строки многострочной вставки и ветви CASE массового
+    обновления свёрнуты.
+    """
+    sql = re.sub(r"'(?:[^']|'')*'", "'?'", sql)
+    sql = re.sub(r'\b\d+(?:\.\d+)?\b', '?', sql)
+    sql = re.sub(r'SAVEPOINT "[^"]+"', 'SAVEPOINT "?"', sql)
+    # Имя серверного курсора PostgreSQL содержит счётчик курсоров
+    sql = re.sub(r'"_django_curs_[^"]+"', '"_django_curs_?"', sql)
+    sql = re.sub(
+        r'VALUES (\([^()]*\))(?:, \([^()]*\))+', r'VALUES \1, ...', sql
+    )
+    sql = re.sub(
+        r'(WHEN \([^()]*\) THEN \S+ )(?:WHEN \([^()]*\) THEN \S+ )+',
+        r'\1... ', sql,
+    )
+    return re.sub(r"IN \((?:'?\?'?)(?:, '?\?'?)*\)", 'IN (...)', sql)
+
+
+def build(prefix, size):
+    """Набор данных: size произведений, отзывов и комментариев."""
+    from reviews.models import (
+        Category, Comment, Genre, GenreTitle, Review, Title,
+    )
+    from reviews.leaderboards import refresh_leaderboards
+    from reviews.services import rebuild_ratings
+    from users.models import User
+
+    category = Category.objects.create(
+        name=f'Категория {prefix}', slug=f'{prefix}-category'
+    )
+    genres = [
+        Genre.objects.create(name=f'Жанр {prefix}{i}', slug=f'{prefix}-{i}')
+        for i in range(2)
+    ]
+    users = User.objects.bulk_create(
+        User(email=f'{prefix}{i}@yamdb.fake', username=f'{prefix}{i}')
+        for i in range(size)
+    )
+    titles = Title.objects.bulk_create(
+        Title(
+            name=f'Произведение {prefix}{i}',
+            year=2000,
+            description='Описание',
+            category=category,
+        )
+        for i in range(size)
+    )
+    GenreTitle.objects.bulk_create(
+        GenreTitle(genre=genre, title=title)
+        for title in titles
+        for genre in genres
+    )
+    Review.objects.bulk_create(
+        Review(title=title, author=user, text='Текст', score=5)
+        for title in titles
+        for user in users
+    )
+    review = Review.objects.filter(title=titles[0]).first()
+    Comment.objects.bulk_create(
+        Comment(review=review, author=user, text='Текст') for user in users
+    )
+    rebuild_ratings()
+    refresh_leaderboards(full=True)
+    return {
+        'user': users[0],
+        'title': titles[0],
+        'titles': titles,
+        'category': category,
+        'genre': genres[0],
+        'review': review,
+        'comment': review.comments.first(),
+    }
+
+
+def get_url(name, params, data):
+    basename = name.rsplit('-', 1)[0]
+    kwargs = {}
+    for param in params:
+        if param in PARENTS:
+            kwargs[param] = data[PARENTS[param]].id
+        else:
+            kwargs[param] = getattr(data[OBJECTS[basename]], param)
+    url = reverse(f'api:{name}', kwargs=kwargs)
+    if name in QUERIES:
+        url = f'{url}?{QUERIES[name](data)}'
+    return url
+
+
+def check_snapshot(name, queries):
+    path = SNAPSHOT_DIR / connection.vendor / f'{name}.sql'
+    content = ';\n\n'.join(queries) + ';\n'
+    if UPDATE_SNAPSHOTS:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding='utf-8')
+        return
+    assert path.exists(), (
+        f'Нет снимка запросов {path.relative_to(SNAPSHOT_DIR.parent)}, '
+        f'создайте его запуском с UPDATE_QUERY_SNAPSHOTS=1.'
+    )
+    assert content == path.read_text(encoding='utf-8'), (
+        f'Изменились запросы маршрута {name}, проверьте дифф снимка '
+        f'после запуска с UPDATE_QUERY_SNAPSHOTS=1.'
+    )
+
+
+@pytest.fixture
+def admin_client(api_client):
+    from users.models import User
+
+    admin = User.objects.create(
+        email='admin@yamdb.fake', username='admin', role=User.Role.ADMIN
+    )
+    api_client.credentials(
+        HTTP_AUTHORIZATION=f'Bearer {admin.get_token()["token"]}'
+    )
+    # Пользователь попадает в кеш аутентификации: в снимках запросов
+    # нет чтения таблицы пользователей
+    api_client.get(reverse('api:user-me'))
+    return api_client
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'case, name, params, actions, method', get_routes(),
+    ids=[route[0] for route in get_routes()],
+)
+def test_query_budget(
+    admin_client, monkeypatch, case, name, params, actions, method
+):
+    from rest_framework.pagination import PageNumberPagination
+
+    # Маршруты без чтения проверяем DELETE (удаление категорий и жанров)
+    # или методами с телом из BODIES
+    if method is None:
+        method = 'get' if 'get' in actions else 'delete'
+    runs = {}
+    for prefix, size, page_size in (SMALL, LARGE):
+        data = build(prefix, size)
+        monkeypatch.setattr(PageNumberPagination, 'page_size', page_size)
+        url = get_url(name, params, data)
+        kwargs = {}
+        if name in BODIES:
+            kwargs = {'data': BODIES[name][method](data), 'format': 'json'}
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(admin_client, method)(url, **kwargs)
+            if response.streaming:
+                b''.join(response.streaming_content)
+        assert response.status_code < 300, (url, response.status_code)
+        runs[prefix] = [
+            normalize(query['sql']) for query in context.captured_queries
+        ]
+
+    assert len(runs['small']) == len(runs['large']), (
+        f'Количество запросов {case} растёт с объёмом данных: '
+        f'{len(runs["small"])} -> {len(runs["large"])}'
+    )
+    assert runs['small'] == runs['large']
+    check_snapshot(case, runs['large'])
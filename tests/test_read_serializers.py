@@ -0,0 +1,72 @@
+import pytest
+
+
+def render(data):
+    from rest_framework.renderers import JSONRenderer
+
+    return JSONRenderer().render(data)
+
+
+@pytest.mark.django_db
+class TestValuesSerializers:
+
+    def test_titles_match_model_serializer(self, make_catalog):
+        from api.serializers.read_serializers import TitleValuesSerializer
+        from api.serializers.review_serializers import TitleReadSerializer
+        from reviews.models import Title
+
+        titles = make_catalog(titles=4, reviews=2, genres=3)
+        Title.objects.filter(pk=titles[0].pk).update(
+            category=None, description=None, rating=None
+        )
+        Title.objects.filter(pk=titles[1].pk).update(name='Имя " "')
+        titles[2].genre.clear()
+        queryset = Title.objects.order_by('name', 'id')
+
+        expected = TitleReadSerializer(queryset, many=True).data
+        rows = list(queryset.values(*TitleValuesSerializer.get_values()))
+        assert render(TitleValuesSerializer(rows).data) == render(expected)
+
+    def test_reviews_and_comments_match_model_serializer(
+        self, make_catalog
+    ):
+        from api.serializers.read_serializers import (
+            CommentValuesSerializer, ReviewValuesSerializer,
+        )
+        from api.serializers.review_serializers import (
+            CommentSerializer, ReviewSerializer,
+        )
+        from reviews.models import Comment, Review
+
+        title = make_catalog(titles=1, reviews=3)[0]
+        reviews = Review.objects.filter(title=title)
+        Comment.objects.bulk_create(
+            Comment(review=review, author=review.author, text='Текст')
+            for review in reviews
+        )
+        comments = Comment.objects.all()
+
+        assert render(
+            ReviewValuesSerializer(
+                list(reviews.values(*ReviewValuesSerializer.get_values()))
+            ).data
+        ) == render(ReviewSerializer(reviews, many=True).data)
+        assert render(
+            CommentValuesSerializer(
+                list(comments.values(*CommentValuesSerializer.get_values()))
+            ).data
+        ) == render(CommentSerializer(comments, many=True).data)
+
+    def test_api_list_matches_model_serializer(
+        self, api_client, make_catalog
+    ):
+        from api.serializers.review_serializers import ReviewSerializer
+        from reviews.models import Review
+
+        title = make_catalog(titles=1, reviews=3)[0]
+        reviews = Review.objects.filter(title=title).order_by('-pub_date')
+
+        response = api_client.get(f'/api/v1/titles/{title.id}/reviews/')
+        assert response.json()['results'] == ReviewSerializer(
+            reviews, many=True
+        ).data
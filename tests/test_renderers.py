@@ -0,0 +1,49 @@
+import datetime as dt
+import io
+import uuid
+from decimal import Decimal
+
+import pytest
+
+
+@pytest.fixture
+def renderers():
+    from api.renderers import ORJSONRenderer
+    from rest_framework.renderers import JSONRenderer
+
+    return JSONRenderer(), ORJSONRenderer()
+
+
+@pytest.mark.parametrize('data', [
+    {'name': 'Произведение', 'year': 2000, 'rating': None},
+    [{'id': 1, 'genre': []}, {'id': 2, 'score': 1.5}],
+    {'text': 'строка\u2028с разделителем\u2029'},
+    {'pub_date': dt.datetime(2024, 1, 2, 3, 4, 5, 678901)},
+    {'day': dt.date(2024, 1, 2), 'price': Decimal('1.10')},
+    {'id': uuid.UUID(int=1), 1: 'ключ-число'},
+])
+def test_renderer_output_is_identical(renderers, data):
+    default, fast = renderers
+
+    assert fast.render(data) == default.render(data)
+
+
+def test_renderer_indent_falls_back(renderers):
+    default, fast = renderers
+    data = {'name': 'Произведение'}
+
+    media_type = 'application/json; indent=4'
+    assert fast.render(data, media_type) == default.render(data, media_type)
+    assert fast.render(None) == b''
+
+
+def test_parser():
+    from api.renderers import ORJSONParser
+    from rest_framework.exceptions import ParseError
+
+    parser = ORJSONParser()
+    stream = io.BytesIO('{"text": "Текст", "score": 5}'.encode())
+
+    assert parser.parse(stream) == {'text': 'Текст', 'score': 5}
+    with pytest.raises(ParseError):
+        parser.parse(io.BytesIO(b'{"text": '))
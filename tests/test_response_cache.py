@@ -0,0 +1,119 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.mark.django_db
+class TestResponseCache:
+
+    def test_anonymous_list_is_cached(self, api_client, make_catalog):
+        from api import response_cache
+
+        make_catalog(titles=3)
+        first = api_client.get('/api/v1/titles/?year=2000')
+        with CaptureQueriesContext(connection) as context:
+            second = api_client.get('/api/v1/titles/?year=2000')
+
+        assert first['X-Cache'] == 'MISS'
+        assert second['X-Cache'] == 'HIT'
+        assert second.json() == first.json()
+        assert len(context.captured_queries) == 0
+        assert response_cache.get_stats() == {'hits': 1, 'misses': 1}
+
+    def test_key_covers_query_params(self, api_client, make_catalog):
+        make_catalog(titles=6)
+        api_client.get('/api/v1/titles/')
+        response = api_client.get('/api/v1/titles/?page=2')
+
+        assert response['X-Cache'] == 'MISS'
+        assert len(response.json()['results']) == 1
+
+    def test_review_invalidates_title(
+        self, api_client, make_catalog, django_capture_on_commit_callbacks
+    ):
+        from reviews.models import Review
+
+        title, other = make_catalog(titles=2, reviews=2)
+        url = f'/api/v1/titles/{title.id}/'
+        other_url = f'/api/v1/titles/{other.id}/'
+        api_client.get(url)
+        api_client.get(other_url)
+        with django_capture_on_commit_callbacks(execute=True):
+            review = Review.objects.filter(title=title).first()
+            review.score = 10
+            review.save()
+
+        response = api_client.get(url)
+        assert response['X-Cache'] == 'MISS'
+        assert response.json()['rating'] == 7
+        assert api_client.get(other_url)['X-Cache'] == 'HIT'
+
+    @pytest.mark.parametrize('event', ['import', 'rebuild'])
+    def test_bulk_events_bump_catalog_only(
+        self, api_client, make_catalog, monkeypatch, event,
+        django_capture_on_commit_callbacks,
+    ):
+        from api import response_cache
+        from django.core.management import call_command
+        from reviews.signals import data_imported
+
+        title = make_catalog(titles=2, reviews=1)[0]
+        urls = [
+            '/api/v1/titles/',
+            f'/api/v1/titles/{title.id}/',
+            f'/api/v1/titles/{title.id}/stats/',
+            f'/api/v1/titles/{title.id}/reviews/',
+        ]
+        etags = [api_client.get(url)['ETag'] for url in urls]
+
+        bumped = []
+        bump_versions = response_cache.bump_versions
+        monkeypatch.setattr(
+            response_cache, 'bump_versions',
+            lambda *namespaces: (
+                bumped.append(namespaces), bump_versions(*namespaces)
+            ),
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            if event == 'import':
+                data_imported.send(sender=None, models=['review'])
+            else:
+                call_command('rebuild_ratings')
+        assert bumped == [(response_cache.CATALOG,)]
+        for url, etag in zip(urls, etags):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == 200, url
+
+    def test_genre_invalidates_titles(
+        self, api_client, make_catalog, django_capture_on_commit_callbacks
+    ):
+        from reviews.models import Genre
+
+        title = make_catalog(titles=1, genres=1)[0]
+        api_client.get('/api/v1/genres/')
+        api_client.get(f'/api/v1/titles/{title.id}/')
+        with django_capture_on_commit_callbacks(execute=True):
+            genre = Genre.objects.get()
+            genre.name = 'Другой'
+            genre.save()
+
+        assert api_client.get('/api/v1/genres/')['X-Cache'] == 'MISS'
+        response = api_client.get(f'/api/v1/titles/{title.id}/')
+        assert response['X-Cache'] == 'MISS'
+        assert response.json()['genre'][0]['name'] == 'Другой'
+
+    def test_authenticated_not_cached(self, api_client, make_catalog):
+        from users.models import User
+
+        make_catalog(titles=1)
+        api_client.force_authenticate(User.objects.first())
+        api_client.get('/api/v1/titles/')
+
+        assert not api_client.get('/api/v1/titles/').has_header('X-Cache')
+
+    def test_disabled(self, api_client, make_catalog, settings):
+        settings.RESPONSE_CACHE_ENABLED = False
+        make_catalog(titles=1)
+        api_client.get('/api/v1/categories/')
+
+        assert not api_client.get('/api/v1/categories/').has_header('X-Cache')
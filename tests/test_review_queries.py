@@ -0,0 +1,54 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.mark.django_db
+class TestReviewReadQueries:
+
+    def get(self, api_client, url):
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(url)
+        return response, context.captured_queries
+
+    @pytest.mark.parametrize('reviews', [2, 12])
+    def test_reviews_list(self, api_client, make_catalog, reviews):
+        title = make_catalog(titles=1, reviews=reviews)[0]
+        response, queries = self.get(
+            api_client, f'/api/v1/titles/{title.id}/reviews/'
+        )
+
+        assert response.status_code == 200
+        assert response.json()['count'] == reviews
+        # Проверка произведения, COUNT и страница с авторами.
+        assert len(queries) == 3
+        assert 'reviews_title' not in queries[-1]['sql']
+
+    @pytest.mark.parametrize('comments', [2, 12])
+    def test_comments_list(self, api_client, make_catalog, comments):
+        from reviews.models import Comment, Review
+
+        title = make_catalog(titles=1, reviews=comments)[0]
+        review = Review.objects.filter(title=title).first()
+        Comment.objects.bulk_create(
+            Comment(review=review, author=other.author, text='Текст')
+            for other in Review.objects.filter(title=title)
+        )
+        response, queries = self.get(
+            api_client,
+            f'/api/v1/titles/{title.id}/reviews/{review.id}/comments/',
+        )
+
+        assert response.status_code == 200
+        assert response.json()['count'] == comments
+        assert len(queries) == 3
+
+    def test_missing_parent(self, api_client, make_catalog):
+        title = make_catalog(titles=1, reviews=1)[0]
+
+        response, _ = self.get(api_client, '/api/v1/titles/0/reviews/')
+        assert response.status_code == 404
+        response, _ = self.get(
+            api_client, f'/api/v1/titles/{title.id}/reviews/0/comments/'
+        )
+        assert response.status_code == 404
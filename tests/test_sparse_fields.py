@@ -0,0 +1,104 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.mark.django_db
+class TestSparseFields:
+
+    def get(self, api_client, url):
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(url)
+        assert response.status_code == 200, response.content
+        return response.json(), context.captured_queries
+
+    def test_fields_limit_response_and_select(self, api_client, make_catalog):
+        make_catalog(titles=3)
+        data, queries = self.get(
+            api_client, '/api/v1/titles/?fields=rating,name,id'
+        )
+
+        assert [list(item) for item in data['results']] == [
+            ['id', 'name', 'rating']
+        ] * 3, 'Поля выводятся в порядке TitleReadSerializer'
+        sql = ' '.join(query['sql'] for query in queries)
+        assert 'description' not in sql
+        assert 'reviews_category' not in sql
+        assert 'reviews_genre' not in sql
+
+    def test_retrieve_with_fields(self, api_client, make_catalog):
+        title = make_catalog(titles=1)[0]
+        data, queries = self.get(
+            api_client, f'/api/v1/titles/{title.id}/?fields=id,genre'
+        )
+
+        assert list(data) == ['id', 'genre']
+        assert len(data['genre']) == 2
+        assert not any('description' in q['sql'] for q in queries)
+
+    @pytest.mark.parametrize('titles', [2, 5])
+    def test_expand_reviews_is_batched(
+        self, api_client, make_catalog, titles
+    ):
+        make_catalog(titles=titles, reviews=4)
+        data, queries = self.get(
+            api_client, '/api/v1/titles/?expand=reviews'
+        )
+
+        assert len(queries) == 4, 'COUNT, страница, жанры и отзывы'
+        for item in data['results']:
+            assert len(item['reviews']) == 3
+            assert set(item['reviews'][0]) == {
+                'id', 'text', 'author', 'score', 'pub_date'
+            }
+
+    def test_expand_matches_on_list_and_retrieve(
+        self, api_client, make_catalog
+    ):
+        from reviews.models import Comment, Review
+
+        title = make_catalog(titles=1, reviews=2)[0]
+        review = Review.objects.filter(title=title).first()
+        comment = Comment.objects.create(
+            review=review, author=review.author, text='Комментарий'
+        )
+        url = f'/api/v1/titles/{title.id}/reviews/'
+
+        listed, _ = self.get(api_client, f'{url}?expand=comments')
+        detail, _ = self.get(
+            api_client, f'{url}{review.id}/?expand=comments'
+        )
+        expanded = next(
+            item for item in listed['results'] if item['id'] == review.id
+        )
+        assert expanded == detail
+        assert [item['id'] for item in detail['comments']] == [comment.id]
+
+        comment_url = f'{url}{review.id}/comments/{comment.id}/'
+        data, _ = self.get(api_client, f'{comment_url}?expand=review')
+        assert data['review']['id'] == review.id
+
+    def test_unknown_field(self, api_client, make_catalog):
+        make_catalog(titles=1)
+
+        response = api_client.get('/api/v1/titles/?fields=id,password')
+        assert response.status_code == 400
+        assert 'fields' in response.json()
+
+    def test_expand_comments_invalidated_by_new_comment(
+        self, api_client, make_catalog, django_capture_on_commit_callbacks
+    ):
+        from reviews.models import Comment, Review
+
+        title = make_catalog(titles=1, reviews=1)[0]
+        review = Review.objects.get(title=title)
+        url = f'/api/v1/titles/{title.id}/reviews/?expand=comments'
+        first = api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Comment.objects.create(
+                review=review, author=review.author, text='Комментарий'
+            )
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        assert response.status_code == 200
+        assert len(response.json()['results'][0]['comments']) == 1
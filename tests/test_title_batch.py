@@ -0,0 +1,64 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.mark.django_db
+class TestTitleBatch:
+    url = '/api/v1/titles/batch/'
+
+    def get(self, api_client, query):
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(f'{self.url}?{query}')
+        return response, context.captured_queries
+
+    @pytest.mark.parametrize('titles', [2, 10])
+    def test_constant_queries(self, api_client, make_catalog, titles):
+        ids = [title.id for title in make_catalog(titles=titles)]
+        response, queries = self.get(
+            api_client, f'ids={",".join(map(str, reversed(ids)))}'
+        )
+
+        assert response.status_code == 200
+        assert len(queries) == 2, 'Произведения с категорией и жанры'
+        data = response.json()
+        assert [item['id'] for item in data['results']] == ids[::-1]
+        assert data['missing'] == []
+
+    def test_matches_retrieve_and_reports_missing(
+        self, api_client, make_catalog
+    ):
+        title = make_catalog(titles=1)[0]
+        detail = api_client.get(f'/api/v1/titles/{title.id}/').json()
+
+        response, _ = self.get(api_client, f'ids={title.id},0,{title.id}')
+        assert response.json() == {'results': [detail], 'missing': [0]}
+
+    def test_reuses_title_cache(self, api_client, make_catalog, settings):
+        settings.RESPONSE_CACHE_ENABLED = True
+        first, second = make_catalog(titles=2)
+        api_client.get(f'/api/v1/titles/{first.id}/?fields=id,name')
+
+        response, queries = self.get(
+            api_client, f'ids={first.id}&fields=id,name'
+        )
+        assert response.json()['results'] == [
+            {'id': first.id, 'name': first.name}
+        ]
+        assert queries == [], 'Ответ взят из кеша произведения'
+
+        self.get(api_client, f'fields=id,name&ids={second.id}')
+        response = api_client.get(
+            f'/api/v1/titles/{second.id}/?fields=id,name'
+        )
+        assert response['X-Cache'] == 'HIT'
+
+    @pytest.mark.parametrize('query', ['', 'ids=1,a', 'ids=' + ','.join(
+        map(str, range(1, 202))
+    )])
+    def test_invalid_ids(self, api_client, make_catalog, query):
+        make_catalog(titles=1)
+
+        response, _ = self.get(api_client, query)
+        assert response.status_code == 400
+        assert 'ids' in response.json()
@@ -0,0 +1,162 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.fixture
+def admin_client(api_client):
+    from users.models import User
+
+    admin = User.objects.create(
+        email='admin@yamdb.fake', username='admin', role=User.Role.ADMIN
+    )
+    api_client.force_authenticate(admin)
+    return api_client
+
+
+@pytest.fixture
+def taxonomy(db):
+    from reviews.models import Category, Genre
+
+    Category.objects.create(name='Фильм', slug='movie')
+    Genre.objects.bulk_create(
+        Genre(name=f'Жанр {i}', slug=f'genre-{i}') for i in range(3)
+    )
+
+
+def item(i, **fields):
+    return {
+        'name': f'Произведение {i}',
+        'year': 2000,
+        'category': 'movie',
+        'genre': ['genre-0', 'genre-1'],
+        **fields,
+    }
+
+
+@pytest.mark.django_db
+class TestTitleBulk:
+    url = '/api/v1/titles/bulk/'
+
+    def send(self, client, method, items):
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(client, method)(
+                self.url, items, format='json'
+            )
+        return response, context.captured_queries
+
+    @pytest.mark.parametrize('size', [2, 20])
+    def test_create_constant_queries(self, admin_client, taxonomy, size):
+        from reviews.models import GenreTitle, Title
+
+        response, queries = self.send(
+            admin_client, 'post', [item(i) for i in range(size)]
+        )
+
+        assert response.status_code == 201, response.json()
+        assert Title.objects.count() == size
+        assert GenreTitle.objects.count() == size * 2
+        writes = [
+            q['sql'] for q in queries
+            if q['sql'].startswith(('INSERT', 'UPDATE', 'DELETE'))
+            and 'reviews_title_fts' not in q['sql']
+        ]
+        assert len(writes) == 3, (
+            'Вставка произведений, связей и записей журнала изменений'
+        )
+        assert len(queries) <= 9
+
+    def test_errors_do_not_abort_batch(self, admin_client, taxonomy):
+        from reviews.models import Title
+
+        response, _ = self.send(admin_client, 'post', [
+            item(0),
+            item(1, category='unknown'),
+            item(2, genre=['genre-0', 'unknown'], year=3000),
+            item(3, id=100),
+        ])
+
+        assert response.status_code == 207
+        results = response.json()['results']
+        assert [result['status'] for result in results] == [
+            201, 400, 400, 201
+        ]
+        assert set(results[2]['errors']) == {'genre', 'year'}
+        assert results[3]['data']['id'] != 100
+        assert results[0]['data'] == {
+            'id': results[0]['data']['id'],
+            'name': 'Произведение 0',
+            'year': 2000,
+            'description': None,
+            'category': 'movie',
+            'genre': ['genre-0', 'genre-1'],
+        }
+        assert Title.objects.count() == 2
+
+    def test_upsert(
+        self, admin_client, taxonomy, django_capture_on_commit_callbacks
+    ):
+        from reviews.models import Title
+
+        response, _ = self.send(admin_client, 'post', [item(0), item(1)])
+        first, second = (r['data']['id'] for r in response.json()['results'])
+        cached = admin_client.get(f'/api/v1/titles/{first}/')
+        assert cached.json()['genre'][0]['slug'] == 'genre-0'
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response, _ = self.send(admin_client, 'put', [
+                item(0, id=first, name='Новое', genre=['genre-2']),
+                item(2),
+                item(1, id=0),
+                item(1, id=first),
+            ])
+
+        assert [r['status'] for r in response.json()['results']] == [
+            200, 201, 400, 400
+        ]
+        title = Title.objects.get(pk=first)
+        assert title.name == 'Новое'
+        assert [genre.slug for genre in title.genre.all()] == ['genre-2']
+        assert Title.objects.get(pk=second).genre.count() == 2
+        detail = admin_client.get(
+            f'/api/v1/titles/{first}/',
+            HTTP_IF_NONE_MATCH=cached['ETag'],
+        )
+        assert detail.status_code == 200
+        assert detail.json()['name'] == 'Новое'
+        search = admin_client.get('/api/v1/titles/?search=Новое')
+        assert [t['id'] for t in search.json()['results']] == [first]
+
+    def test_update_constant_queries(
+        self, admin_client, taxonomy, django_assert_num_queries
+    ):
+        from reviews.models import GenreTitle
+
+        response, _ = self.send(
+            admin_client, 'post', [item(i) for i in range(10)]
+        )
+        ids = [result['data']['id'] for result in response.json()['results']]
+
+        def items(size):
+            return [
+                item(i, id=ids[i], genre=['genre-2']) for i in range(size)
+            ]
+
+        response, queries = self.send(admin_client, 'put', items(2))
+        assert response.status_code == 200, response.json()
+        with django_assert_num_queries(len(queries)):
+            response = admin_client.put(self.url, items(10), format='json')
+        assert response.status_code == 200, response.json()
+        assert GenreTitle.objects.filter(title_id__in=ids).count() == 10
+
+    def test_invalid_payload(self, admin_client, taxonomy):
+        response, _ = self.send(admin_client, 'post', {'name': 'x'})
+        assert response.status_code == 400
+        response, _ = self.send(admin_client, 'post', [item(0)] * 1001)
+        assert response.status_code == 400
+
+    def test_admin_only(self, taxonomy):
+        from rest_framework.test import APIClient
+
+        response = APIClient().post(self.url, [item(0)], format='json')
+        assert response.status_code == 401
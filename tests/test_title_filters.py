@@ -0,0 +1,56 @@
+import pytest
+
+
+@pytest.mark.django_db
+class TestTitleFilter:
+
+    def ids(self, api_client, query):
+        response = api_client.get(f'/api/v1/titles/?{query}')
+        assert response.status_code == 200
+        return sorted(item['id'] for item in response.json()['results'])
+
+    @pytest.fixture
+    def titles(self, make_catalog):
+        from reviews.models import Category, Genre, GenreTitle
+
+        first, second, third = make_catalog(titles=3, reviews=1, genres=0)
+        book = Category.objects.create(name='Книга', slug='book')
+        drama = Genre.objects.create(name='Драма', slug='drama')
+        comedy = Genre.objects.create(name='Комедия', slug='comedy')
+        GenreTitle.objects.bulk_create([
+            GenreTitle(title=first, genre=drama),
+            GenreTitle(title=first, genre=comedy),
+            GenreTitle(title=second, genre=comedy),
+        ])
+        third.category = book
+        third.save()
+        return first, second, third
+
+    def test_exact_genre(self, api_client, titles):
+        first, second, _ = titles
+
+        assert self.ids(api_client, 'genre=drama') == [first.id]
+        assert self.ids(api_client, 'genre=dram') == []
+
+    def test_multiple_genres_without_duplicates(self, api_client, titles):
+        first, second, _ = titles
+
+        assert self.ids(api_client, 'genre=drama,comedy') == [
+            first.id, second.id
+        ]
+
+    def test_category(self, api_client, titles):
+        first, second, third = titles
+
+        assert self.ids(api_client, 'category=book') == [third.id]
+        assert self.ids(api_client, 'category=book,movie') == [
+            first.id, second.id, third.id
+        ]
+
+    def test_substring_match(self, api_client, titles):
+        first, second, third = titles
+
+        assert self.ids(api_client, 'genre=ram&match=contains') == [first.id]
+        assert self.ids(api_client, 'category=oo&match=contains') == [
+            third.id
+        ]
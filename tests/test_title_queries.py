@@ -0,0 +1,58 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def fetched_rows(queries):
+    """Количество строк, которые вернули перехваченные SELECT-запросы."""
+    rows = 0
+    with connection.cursor() as cursor:
+        for query in queries:
+            if query['sql'].lstrip().upper().startswith('SELECT'):
+                cursor.execute(query['sql'])
+                rows += len(cursor.fetchall())
+    return rows
+
+
+@pytest.mark.django_db
+class TestTitleReadQueries:
+
+    def get(self, api_client, url):
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(url)
+        assert response.status_code == 200
+        return context.captured_queries
+
+    @pytest.mark.parametrize('reviews', [1, 20])
+    def test_list_does_not_fetch_reviews(
+        self, api_client, make_catalog, reviews
+    ):
+        make_catalog(titles=12, reviews=reviews, genres=2)
+        queries = self.get(api_client, '/api/v1/titles/')
+
+        assert len(queries) == 3, (
+            'Список произведений: COUNT, страница и жанры'
+        )
+        assert not any('reviews_review' in q['sql'] for q in queries), (
+            'Отзывы не должны загружаться при выводе произведений'
+        )
+        # 1 строка COUNT + 5 произведений + по 2 жанра на произведение.
+        assert fetched_rows(queries) == 1 + 5 + 5 * 2
+
+    def test_list_selects_only_serialized_columns(
+        self, api_client, make_catalog
+    ):
+        make_catalog(titles=6)
+        queries = self.get(api_client, '/api/v1/titles/')
+        page_sql = queries[1]['sql']
+
+        assert 'rating_sum' not in page_sql
+        assert 'reviews_count' not in page_sql
+
+    def test_retrieve(self, api_client, make_catalog):
+        title = make_catalog(titles=2, reviews=20)[0]
+        queries = self.get(api_client, f'/api/v1/titles/{title.id}/')
+
+        assert len(queries) == 2
+        assert not any('reviews_review' in q['sql'] for q in queries)
+        assert fetched_rows(queries) == 1 + 2
@@ -0,0 +1,98 @@
+import pytest
+
+
+def counters(title):
+    from reviews.models import Title
+
+    return tuple(
+        Title.objects.filter(pk=title.pk).values_list(
+            'rating_sum', 'reviews_count', 'rating'
+        ).get()
+    )
+
+
+@pytest.mark.django_db
+class TestTitleRating:
+
+    @pytest.fixture
+    def titles(self, make_catalog):
+        return make_catalog(titles=2, reviews=2)
+
+    @pytest.fixture
+    def author(self, db):
+        from users.models import User
+
+        return User.objects.create(email='new@yamdb.fake', username='new')
+
+    def test_create_update_delete(self, titles, author):
+        from reviews.models import Review
+
+        title = titles[0]
+        assert counters(title) == (10, 2, 5)
+        review = Review.objects.create(
+            title=title, author=author, text='Т', score=8
+        )
+        assert counters(title) == (18, 3, 6)
+
+        review.score = 2
+        review.save()
+        assert counters(title) == (12, 3, 4)
+        review.text = 'Без изменения оценки'
+        review.save()
+        assert counters(title) == (12, 3, 4)
+
+        review.delete()
+        assert counters(title) == (10, 2, 5)
+        assert counters(titles[1]) == (10, 2, 5)
+
+    def test_queryset_delete(self, titles):
+        from reviews.models import Review
+
+        title = titles[0]
+        Review.objects.filter(title=title).first().delete()
+        assert counters(title) == (5, 1, 5)
+        Review.objects.filter(title=title).delete()
+        assert counters(title) == (0, 0, None)
+
+    def test_move_to_another_title(self, titles, author):
+        from reviews.models import Review
+
+        first, second = titles
+        review = Review.objects.create(
+            title=first, author=author, text='Т', score=9
+        )
+        review.title = second
+        review.score = 3
+        review.save()
+        assert counters(first) == (10, 2, 5)
+        # Рейтинг — целая часть среднего
+        assert counters(second) == (13, 3, 4)
+
+    def test_deferred_score(self, titles):
+        from reviews.models import Review
+
+        title = titles[0]
+        review = Review.objects.only('id', 'text').filter(title=title)[0]
+        review.score = 9
+        review.save()
+        assert counters(title) == (14, 2, 7)
+
+        review = Review.objects.only('id').get(pk=review.pk)
+        review.delete()
+        assert counters(title) == (5, 1, 5)
+
+    def test_rebuild_repairs_counters(self, titles):
+        from django.core.management import call_command
+        from reviews.models import Title
+
+        first, second = titles
+        Title.objects.filter(pk=first.pk).update(
+            rating_sum=100, reviews_count=1, rating=100, score_5=0
+        )
+        Title.objects.filter(pk=second.pk).update(
+            rating_sum=0, reviews_count=0, rating=None
+        )
+        call_command('rebuild_ratings')
+        assert counters(first) == (10, 2, 5)
+        assert counters(second) == (10, 2, 5)
+        assert Title.objects.get(pk=first.pk).score_5 == 2
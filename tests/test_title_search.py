@@ -0,0 +1,60 @@
+import pytest
+
+
+@pytest.mark.django_db
+class TestTitleSearch:
+
+    def search(self, api_client, query):
+        response = api_client.get('/api/v1/titles/', {'search': query})
+        assert response.status_code == 200
+        return [item['name'] for item in response.json()['results']]
+
+    @pytest.fixture
+    def titles(self, make_catalog):
+        first, second, third = make_catalog(titles=3, reviews=1)
+        first.name = 'Крёстный отец'
+        first.description = 'Сага о семье'
+        first.save()
+        second.name = 'Семья'
+        second.save()
+        third.description = 'Не про отца'
+        third.save()
+        return first, second, third
+
+    def test_name_ranked_above_description(self, api_client, titles):
+        assert self.search(api_client, 'семь') == ['Семья', 'Крёстный отец']
+
+    def test_prefix_and_case(self, api_client, titles):
+        assert self.search(api_client, 'КРЁСТН') == ['Крёстный отец']
+
+    def test_index_follows_updates(self, api_client, titles):
+        first, _, _ = titles
+        first.name = 'Другое'
+        first.save()
+        assert self.search(api_client, 'крёстный') == []
+        first.delete()
+        assert self.search(api_client, 'сага') == []
+
+    def test_special_characters(self, api_client, titles):
+        assert self.search(api_client, '"отец" OR (') == []
+
+
+def test_ts_query():
+    from reviews.search import ts_query
+
+    assert ts_query('Крёстный  от') == "'Крёстный' & 'от':*"
+    assert ts_query("д'Артаньян \\") == "'д''Артаньян' & '\\\\':*"
+    assert ts_query(' ') == ''
+
+
+@pytest.mark.postgres
+@pytest.mark.django_db
+@pytest.mark.parametrize('query', ['"отец" OR (', "д'Арт", '\\ : & !'])
+def test_ts_query_parses(query):
+    from django.db import connection
+    from reviews.search import SEARCH_CONFIG, ts_query
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT to_tsquery(%s, %s)', [SEARCH_CONFIG, ts_query(query)]
+        )
@@ -0,0 +1,111 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def stats(client, title):
+    response = client.get(f'/api/v1/titles/{title.id}/stats/')
+    assert response.status_code == 200, response.content
+    data = response.json()
+    histogram = {item['score']: item['count'] for item in data['histogram']}
+    return data, histogram
+
+
+@pytest.mark.django_db
+class TestTitleStats:
+
+    @pytest.fixture
+    def title(self, make_catalog):
+        return make_catalog(titles=1, reviews=3)[0]
+
+    def test_stats(self, api_client, title):
+        from reviews.models import Review
+
+        review = Review.objects.filter(title=title).first()
+        review.score = 10
+        review.save()
+        with CaptureQueriesContext(connection) as context:
+            data, histogram = stats(api_client, title)
+        assert len(context.captured_queries) == 1
+        assert 'reviews_review' not in context.captured_queries[0]['sql']
+        assert histogram == {
+            score: {5: 2, 10: 1}.get(score, 0) for score in range(1, 11)
+        }
+        assert data['count'] == 3
+        assert data['mean'] == pytest.approx(6.67)
+        assert data['median'] == 5
+
+    def test_review_changes(
+        self, api_client, title, django_capture_on_commit_callbacks
+    ):
+        from reviews.models import Review
+        from users.models import User
+
+        author = User.objects.create(email='new@yamdb.fake', username='new')
+        with django_capture_on_commit_callbacks(execute=True):
+            review = Review.objects.create(
+                title=title, author=author, text='Т', score=8
+            )
+        data, histogram = stats(api_client, title)
+        assert (histogram[5], histogram[8]) == (3, 1)
+        assert data['median'] == 5
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Review.objects.filter(title=title, score=5).first().delete()
+        data, histogram = stats(api_client, title)
+        assert (histogram[5], histogram[8]) == (2, 1)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            review.score = 2
+            review.save()
+        data, histogram = stats(api_client, title)
+        assert (histogram[2], histogram[5], histogram[8]) == (1, 2, 0)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Review.objects.filter(title=title, score=5).first().delete()
+        data, _ = stats(api_client, title)
+        assert (data['count'], data['mean'], data['median']) == (2, 3.5, 3.5)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Review.objects.filter(title=title).delete()
+        data, histogram = stats(api_client, title)
+        assert data == {
+            'count': 0,
+            'mean': None,
+            'median': None,
+            'histogram': [
+                {'score': score, 'count': 0} for score in range(1, 11)
+            ],
+        }
+
+    def test_rebuild_repairs_drift(
+        self, api_client, title, django_capture_on_commit_callbacks
+    ):
+        from django.core.management import call_command
+        from reviews.models import Title
+
+        Title.objects.filter(pk=title.pk).update(score_1=7, score_5=0)
+        _, histogram = stats(api_client, title)
+        assert (histogram[1], histogram[5]) == (7, 0)
+        with django_capture_on_commit_callbacks(execute=True):
+            call_command('rebuild_ratings')
+        _, histogram = stats(api_client, title)
+        assert (histogram[1], histogram[5]) == (0, 3)
+
+    def test_import_invalidates_stats(
+        self, api_client, title, django_capture_on_commit_callbacks
+    ):
+        from reviews.models import Title
+        from reviews.signals import data_imported
+
+        stats(api_client, title)
+        Title.objects.filter(pk=title.pk).update(score_5=0, score_9=3)
+        with django_capture_on_commit_callbacks(execute=True):
+            data_imported.send(sender=None, models=['review'])
+        _, histogram = stats(api_client, title)
+        assert (histogram[5], histogram[9]) == (0, 3)
+
+    @pytest.mark.parametrize('pk', ['0', 'abc'])
+    def test_not_found(self, api_client, title, pk):
+        response = api_client.get(f'/api/v1/titles/{pk}/stats/')
+        assert response.status_code == 404
@@ -0,0 +1,140 @@
+from datetime import timedelta
+
+import pytest
+
+
+def title_ids(client, url):
+    response = client.get(url)
+    assert response.status_code == 200, response.content
+    return [item['id'] for item in response.json()['results']]
+
+
+@pytest.mark.django_db
+class TestTrending:
+    url = '/api/v1/titles/'
+
+    @pytest.fixture
+    def titles(self, make_catalog, settings):
+        from django.utils import timezone
+        from reviews.models import Review
+        from reviews.trending import update_trending
+
+        settings.TRENDING_HALF_LIFE = 24 * 60 * 60
+        titles = make_catalog(titles=3, reviews=1)
+        # Первое произведение обсуждали два дня назад, второе — сейчас,
+        # у третьего отзывы старше окна полного пересчёта
+        Review.objects.filter(title=titles[0]).update(
+            pub_date=timezone.now() - timedelta(days=2)
+        )
+        Review.objects.filter(title=titles[2]).update(
+            pub_date=timezone.now() - timedelta(days=30)
+        )
+        update_trending(full=True)
+        return titles
+
+    def test_full_rebuild(self, titles):
+        from reviews.models import Title
+
+        scores = dict(Title.objects.values_list('id', 'trending_score'))
+        first, second, third = titles
+        assert scores[second.id] == pytest.approx(0.5, rel=1e-3)
+        assert scores[first.id] == pytest.approx(0.125, rel=1e-3)
+        assert scores[third.id] == 0
+
+    def test_incremental_update(self, titles, settings):
+        from django.core.cache import cache
+        from django.utils import timezone
+        from reviews.models import Review, Title
+        from reviews.trending import STATE_KEY, update_trending
+        from users.models import User
+
+        first, second, third = titles
+        cursor, _ = cache.get(STATE_KEY)
+        # С прошлого пересчёта прошёл период полураспада
+        cache.set(
+            STATE_KEY, (cursor, timezone.now() - timedelta(days=1)), None
+        )
+        author = User.objects.create(email='new@yamdb.fake', username='new')
+        Review.objects.create(title=third, author=author, text='Т', score=10)
+        assert update_trending() == 1
+
+        scores = dict(Title.objects.values_list('id', 'trending_score'))
+        assert scores[second.id] == pytest.approx(0.25, rel=1e-3)
+        assert scores[first.id] == pytest.approx(0.0625, rel=1e-3)
+        assert scores[third.id] == pytest.approx(1, rel=1e-3)
+        # Повторный запуск не учитывает отзывы второй раз
+        assert update_trending() == 0
+        assert Title.objects.get(pk=third.pk).trending_score == (
+            pytest.approx(1, rel=1e-3)
+        )
+
+    def test_commit_lag(self, titles, settings):
+        from django.utils import timezone
+        from reviews.models import Review, Title
+        from reviews.trending import update_trending
+        from users.models import User
+
+        settings.COMMIT_LAG = 30
+        third = titles[2]
+        author = User.objects.create(email='new@yamdb.fake', username='new')
+        review = Review.objects.create(
+            title=third, author=author, text='Т', score=10
+        )
+        # Свежий отзыв не учитывается ни частичным, ни полным пересчётом
+        assert update_trending() == 0
+        update_trending(full=True)
+        assert Title.objects.get(pk=third.pk).trending_score == 0
+
+        Review.objects.filter(pk=review.pk).update(
+            pub_date=timezone.now() - timedelta(seconds=60)
+        )
+        assert update_trending() == 1
+        assert update_trending() == 0
+        assert Title.objects.get(pk=third.pk).trending_score == (
+            pytest.approx(1, rel=1e-3)
+        )
+
+    def test_ordering(self, api_client, titles, monkeypatch):
+        from api.pagination import PageNumberOrCursorPagination
+
+        first, second, third = titles
+        trending = [second.id, first.id, third.id]
+        assert title_ids(api_client, f'{self.url}?ordering=trending') == (
+            trending
+        )
+        assert title_ids(api_client, f'{self.url}?ordering=name') == [
+            first.id, second.id, third.id
+        ]
+
+        monkeypatch.setattr(PageNumberOrCursorPagination, 'page_size', 2)
+        url = f'{self.url}?ordering=trending&pagination=cursor'
+        response = api_client.get(url)
+        page = response.json()
+        assert [item['id'] for item in page['results']] == trending[:2]
+        response = api_client.get(page['next'])
+        assert [item['id'] for item in response.json()['results']] == (
+            trending[2:]
+        )
+
+    def test_invalid_ordering(self, api_client, titles):
+        response = api_client.get(f'{self.url}?ordering=rating')
+        assert response.status_code == 400
+        assert 'ordering' in response.json()
+
+    def test_update_invalidates_cached_list(
+        self, api_client, titles, django_capture_on_commit_callbacks
+    ):
+        from reviews.models import Review
+        from reviews.trending import update_trending
+        from users.models import User
+
+        first, second, third = titles
+        url = f'{self.url}?ordering=trending'
+        assert title_ids(api_client, url)[0] == second.id
+        author = User.objects.create(email='new@yamdb.fake', username='new')
+        Review.objects.bulk_create(
+            [Review(title=third, author=author, text='Т', score=10)]
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            update_trending()
+        assert title_ids(api_client, url)[0] == third.id